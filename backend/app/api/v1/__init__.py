@@ -1,9 +1,12 @@
 from fastapi import APIRouter
-from .endpoints import games
+from .endpoints import admin, games
 
 api_router = APIRouter()
 
 # Include game endpoints
 api_router.include_router(games.router, prefix="/games", tags=["games"])
 
+# Include admin endpoints (disabled unless ADMIN_TOKEN is set)
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+
 __all__ = ["api_router"]
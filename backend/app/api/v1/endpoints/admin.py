@@ -0,0 +1,48 @@
+"""
+Admin endpoints (enabled by setting ADMIN_TOKEN)
+"""
+import secrets
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.services.async_game_service import async_game_service
+from app.services.data_loader import data_loader_service
+from app.services.data_reloader import data_reloader
+
+
+def verificar_admin(x_admin_token: Optional[str] = Header(None, alias="X-Admin-Token")) -> None:
+    """Reject requests without the configured admin token"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Recurso no encontrado")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Token de administración inválido")
+
+
+router = APIRouter(dependencies=[Depends(verificar_admin)])
+
+
+@router.post("/reload")
+async def recargar_datos() -> Dict[str, Any]:
+    """
+    Reload the scraped data without downtime
+    
+    Builds a new snapshot of every dataset and index and swaps it in; the
+    requests in flight keep the previous one. Under serve.py every worker
+    reloads (the response returns before they finish: 202).
+    """
+    if data_reloader.recargar_todos():
+        return JSONResponse(
+            status_code=202,
+            content={'mensaje': 'Recarga enviada a todos los workers', 'version': data_loader_service.data_version}
+        )
+    
+    try:
+        return await async_game_service.run(data_reloader.recargar, "admin")
+    except (OSError, ValueError) as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"No se pudieron recargar los datos (se mantiene la versión {data_loader_service.data_version}): {e}"
+        )
@@ -1,96 +1,237 @@
 """
 Game endpoints
 """
-from fastapi import APIRouter, HTTPException, Path
-from typing import Dict, Any
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request
+from fastapi.responses import Response
+from typing import Callable, Dict, Any, Literal, Optional
 from app.schemas.game import (
     GameResponse,
     EquipoDelDiaGame,
     GameGuess,
     GameResult,
+    GameGuessBatch,
+    GameBatchResult,
     PosicionSeleccionada,
     JugadorSeleccionado
 )
+from app.core.config import settings
+from app.services.async_game_service import async_game_service
+from app.services.data_loader import data_loader_service
 from app.services.game_generator import game_generator_service
+from app.services.response_cache import CachedResponse, ResponseCache, acepta_gzip, cache_control, etag_coincide
+from app.utils import FastJSONResponse
 
 
-router = APIRouter()
+# Dynamic results (GameResult, hints...) are encoded with orjson when available
+router = APIRouter(default_response_class=FastJSONResponse)
 
+# Each browser tab sends its own id, so every player keeps a separate progress.
+# Requests without it share a single progress per game (previous behaviour).
+SessionId = Header(None, alias="X-Session-Id", description="Player session id")
+# With GAME_STATE_MODE=token the progress is not kept on the server: each
+# response carries a signed 'progress_token' that the client sends back here.
+ProgressToken = Header(None, alias="X-Progress-Token", description="Signed game progress (token mode)")
+# Opt-in salted answer hashes, so the client can reject some guesses locally
+# (not secret: see app/services/answer_verification.py)
+Verificacion = Query(False, description="Include the client-side verification bundle")
 
-@router.get("/equipo-nacional", response_model=GameResponse)
-async def get_equipo_nacional():
-    """Get Equipo Nacional del Día"""
-    try:
-        game = game_generator_service.generate_equipo_nacional()
+# Built daily game payloads, keyed by game_id and data version
+_response_cache = ResponseCache()
+
+
+def _responder(request: Request, cached: CachedResponse, compartida: bool, vary: Optional[str] = None) -> Response:
+    """Serve pre-encoded bytes (gzipped if accepted) with their ETag, or 304 if the client already has them"""
+    gzip = cached.body_gzip is not None and acepta_gzip(request.headers.get("accept-encoding"))
+    headers = {
+        "ETag": cached.etag_gzip if gzip else cached.etag,
+        "Cache-Control": cache_control(compartida),
+        "Vary": ", ".join(filter(None, ["Accept-Encoding", vary]))
+    }
+    
+    if etag_coincide(request.headers.get("if-none-match"), cached):
+        return Response(status_code=304, headers=headers)
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(cached.body_gzip, media_type="application/json", headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
+
+
+async def _equipo_response(
+    request: Request,
+    game_type: str,
+    generar: Callable[[Optional[str]], EquipoDelDiaGame],
+    mensaje: str,
+    session_id: Optional[str],
+    verificacion: bool
+) -> Response:
+    """Equipo del Día response (same payload for every player of the day)"""
+    game_id = game_generator_service.get_game_id_del_dia(game_type)
+    cached = await async_game_service.run_locked(
+        game_id, session_id, _equipo_payload, game_type, game_id, generar, mensaje, session_id, verificacion
+    )
+    # With server-side progress the GET resets it, so clients must always revalidate
+    return _responder(request, cached, compartida=game_generator_service.progreso_en_cliente)
+
+
+def _equipo_payload(
+    game_type: str,
+    game_id: str,
+    generar: Callable[[Optional[str]], EquipoDelDiaGame],
+    mensaje: str,
+    session_id: Optional[str],
+    verificacion: bool
+) -> CachedResponse:
+    # Loading the game starts over, also when the client revalidates a cached copy
+    game_generator_service.reiniciar_partida(game_id, session_id)
+    
+    def construir() -> GameResponse:
+        game = generar(session_id)
         return GameResponse(
             success=True,
-            game_type="equipo_nacional",
+            game_type=game_type,
             game_id=game.game_id,
             fecha=game.fecha,
             data=game.model_dump(),
-            mensaje="Adivina los jugadores que pasaron por estos clubes"
+            mensaje=mensaje,
+            verificacion=game_generator_service.get_verificacion(game.game_id) if verificacion else None
+        )
+    
+    return _response_cache.get((game_id, data_loader_service.data_version, verificacion), construir)
+
+
+@router.get("/equipo-nacional", response_model=GameResponse)
+async def get_equipo_nacional(
+    request: Request,
+    session_id: Optional[str] = SessionId,
+    verificacion: bool = Verificacion
+):
+    """Get Equipo Nacional del Día"""
+    try:
+        return await _equipo_response(
+            request,
+            "equipo_nacional",
+            game_generator_service.generate_equipo_nacional,
+            "Adivina los jugadores que pasaron por estos clubes",
+            session_id,
+            verificacion
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/equipo-europeo", response_model=GameResponse)
-async def get_equipo_europeo():
+async def get_equipo_europeo(
+    request: Request,
+    session_id: Optional[str] = SessionId,
+    verificacion: bool = Verificacion
+):
     """Get Equipo Europeo del Día"""
     try:
-        game = game_generator_service.generate_equipo_europeo()
-        return GameResponse(
-            success=True,
-            game_type="equipo_europeo",
-            game_id=game.game_id,
-            fecha=game.fecha,
-            data=game.model_dump(),
-            mensaje="Adivina los jugadores que pasaron por clubes europeos"
+        return await _equipo_response(
+            request,
+            "equipo_europeo",
+            game_generator_service.generate_equipo_europeo,
+            "Adivina los jugadores que pasaron por clubes europeos",
+            session_id,
+            verificacion
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/equipo-latinoamericano", response_model=GameResponse)
-async def get_equipo_latinoamericano():
+async def get_equipo_latinoamericano(
+    request: Request,
+    session_id: Optional[str] = SessionId,
+    verificacion: bool = Verificacion
+):
     """Get Equipo Latinoamericano del Día"""
     try:
-        game = game_generator_service.generate_equipo_latinoamericano()
-        return GameResponse(
-            success=True,
-            game_type="equipo_latinoamericano",
-            game_id=game.game_id,
-            fecha=game.fecha,
-            data=game.model_dump(),
-            mensaje="Adivina los jugadores que pasaron por clubes latinoamericanos"
+        return await _equipo_response(
+            request,
+            "equipo_latinoamericano",
+            game_generator_service.generate_equipo_latinoamericano,
+            "Adivina los jugadores que pasaron por clubes latinoamericanos",
+            session_id,
+            verificacion
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _game_result(result: Dict[str, Any]) -> GameResult:
+    """GameResult of an Equipo guess verified by the generator"""
+    return GameResult(
+        correcto=result.get('correcto', False),
+        mensaje=result.get('mensaje', ''),
+        jugador_revelado=result.get('jugador_revelado'),
+        posicion_asignada=result.get('posicion_asignada'),
+        nuevo_club=result.get('nuevo_club'),
+        game_over=result.get('game_over', False),
+        victoria=result.get('victoria', False),
+        requiere_seleccion=result.get('requiere_seleccion', False),
+        posiciones_disponibles=result.get('posiciones_disponibles'),
+        requiere_seleccion_jugador=result.get('requiere_seleccion_jugador', False),
+        jugadores_disponibles=result.get('jugadores_disponibles'),
+        progress_token=result.get('progress_token')
+    )
+
+
 @router.post("/verify", response_model=GameResult)
-async def verify_guess(guess: GameGuess):
+async def verify_guess(
+    guess: GameGuess,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """Verify a player guess - Nueva mecánica"""
     try:
         # Use new verification logic
-        result = game_generator_service.verificar_respuesta(
+        result = await async_game_service.run_locked(
+            guess.game_id,
+            session_id,
+            game_generator_service.verificar_respuesta,
             guess.game_id,
             guess.game_type,
-            guess.respuesta
+            guess.respuesta,
+            session_id,
+            progress_token
         )
         
-        return GameResult(
-            correcto=result.get('correcto', False),
-            mensaje=result.get('mensaje', ''),
-            jugador_revelado=result.get('jugador_revelado'),
-            posicion_asignada=result.get('posicion_asignada'),
-            nuevo_club=result.get('nuevo_club'),
-            game_over=result.get('game_over', False),
-            victoria=result.get('victoria', False),
-            requiere_seleccion=result.get('requiere_seleccion', False),
-            posiciones_disponibles=result.get('posiciones_disponibles'),
-            requiere_seleccion_jugador=result.get('requiere_seleccion_jugador', False),
-            jugadores_disponibles=result.get('jugadores_disponibles')
+        return _game_result(result)
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/verify-batch", response_model=GameBatchResult)
+async def verify_guess_batch(
+    guesses: GameGuessBatch,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
+    """
+    Verify several queued guesses in one request
+    
+    The guesses are applied in order under one lock, exactly as the same
+    /verify calls would. It stops after a guess that ends the game or needs
+    a position / player selection: `resultados` then has fewer items than
+    `respuestas`, and the rest must be sent again after the selection.
+    """
+    try:
+        result = await async_game_service.run_locked(
+            guesses.game_id,
+            session_id,
+            game_generator_service.verificar_respuestas,
+            guesses.game_id,
+            guesses.game_type,
+            guesses.respuestas,
+            session_id,
+            progress_token
+        )
+        
+        return GameBatchResult(
+            resultados=[_game_result(r) for r in result['resultados']],
+            progress_token=result.get('progress_token')
         )
     
     except Exception as e:
@@ -98,7 +239,11 @@ async def verify_guess(guess: GameGuess):
 
 
 @router.get("/pista/{game_id}")
-async def obtener_pista(game_id: str):
+async def obtener_pista(
+    game_id: str,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """
     Get hints for the current club
     
@@ -108,14 +253,18 @@ async def obtener_pista(game_id: str):
     - Otro club donde jugó (si disponible)
     """
     try:
-        result = game_generator_service.obtener_pista(game_id)
+        result = await async_game_service.run(game_generator_service.obtener_pista, game_id, session_id, progress_token)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/revelar-jugador/{game_id}")
-async def revelar_jugador_aleatorio(game_id: str):
+async def revelar_jugador_aleatorio(
+    game_id: str,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """
     Reveal a random player that meets club and position requirements.
     Only available in EASY mode.
@@ -127,7 +276,9 @@ async def revelar_jugador_aleatorio(game_id: str):
     - Estado del juego
     """
     try:
-        result = game_generator_service.revelar_jugador_aleatorio(game_id)
+        result = await async_game_service.run_locked(
+            game_id, session_id, game_generator_service.revelar_jugador_aleatorio, game_id, session_id, progress_token
+        )
         
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -140,12 +291,21 @@ async def revelar_jugador_aleatorio(game_id: str):
 
 
 @router.post("/confirmar-posicion", response_model=GameResult)
-async def confirmar_posicion(seleccion: PosicionSeleccionada):
+async def confirmar_posicion(
+    seleccion: PosicionSeleccionada,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """Confirm position choice for a multi-position player"""
     try:
-        result = game_generator_service.confirmar_posicion(
+        result = await async_game_service.run_locked(
+            seleccion.game_id,
+            session_id,
+            game_generator_service.confirmar_posicion,
             seleccion.game_id,
-            seleccion.posicion
+            seleccion.posicion,
+            session_id,
+            progress_token
         )
         
         return GameResult(
@@ -155,7 +315,8 @@ async def confirmar_posicion(seleccion: PosicionSeleccionada):
             posicion_asignada=result.get('posicion_asignada'),
             nuevo_club=result.get('nuevo_club'),
             game_over=result.get('game_over', False),
-            victoria=result.get('victoria', False)
+            victoria=result.get('victoria', False),
+            progress_token=result.get('progress_token')
         )
     
     except Exception as e:
@@ -163,12 +324,21 @@ async def confirmar_posicion(seleccion: PosicionSeleccionada):
 
 
 @router.post("/confirmar-jugador", response_model=GameResult)
-async def confirmar_jugador(seleccion: JugadorSeleccionado):
+async def confirmar_jugador(
+    seleccion: JugadorSeleccionado,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """Confirm player choice when multiple players match the same surname"""
     try:
-        result = game_generator_service.confirmar_jugador(
+        result = await async_game_service.run_locked(
             seleccion.game_id,
-            seleccion.nombre_jugador
+            session_id,
+            game_generator_service.confirmar_jugador,
+            seleccion.game_id,
+            seleccion.nombre_jugador,
+            session_id,
+            progress_token
         )
         
         return GameResult(
@@ -180,7 +350,8 @@ async def confirmar_jugador(seleccion: JugadorSeleccionado):
             game_over=result.get('game_over', False),
             victoria=result.get('victoria', False),
             requiere_seleccion=result.get('requiere_seleccion', False),
-            posiciones_disponibles=result.get('posiciones_disponibles')
+            posiciones_disponibles=result.get('posiciones_disponibles'),
+            progress_token=result.get('progress_token')
         )
     
     except Exception as e:
@@ -188,11 +359,43 @@ async def confirmar_jugador(seleccion: JugadorSeleccionado):
 
 
 @router.get("/clasico-del-dia")
-async def get_clasico_del_dia():
+async def get_clasico_del_dia(
+    request: Request,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken,
+    verificacion: bool = Verificacion
+):
     """Get Clásico del Día (Rosario Central vs Newell's Old Boys)"""
     try:
-        game = game_generator_service.generate_clasico_del_dia()
-        return {
+        game_id = game_generator_service.get_game_id_del_dia("clasico")
+        cached = await async_game_service.run_locked(
+            game_id, session_id, _clasico_payload, game_id, session_id, progress_token, verificacion
+        )
+        # Only the game without progress is the same for everyone: with a token
+        # (or server-side progress) the payload shows that player's progress
+        return _responder(
+            request,
+            cached,
+            compartida=game_generator_service.progreso_en_cliente and not progress_token,
+            vary="X-Progress-Token" if game_generator_service.progreso_en_cliente else "X-Session-Id"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _clasico_payload(
+    game_id: str,
+    session_id: Optional[str],
+    progress_token: Optional[str],
+    verificacion: bool
+) -> CachedResponse:
+    # The payload shows the player's progress: one cached variant per revealed
+    # state (hint and reveal counters aren't part of it)
+    progreso = game_generator_service.get_progreso(game_id, session_id, progress_token)
+    
+    def construir() -> Dict[str, Any]:
+        game = game_generator_service.generate_clasico_del_dia(session_id, progress_token)
+        response = {
             "success": True,
             "game_type": "clasico",
             "game_id": game["game_id"],
@@ -200,20 +403,35 @@ async def get_clasico_del_dia():
             "data": game,
             "mensaje": "Adivina la formación del clásico rosarino"
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        if verificacion:
+            response["verificacion"] = game_generator_service.get_verificacion(game["game_id"])
+        return response
+    
+    return _response_cache.get(
+        (game_id, data_loader_service.data_version, verificacion, game_generator_service.estado_vista_clasico(progreso)),
+        construir
+    )
 
 
 @router.post("/clasico/verify")
-async def verify_clasico_answer(guess: GameGuess):
+async def verify_clasico_answer(
+    guess: GameGuess,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """
     Verify a player/coach/referee answer for the classic match game
     Uses same format as other games
     """
     try:
-        result = game_generator_service.verificar_respuesta_clasico(
+        result = await async_game_service.run_locked(
+            guess.game_id,
+            session_id,
+            game_generator_service.verificar_respuesta_clasico,
             game_id=guess.game_id,
-            respuesta=guess.respuesta
+            respuesta=guess.respuesta,
+            session_id=session_id,
+            progress_token=progress_token
         )
         return GameResult(
             correcto=result.get('correcto', False),
@@ -223,33 +441,46 @@ async def verify_clasico_answer(guess: GameGuess):
             entrenador_revelado=result.get('entrenador_revelado'),
             arbitro_revelado=result.get('arbitro_revelado'),
             game_over=result.get('game_over', False),
-            victoria=result.get('victoria', False)
+            victoria=result.get('victoria', False),
+            progress_token=result.get('progress_token')
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/clasico/pista/{game_id}")
-async def get_clasico_hint(game_id: str = Path(..., description="Game ID")):
+async def get_clasico_hint(
+    game_id: str = Path(..., description="Game ID"),
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """
     Get a hint for a non-revealed player in the classic match
     Returns first letter of surname and another club where they played
     """
     try:
-        hint = game_generator_service.obtener_pista_clasico(game_id)
+        hint = await async_game_service.run_locked(
+            game_id, session_id, game_generator_service.obtener_pista_clasico, game_id, session_id, progress_token
+        )
         return hint
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/clasico/revelar-jugador/{game_id}")
-async def revelar_jugador_clasico(game_id: str):
+async def revelar_jugador_clasico(
+    game_id: str,
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """
     Reveal a random non-revealed player in the classic match
     Only available in EASY mode
     """
     try:
-        result = game_generator_service.revelar_jugador_clasico(game_id)
+        result = await async_game_service.run_locked(
+            game_id, session_id, game_generator_service.revelar_jugador_clasico, game_id, session_id, progress_token
+        )
         
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -262,7 +493,11 @@ async def revelar_jugador_clasico(game_id: str):
 
 
 @router.post("/clasico/verificar-resultado")
-async def verificar_resultado_clasico(request: Dict[str, Any]):
+async def verificar_resultado_clasico(
+    request: Dict[str, Any],
+    session_id: Optional[str] = SessionId,
+    progress_token: Optional[str] = ProgressToken
+):
     """
     Verify the match result
     
@@ -276,15 +511,49 @@ async def verificar_resultado_clasico(request: Dict[str, Any]):
         if not game_id or not resultado:
             raise HTTPException(status_code=400, detail="game_id and resultado are required")
         
-        result = game_generator_service.verificar_resultado_clasico(game_id, resultado)
+        result = await async_game_service.run_locked(
+            game_id, session_id, game_generator_service.verificar_resultado_clasico, game_id, resultado, session_id, progress_token
+        )
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/autocomplete")
+async def autocompletar(
+    q: str = Query("", max_length=100, description="What the user typed so far"),
+    limite: Optional[int] = Query(None, ge=1, description="Maximum names (at most AUTOCOMPLETE_MAX_RESULTS)"),
+    alcance: Optional[Literal["jugadores", "jugadores_rc", "entrenadores", "arbitros"]] = Query(
+        None, description="Only these names (jugadores_rc: played in Rosario Central); all by default"
+    )
+):
+    """
+    Typeahead suggestions: player, coach and referee names with a word
+    starting with `q` (accents and case ignored)
+    """
+    limite = min(limite or settings.AUTOCOMPLETE_MAX_RESULTS, settings.AUTOCOMPLETE_MAX_RESULTS)
+    datos = data_loader_service.snapshot
+    
+    if datos.autocompletado_cargado:
+        # Binary search over prebuilt arrays: cheaper inline than a thread hop
+        candidatos = datos.autocompletar(q, limite, alcance)
+    else:
+        # First use without preload: builds the indexes
+        candidatos = await async_game_service.run(datos.autocompletar, q, limite, alcance)
+    
+    return {
+        "query": q,
+        "resultados": [candidato._asdict() for candidato in candidatos]
+    }
+
+
 @router.get("/list", response_model=Dict[str, Any])
-async def list_available_games():
+async def list_available_games(request: Request):
     """List all available games"""
+    return _responder(request, _response_cache.get("list", _games_list), compartida=True)
+
+
+def _games_list() -> Dict[str, Any]:
     return {
         "games": [
             {
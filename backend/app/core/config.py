@@ -42,11 +42,43 @@ class Settings(BaseSettings):
     CLASICOS_GAME_FILE: str = str(Path(__file__).parent.parent.parent.parent / "scraping" / "data" / "output" / "rosario_central_clasicos_game.json")
     CLUBES_FILE: str = str(Path(__file__).parent.parent / "data" / "clubes.json")
     FORMACIONES_FILE: str = str(Path(__file__).parent.parent / "data" / "formaciones.json")
+    CLUB_ALIASES_FILE: str = str(Path(__file__).parent.parent / "data" / "club_aliases.json")
+    
+    # Compiled data bundle (build with: python build_bundle.py)
+    DATA_BUNDLE_FILE: str = str(Path(__file__).parent.parent.parent.parent / "scraping" / "data" / "output" / "futfactos_data.bundle")
+    USE_DATA_BUNDLE: bool = True  # Falls back to JSON if the bundle is missing or stale
+    DATA_WATCH_SECONDS: int = 30  # Poll DATA_DIR and hot-reload changed data (0 disables it)
     
     # Game settings
     GAME_REFRESH_HOUR: int = 0  # Midnight
     TIMEZONE: str = "America/Argentina/Buenos_Aires"
-    
+    GAME_SCHEDULER_ENABLED: bool = True  # Pre-generate the daily games in background
+    GAME_PREGENERATE_MINUTES: int = 5  # Build next day's games this long before the rollover
+    GAME_WORKER_THREADS: int = 8  # Thread pool running the game engine off the event loop
+    AUTOCOMPLETE_MAX_RESULTS: int = 10  # Cap of /games/autocomplete (the 'limite' param can only lower it)
+    VERIFY_BATCH_MAX_GUESSES: int = 20  # Guesses accepted by one /games/verify-batch request
+
+    # Per-session game progress (see app/services/game_state_store.py)
+    GAME_STATE_BACKEND: str = "memory"  # "memory" or "sqlite"
+    GAME_STATE_DB_FILE: str = str(Path(__file__).parent.parent.parent / "game_state.db")
+    GAME_STATE_TTL_SECONDS: int = 36 * 3600  # Idle sessions expire after a day and a half
+    GAME_STATE_MAX_SESSIONS: int = 50000
+    GAME_STATE_MAX_BYTES: int = 64 * 1024 * 1024  # Memory backend only
+
+    # Stateless mode: progress travels in a signed token (see app/services/progress_token.py)
+    GAME_STATE_MODE: str = "server"  # "server" (session store) or "token"
+    GAME_TOKEN_SECRET: str = ""  # Must be the same on every worker/node
+    GAME_TOKEN_ALGORITHM: str = "HS256"
+    GAME_TOKEN_ALLOW_RANDOM_SECRET: bool = False  # Dev only: random per-process key when the secret is empty
+
+    # Admin endpoints (/api/v1/admin), enabled when set (header X-Admin-Token)
+    ADMIN_TOKEN: str = ""
+
+    # Production server (see app/core/prefork.py)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 2  # Forked after loading the data, so they share it
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,299 @@
+"""
+Pre-fork production server
+
+The master process loads and indexes every dataset and builds today's games,
+freezes the garbage collector and only then forks the uvicorn workers. The
+workers inherit all of it through copy-on-write pages instead of each one
+loading its own copy, so N workers cost little more memory than one.
+
+gc.freeze() moves everything allocated so far to a permanent generation:
+the collections of the workers never touch those objects' headers, so
+their pages are not copied (CPython docs: gc.disable() early in the master,
+gc.freeze() right before fork(), gc.enable() in the workers).
+
+Usage:
+    python serve.py                 # SERVER_WORKERS workers
+    python serve.py --workers 4
+
+The master restarts workers that die, stops them on SIGTERM / SIGINT,
+forwards SIGHUP (data reload) to them and logs the memory of every worker
+shortly after startup and on SIGUSR1.
+USS (pages only that worker has) is what each extra worker costs.
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+import uvicorn
+
+from app.core.config import settings
+
+
+# Seconds after startup before the first memory report
+REPORTE_DEMORA = 10
+
+# A worker that dies this soon after starting is failing, not crashing: stop
+REINICIO_MINIMO = 5
+
+
+def memoria_proceso(pid: int) -> Optional[Dict[str, int]]:
+    """
+    Memory of a process in KiB, from /proc/<pid>/smaps_rollup (Linux)
+
+    Returns:
+        Dict with rss, pss and uss (private pages), or None if unavailable
+    """
+    campos: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", 'r') as f:
+            for linea in f:
+                nombre, _, valor = linea.partition(':')
+                partes = valor.split()
+                if len(partes) == 2 and partes[1] == 'kB':
+                    campos[nombre] = int(partes[0])
+    except OSError:
+        return None
+
+    return {
+        'rss': campos.get('Rss', 0),
+        'pss': campos.get('Pss', 0),
+        'uss': campos.get('Private_Clean', 0) + campos.get('Private_Dirty', 0)
+    }
+
+
+def _mib(kib: int) -> str:
+    return f"{kib / 1024:.1f} MiB"
+
+
+class PreforkServer:
+    """Master process: loads the data, forks and supervises the workers"""
+
+    def __init__(self, host: str, port: int, workers: int, log_level: str = "info"):
+        """
+        Args:
+            host: Address to listen on
+            port: Port to listen on
+            workers: Number of worker processes
+            log_level: uvicorn log level
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.log_level = log_level
+        self.app = None
+        self._socket: Optional[socket.socket] = None
+        # pid -> start time
+        self._procesos: Dict[int, float] = {}
+        self._parando = False
+        self._reportar = False
+        self._recargar = False
+
+    def run(self) -> int:
+        """Serve until SIGTERM / SIGINT; returns the exit code"""
+        self._advertir_configuracion()
+
+        # Bound before forking: every worker accepts on the same socket
+        self._socket = socket.create_server((self.host, self.port))
+        self._socket.set_inheritable(True)
+
+        self._precargar()
+
+        signal.signal(signal.SIGTERM, self._on_parar)
+        signal.signal(signal.SIGINT, self._on_parar)
+        signal.signal(signal.SIGUSR1, self._on_reportar)
+        signal.signal(signal.SIGHUP, self._on_recargar)
+
+        for _ in range(self.workers):
+            self._fork_worker()
+        print(f"✅ {self.workers} workers en http://{self.host}:{self.port} (master {os.getpid()})")
+
+        return self._supervisar()
+
+    def _advertir_configuracion(self) -> None:
+        if (
+            self.workers > 1
+            and settings.GAME_STATE_MODE.lower() != "token"
+            and settings.GAME_STATE_BACKEND.lower() == "memory"
+        ):
+            print(
+                "Warning: GAME_STATE_BACKEND=memory keeps each session's progress in one worker; "
+                "use GAME_STATE_BACKEND=sqlite or GAME_STATE_MODE=token with several workers"
+            )
+
+    def _precargar(self) -> None:
+        """Load everything the workers share, then freeze it"""
+        # No collections while loading: they would leave freed holes in
+        # the pages the workers are going to share
+        gc.disable()
+        inicio = time.perf_counter()
+
+        from app.main import app
+        from app.services.data_loader import data_loader_service
+        from app.services.game_generator import game_generator_service
+        from app.utils import DateUtils
+
+        data_loader_service.preload_all()
+        juegos = game_generator_service.pregenerar_juegos(DateUtils.fecha_juego())
+        # Each worker opens its own store connection after the fork
+        game_generator_service.cerrar_store()
+        self.app = app
+
+        gc.freeze()
+
+        memoria = memoria_proceso(os.getpid())
+        print(
+            f"📦 Datos cargados en {time.perf_counter() - inicio:.2f}s: {len(juegos)} juegos del día, "
+            f"{gc.get_freeze_count()} objetos congelados"
+            + (f", RSS {_mib(memoria['rss'])}" if memoria else "")
+        )
+
+        if threading.active_count() > 1:
+            print("Warning: threads started before fork() are not copied to the workers")
+
+    def _fork_worker(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # Worker: never returns to the master's code
+            codigo = 1
+            try:
+                codigo = self._worker()
+            except SystemExit as e:
+                codigo = e.code if isinstance(e.code, int) else 1
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                # os._exit skips the interpreter's cleanup, buffers included
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(codigo)
+
+        self._procesos[pid] = time.monotonic()
+
+    def _worker(self) -> int:
+        gc.enable()
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGUSR1):
+            signal.signal(sig, signal.SIG_DFL)
+        # Until the app's lifespan handles it (a reload must not kill the worker)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        from app.services.data_reloader import data_reloader
+        from app.services.game_generator import game_generator_service
+        game_generator_service.reabrir_store()
+        # Admin reloads go through the master, so every worker reloads
+        data_reloader.master_pid = os.getppid()
+
+        config = uvicorn.Config(self.app, log_level=self.log_level)
+        uvicorn.Server(config).run(sockets=[self._socket])
+        return 0
+
+    def _on_parar(self, signum, frame) -> None:
+        self._parando = True
+
+    def _on_reportar(self, signum, frame) -> None:
+        self._reportar = True
+
+    def _on_recargar(self, signum, frame) -> None:
+        self._recargar = True
+
+    def _supervisar(self) -> int:
+        codigo_salida = 0
+        reporte_en = time.monotonic() + REPORTE_DEMORA
+        detenidos = False
+
+        while self._procesos:
+            if self._parando and not detenidos:
+                # uvicorn shuts down gracefully on SIGTERM
+                for pid in self._procesos:
+                    self._senal(pid, signal.SIGTERM)
+                detenidos = True
+
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+
+            if pid:
+                inicio = self._procesos.pop(pid, None)
+                if inicio is None or self._parando:
+                    continue
+
+                codigo = os.waitstatus_to_exitcode(status)
+                print(f"Warning: Worker {pid} terminó (código {codigo})")
+                if time.monotonic() - inicio < REINICIO_MINIMO:
+                    print("Error: los workers fallan al iniciar, deteniendo el servidor")
+                    codigo_salida = 1
+                    self._parando = True
+                else:
+                    self._fork_worker()
+                continue
+
+            if self._recargar:
+                # Each worker rebuilds its own data (see data_reloader.py)
+                self._recargar = False
+                for pid in self._procesos:
+                    self._senal(pid, signal.SIGHUP)
+
+            if self._reportar or (reporte_en and time.monotonic() >= reporte_en):
+                self._reportar = False
+                reporte_en = 0
+                self.reportar_memoria()
+
+            time.sleep(0.2)
+
+        self._socket.close()
+        return codigo_salida
+
+    @staticmethod
+    def _senal(pid: int, sig: int) -> None:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def reportar_memoria(self) -> None:
+        """Log the memory of the master and of every worker"""
+        master = memoria_proceso(os.getpid())
+        if master is None:
+            print("Warning: memory report needs /proc/<pid>/smaps_rollup (Linux)")
+            return
+
+        print(f"💾 Master {os.getpid()}: RSS {_mib(master['rss'])}")
+        total_uss = 0
+        for pid in sorted(self._procesos):
+            memoria = memoria_proceso(pid)
+            if memoria is None:
+                continue
+            total_uss += memoria['uss']
+            print(
+                f"   Worker {pid}: USS {_mib(memoria['uss'])} "
+                f"(PSS {_mib(memoria['pss'])}, RSS {_mib(memoria['rss'])})"
+            )
+        print(f"   Total: {_mib(master['rss'] + total_uss)} (RSS del master + USS de los workers)")
+
+
+def main() -> int:
+    """Run the prefork server configured in settings (options override it)"""
+    parser = argparse.ArgumentParser(description="FutFactos API: prefork production server")
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        print("Warning: fork() is not available on this platform, serving with a single process")
+        uvicorn.run("app.main:app", host=args.host, port=args.port, log_level=args.log_level)
+        return 0
+
+    return PreforkServer(args.host, args.port, max(args.workers, 1), log_level=args.log_level).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
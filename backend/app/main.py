@@ -1,6 +1,8 @@
 """
 Main FastAPI application
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -9,6 +11,25 @@ from pathlib import Path
 
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.services.data_reloader import data_reloader
+from app.services.game_generator import game_generator_service
+from app.services.scheduler import DailyGameScheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the daily games scheduler and the data watcher with the app"""
+    scheduler = None
+    if settings.GAME_SCHEDULER_ENABLED:
+        scheduler = DailyGameScheduler(game_generator_service, settings.GAME_PREGENERATE_MINUTES)
+        scheduler.start()
+    data_reloader.start()
+    
+    yield
+    
+    await data_reloader.stop()
+    if scheduler:
+        await scheduler.stop()
 
 
 # Create FastAPI app
@@ -17,7 +38,8 @@ app = FastAPI(
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -5,6 +5,8 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from app.core.config import settings
+
 
 class ClubHistoria(BaseModel):
     """Club history item"""
@@ -67,6 +69,7 @@ class GameResponse(BaseModel):
     fecha: str
     data: Dict[str, Any]
     mensaje: Optional[str] = None
+    verificacion: Optional[Dict[str, Any]] = None  # Hashes de respuestas (?verificacion=true)
 
 
 class GameGuess(BaseModel):
@@ -95,6 +98,20 @@ class GameResult(BaseModel):
     entrenador_revelado: Optional[Dict[str, Any]] = None  # Para clásico
     arbitro_revelado: Optional[Dict[str, Any]] = None  # Para clásico
     resultado_revelado: Optional[Dict[str, Any]] = None  # Para clásico
+    progress_token: Optional[str] = None  # Progreso firmado (GAME_STATE_MODE=token)
+
+
+class GameGuessBatch(BaseModel):
+    """Guesses queued by the client, in the order they were made"""
+    game_id: str
+    game_type: str
+    respuestas: List[str] = Field(..., min_length=1, max_length=settings.VERIFY_BATCH_MAX_GUESSES)
+
+
+class GameBatchResult(BaseModel):
+    """Results of a batch of guesses (only the ones applied, see /verify-batch)"""
+    resultados: List[GameResult]
+    progress_token: Optional[str] = None  # Progreso final firmado (GAME_STATE_MODE=token)
 
 
 class PosicionSeleccionada(BaseModel):
@@ -1,4 +1,4 @@
-from .data_loader import DataLoaderService
+from .data_loader import DataLoaderService, DataSnapshot
 from .game_generator import GameGeneratorService
 
-__all__ = ["DataLoaderService", "GameGeneratorService"]
+__all__ = ["DataLoaderService", "DataSnapshot", "GameGeneratorService"]
@@ -0,0 +1,126 @@
+"""
+Client-side answer verification bundles (opt-in with ?verificacion=true)
+
+The daily game endpoints can ship salted hashes of every accepted normalized
+answer. The client normalizes its guess like TextUtils.normalize_text,
+hashes it with the game's salt and looks it up:
+
+    hash = sha256(f"{sal}:{texto_normalizado}").hexdigest()[:HASH_HEX]
+
+The hashes don't hide the answers. The salt ships with them and the
+candidate names are public (/autocomplete), so anyone can hash every name
+and read the day's answers offline; hashing only keeps them from being read
+at a glance. Clients that ask for the bundle are trusted with the answers.
+
+What it saves is also limited: only an exact hit can be decided locally
+(an exact name that can't fill an empty position). A miss may be a typo
+the server corrects, so misses still go to the verify endpoints.
+"""
+import hashlib
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
+
+from app.services.indexes import Jugador, TecnicoIndexado
+
+
+HASH_HEX = 16  # 64 bits: no false positives in practice, smaller payload
+
+# Non-player answers
+REF_ENTRENADOR = "DT"
+REF_ARBITRO = "ARB"
+
+Ref = Union[int, str]
+
+
+def hash_respuesta(sal: str, texto_normalizado: str) -> str:
+    """Salted hash of a normalized answer (or club name)"""
+    return hashlib.sha256(f"{sal}:{texto_normalizado}".encode('utf-8')).hexdigest()[:HASH_HEX]
+
+
+def sal_del_juego(game_id: str, seed: int) -> str:
+    """
+    Salt of a game: same on every worker, different for every game and day
+
+    It is sent to the client with the hashes, so it keeps one day's hashes
+    from matching another's but is no secret.
+    """
+    return hashlib.sha256(f"verificacion:{game_id}:{seed}".encode('utf-8')).hexdigest()[:16]
+
+
+def _bundle(sal: str, **datos: Any) -> Dict[str, Any]:
+    return {'algoritmo': 'sha256', 'sal': sal, 'longitud': HASH_HEX, **datos}
+
+
+def build_verificacion_equipo(
+    sal: str,
+    clubes: Iterable[Tuple[str, str]],
+    jugadores_por_nombre: Mapping[str, Tuple[Jugador, ...]],
+    tecnicos_por_nombre: Mapping[str, Tuple[TecnicoIndexado, ...]]
+) -> Dict[str, Any]:
+    """
+    Verification bundle of an Equipo del Día game
+
+    Args:
+        sal: Game salt (see sal_del_juego)
+        clubes: (normalized club name, canonical club key) of every club of the game
+        jugadores_por_nombre: Player name index (DataSnapshot.get_jugadores_por_nombre)
+        tecnicos_por_nombre: Coach name index (DataSnapshot.get_tecnicos_por_nombre)
+
+    Returns:
+        Dict with:
+        - clubes: hash(club name) -> hash(answer) -> refs (player ids, or "DT")
+        - posiciones: player id -> valid game positions, so the client can
+          reject players that don't fit any empty position
+    """
+    clubes = list(clubes)
+    claves = {key for _, key in clubes}
+    respuestas: Dict[str, Dict[str, List[Ref]]] = {key: {} for key in claves}
+    posiciones: Dict[str, List[str]] = {}
+
+    for nombre, entries in jugadores_por_nombre.items():
+        h = hash_respuesta(sal, nombre)
+        for entry in entries:
+            if not entry.tiene_rc:
+                continue
+            for key in entry.clubes_norm & claves:
+                respuestas[key].setdefault(h, []).append(entry.id)
+                if str(entry.id) not in posiciones:
+                    posiciones[str(entry.id)] = sorted(entry.posiciones)
+
+    for nombre, entries in tecnicos_por_nombre.items():
+        h = hash_respuesta(sal, nombre)
+        dirigidos = claves & frozenset().union(*(e.clubes_norm for e in entries))
+        for key in dirigidos:
+            refs = respuestas[key].setdefault(h, [])
+            if REF_ENTRENADOR not in refs:
+                # The coach is checked before the players
+                refs.insert(0, REF_ENTRENADOR)
+
+    return _bundle(
+        sal,
+        clubes={hash_respuesta(sal, nombre): respuestas[key] for nombre, key in clubes},
+        posiciones=posiciones
+    )
+
+
+def build_verificacion_clasico(sal: str, internal: Mapping) -> Dict[str, Any]:
+    """
+    Verification bundle of a Clásico del Día game
+
+    Args:
+        sal: Game salt (see sal_del_juego)
+        internal: The game's '_internal' answers
+
+    Returns:
+        Dict with respuestas: hash(answer) -> refs (position indexes, "DT" or
+        "ARB"), in the order the server checks them
+    """
+    respuestas: Dict[str, List[Ref]] = {}
+
+    for texto, ref in (
+        (internal['entrenador_apellido_norm'], REF_ENTRENADOR),
+        (internal['arbitro_apellido_norm'], REF_ARBITRO),
+        *internal['jugadores_map'].items()
+    ):
+        respuestas.setdefault(hash_respuesta(sal, texto), []).append(ref)
+
+    return _bundle(sal, respuestas=respuestas)
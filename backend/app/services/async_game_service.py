@@ -0,0 +1,94 @@
+"""
+Async facade of GameGeneratorService for the API
+
+The game engine is synchronous (file loads, index scans, store I/O). Calling
+it straight from `async def` routes blocks the event loop and serializes
+every user, so the routes await it here instead: the work runs in a bounded
+thread pool, and the calls that update a player's progress hold that
+player's game lock, so concurrent requests of the same session can't lose
+each other's updates. The locks only reach this process: with several
+workers the store only saves progress that nobody changed since it was
+loaded (GameStateStore.replace), and the call that lost the race runs again.
+"""
+import asyncio
+import functools
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.services.game_generator import GameGeneratorService, game_generator_service
+from app.services.game_state_store import StaleStateError
+
+
+T = TypeVar("T")
+
+
+class AsyncGameService:
+    """Runs game engine calls in a thread pool, with per-game locking"""
+
+    # Runs of a call whose progress another worker keeps saving first
+    INTENTOS_PROGRESO = 5
+
+    def __init__(self, generator: GameGeneratorService, max_workers: int = 8, lock_stripes: int = 256):
+        """
+        Args:
+            generator: The synchronous game engine
+            max_workers: Threads of the pool (bounds the concurrent engine calls)
+            lock_stripes: Number of locks the (game_id, session) keys are spread over
+        """
+        self.generator = generator
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="game-engine")
+        # Striped locks: bounded memory whatever the number of sessions
+        self._locks = [threading.Lock() for _ in range(lock_stripes)]
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call in the pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def run_locked(
+        self,
+        game_id: str,
+        session_id: Optional[str],
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any
+    ) -> T:
+        """
+        Run a call that updates a player's progress in the pool, holding the
+        lock of that player's game (the lock is taken in the worker thread,
+        never on the event loop)
+
+        A worker process updating the same session concurrently isn't
+        covered by the lock: if it saves first, the call's save fails
+        (StaleStateError) and the call runs again on the new progress. Game
+        generation and payloads never hold a database lock. In token mode
+        the progress lives in the request, so there is nothing to lock.
+        """
+        if self.generator.progreso_en_cliente:
+            return await self.run(fn, *args, **kwargs)
+
+        lock = self._lock_for(game_id, session_id)
+
+        def locked() -> T:
+            with lock:
+                for _ in range(self.INTENTOS_PROGRESO - 1):
+                    try:
+                        return fn(*args, **kwargs)
+                    except StaleStateError:
+                        continue
+                return fn(*args, **kwargs)
+
+        return await self.run(locked)
+
+    def _lock_for(self, game_id: str, session_id: Optional[str]) -> threading.Lock:
+        # crc32, not hash(): same stripe for a key across runs, cheap to compute
+        clave = f"{game_id}:{session_id or ''}".encode("utf-8")
+        return self._locks[zlib.crc32(clave) % len(self._locks)]
+
+
+# Singleton instance
+async_game_service = AsyncGameService(game_generator_service, max_workers=settings.GAME_WORKER_THREADS)
@@ -0,0 +1,451 @@
+"""
+Compiled binary data bundle
+
+Packs every scraping output used by the API into a single versioned file
+that workers memory-map instead of parsing JSON on startup.
+
+Layout (little endian):
+
+    header      magic, format version, section count, checksum, root cell
+    sections    name -> (offset, length) table
+    STROFFS     uint32 offsets into STRDATA (string table, count + 1 items)
+    STRDATA     UTF-8 bytes of every distinct string
+    CELLS       fixed-width (tag, payload) records for array items
+    ENTRIES     fixed-width (key, tag, payload) records for object items
+    ARRAYS      fixed-width (first cell, count) records
+    OBJECTS     fixed-width (first entry, count) records
+    NUMBERS     float64 values for floats and ints that do not fit in 32 bits
+
+Values are decoded lazily through read-only Mapping/Sequence views, so
+opening a bundle only reads the header and the OS page cache is shared
+between every worker that maps the same file.
+
+Usage:
+    python build_bundle.py   # build from the configured JSON files
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+MAGIC = b"FFRCBNDL"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHH16sBxxxI")
+_SECTION = struct.Struct("<8sQQ")
+_U32 = struct.Struct("<I")
+_CELL = struct.Struct("<BxxxI")
+_ENTRY = struct.Struct("<IBxxxI")
+_SPAN = struct.Struct("<II")
+_NUMBER = struct.Struct("<d")
+
+_SECTION_NAMES = ("STROFFS", "STRDATA", "CELLS", "ENTRIES", "ARRAYS", "OBJECTS", "NUMBERS")
+
+# Cell tags
+TAG_NULL = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_NUMBER = 4
+TAG_STR = 5
+TAG_ARRAY = 6
+TAG_OBJECT = 7
+
+# Objects with more entries than this get a key -> slot table on first lookup
+_SLOT_TABLE_MIN = 8
+
+
+class BundleFormatError(ValueError):
+    """Raised when a file is not a bundle or uses an unsupported version"""
+
+
+# ========================
+# READER
+# ========================
+
+class BundleObject(Mapping):
+    """Read-only dict view over an object stored in a bundle"""
+
+    __slots__ = ("_bundle", "_first", "_count", "_slots")
+
+    def __init__(self, bundle: "DataBundle", first: int, count: int):
+        self._bundle = bundle
+        self._first = first
+        self._count = count
+        self._slots: Optional[Dict[str, int]] = None
+
+    def _entry(self, i: int) -> Tuple[int, int, int]:
+        return _ENTRY.unpack_from(self._bundle._entries, (self._first + i) * _ENTRY.size)
+
+    def _slot(self, key: str) -> int:
+        if self._count > _SLOT_TABLE_MIN:
+            if self._slots is None:
+                self._slots = {key_: i for i, key_ in enumerate(self)}
+            return self._slots.get(key, -1)
+
+        for i in range(self._count):
+            if self._bundle.string(self._entry(i)[0]) == key:
+                return i
+        return -1
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._slot(key) if isinstance(key, str) else -1
+        if i < 0:
+            raise KeyError(key)
+        _, tag, payload = self._entry(i)
+        return self._bundle._value(tag, payload)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._slot(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._bundle.string(self._entry(i)[0])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self):
+        bundle = self._bundle
+        for i in range(self._count):
+            key_sid, tag, payload = self._entry(i)
+            yield bundle.string(key_sid), bundle._value(tag, payload)
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    def __repr__(self) -> str:
+        return f"BundleObject({self._count} keys)"
+
+
+class BundleArray(Sequence):
+    """Read-only list view over an array stored in a bundle"""
+
+    __slots__ = ("_bundle", "_first", "_count")
+
+    def __init__(self, bundle: "DataBundle", first: int, count: int):
+        self._bundle = bundle
+        self._first = first
+        self._count = count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("bundle array index out of range")
+        tag, payload = _CELL.unpack_from(self._bundle._cells, (self._first + index) * _CELL.size)
+        return self._bundle._value(tag, payload)
+
+    def __iter__(self):
+        bundle = self._bundle
+        start = self._first * _CELL.size
+        end = start + self._count * _CELL.size
+        for tag, payload in _CELL.iter_unpack(bundle._cells[start:end]):
+            yield bundle._value(tag, payload)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"BundleArray({self._count} items)"
+
+
+class DataBundle:
+    """Memory-mapped, lazily decoded data bundle"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            # mmap refuses empty files, so check the size first
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise BundleFormatError(f"{self.path} is too small to be a data bundle")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, section_count, checksum, root_tag, root_payload = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            if magic != MAGIC:
+                raise BundleFormatError(f"{self.path} is not a data bundle")
+            raise BundleFormatError(
+                f"{self.path} uses bundle format v{version}, expected v{FORMAT_VERSION}"
+            )
+
+        view = memoryview(self._mmap)
+
+        sections: Dict[str, memoryview] = {}
+        for i in range(section_count):
+            name, offset, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            sections[name.rstrip(b"\0").decode("ascii")] = view[offset:offset + length]
+
+        self.version = version
+        self.checksum = checksum.hex()
+        self._str_offsets = sections["STROFFS"]
+        self._str_data = sections["STRDATA"]
+        self._cells = sections["CELLS"]
+        self._entries = sections["ENTRIES"]
+        self._arrays = sections["ARRAYS"]
+        self._objects = sections["OBJECTS"]
+        self._numbers = sections["NUMBERS"]
+        self._strings: List[Optional[str]] = [None] * (len(self._str_offsets) // _U32.size - 1)
+        self._root = self._value(root_tag, root_payload)
+
+    def string(self, sid: int) -> str:
+        """Decode (and cache) an entry of the string table"""
+        value = self._strings[sid]
+        if value is None:
+            start, end = struct.unpack_from("<II", self._str_offsets, sid * _U32.size)
+            value = sys.intern(str(self._str_data[start:end], "utf-8"))
+            self._strings[sid] = value
+        return value
+
+    def _value(self, tag: int, payload: int) -> Any:
+        if tag == TAG_STR:
+            return self.string(payload)
+        if tag == TAG_INT:
+            return payload - 0x100000000 if payload & 0x80000000 else payload
+        if tag == TAG_OBJECT:
+            return BundleObject(self, *_SPAN.unpack_from(self._objects, payload * _SPAN.size))
+        if tag == TAG_ARRAY:
+            return BundleArray(self, *_SPAN.unpack_from(self._arrays, payload * _SPAN.size))
+        if tag == TAG_NULL:
+            return None
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_NUMBER:
+            number = _NUMBER.unpack_from(self._numbers, payload * _NUMBER.size)[0]
+            return int(number) if number.is_integer() and abs(number) < 2 ** 53 else number
+        raise BundleFormatError(f"Unknown cell tag {tag}")
+
+    @property
+    def metadata(self) -> Mapping:
+        """Build metadata (format version, source files and their stats)"""
+        return self._root["metadata"]
+
+    def has_dataset(self, name: str) -> bool:
+        return name in self._root["datasets"]
+
+    def dataset(self, name: str) -> Any:
+        """Get a compiled dataset by name (e.g. 'jugadores')"""
+        return self._root["datasets"][name]
+
+    def is_stale(self, sources: Dict[str, Path]) -> bool:
+        """Check whether any source file changed since the bundle was built"""
+        recorded = self.metadata.get("sources", {})
+        for name, path in sources.items():
+            info = recorded.get(name)
+            path = Path(path)
+            if not path.exists():
+                if info is not None:
+                    return True
+                continue
+            if info is None:
+                return True
+            stat = path.stat()
+            if stat.st_size != info["size"] or int(stat.st_mtime) != info["mtime"]:
+                return True
+        return False
+
+    def close(self):
+        """Unmap the file (values read from this bundle become unusable)"""
+        # The section views must be released first or mmap.close() raises BufferError
+        for section in (
+            self._str_offsets, self._str_data, self._cells, self._entries,
+            self._arrays, self._objects, self._numbers
+        ):
+            section.release()
+        self._mmap.close()
+
+
+# ========================
+# WRITER
+# ========================
+
+class _BundleWriter:
+    """Flattens JSON-compatible values into the bundle record arrays"""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.cells = bytearray()
+        self.entries = bytearray()
+        self.arrays = bytearray()
+        self.objects = bytearray()
+        self.numbers = bytearray()
+        self._array_count = 0
+        self._object_count = 0
+        self._number_count = 0
+
+    def _sid(self, text: str) -> int:
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = len(self.strings)
+            self.strings[text] = sid
+        return sid
+
+    def _number(self, value: float) -> int:
+        self.numbers += _NUMBER.pack(float(value))
+        self._number_count += 1
+        return self._number_count - 1
+
+    def encode(self, value: Any) -> Tuple[int, int]:
+        """Encode a value and return its (tag, payload) cell"""
+        if value is None:
+            return TAG_NULL, 0
+        if value is True:
+            return TAG_TRUE, 0
+        if value is False:
+            return TAG_FALSE, 0
+        if isinstance(value, int):
+            if -0x80000000 <= value <= 0x7FFFFFFF:
+                return TAG_INT, value & 0xFFFFFFFF
+            return TAG_NUMBER, self._number(value)
+        if isinstance(value, float):
+            return TAG_NUMBER, self._number(value)
+        if isinstance(value, str):
+            return TAG_STR, self._sid(value)
+        if isinstance(value, Mapping):
+            # Children first so this object's entries stay contiguous
+            encoded = [(self._sid(str(k)), self.encode(v)) for k, v in value.items()]
+            first = len(self.entries) // _ENTRY.size
+            for key_sid, (tag, payload) in encoded:
+                self.entries += _ENTRY.pack(key_sid, tag, payload)
+            self.objects += _SPAN.pack(first, len(encoded))
+            self._object_count += 1
+            return TAG_OBJECT, self._object_count - 1
+        if isinstance(value, (list, tuple)):
+            encoded = [self.encode(v) for v in value]
+            first = len(self.cells) // _CELL.size
+            for tag, payload in encoded:
+                self.cells += _CELL.pack(tag, payload)
+            self.arrays += _SPAN.pack(first, len(encoded))
+            self._array_count += 1
+            return TAG_ARRAY, self._array_count - 1
+        raise TypeError(f"Cannot store {type(value).__name__} in a data bundle")
+
+    def string_sections(self) -> Tuple[bytes, bytes]:
+        offsets = bytearray()
+        data = bytearray()
+        for text in self.strings:  # dicts keep insertion (= sid) order
+            offsets += _U32.pack(len(data))
+            data += text.encode("utf-8")
+        offsets += _U32.pack(len(data))
+        return bytes(offsets), bytes(data)
+
+
+def build_bundle(
+    sources: Dict[str, Path],
+    output_path: Path,
+    extra_datasets: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Compile JSON data files into a bundle
+
+    Args:
+        sources: Dataset name -> JSON file (missing files are skipped)
+        output_path: Where to write the bundle
+        extra_datasets: Already built datasets to store as-is (e.g. the image manifest)
+
+    Returns:
+        Build statistics
+    """
+    datasets: Dict[str, Any] = {}
+    source_info: Dict[str, Dict[str, Any]] = {}
+    digest = hashlib.sha256()
+
+    for name, path in sources.items():
+        path = Path(path)
+        if not path.exists():
+            print(f"Warning: {name} file not found at {path}, skipping")
+            continue
+        raw = path.read_bytes()
+        digest.update(name.encode("utf-8") + b"\0" + raw)
+        datasets[name] = json.loads(raw)
+        stat = path.stat()
+        source_info[name] = {"path": str(path), "size": stat.st_size, "mtime": int(stat.st_mtime)}
+
+    for name, value in (extra_datasets or {}).items():
+        digest.update(name.encode("utf-8") + b"\0" + json.dumps(value, sort_keys=True).encode("utf-8"))
+        datasets[name] = value
+
+    writer = _BundleWriter()
+    root_tag, root_payload = writer.encode({
+        "metadata": {"format_version": FORMAT_VERSION, "sources": source_info},
+        "datasets": datasets,
+    })
+    str_offsets, str_data = writer.string_sections()
+    payloads = [str_offsets, str_data, bytes(writer.cells), bytes(writer.entries),
+                bytes(writer.arrays), bytes(writer.objects), bytes(writer.numbers)]
+
+    offset = _HEADER.size + _SECTION.size * len(payloads)
+    table = bytearray()
+    for name, payload in zip(_SECTION_NAMES, payloads):
+        offset = (offset + 7) & ~7  # keep sections 8-byte aligned
+        table += _SECTION.pack(name.encode("ascii"), offset, len(payload))
+        offset += len(payload)
+
+    checksum = digest.digest()[:16]
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(payloads), checksum, root_tag, root_payload))
+        f.write(table)
+        for payload in payloads:
+            f.write(b"\0" * (-f.tell() % 8))
+            f.write(payload)
+    # Atomic replace so running workers keep their old mapping intact
+    os.replace(tmp_path, output_path)
+
+    return {
+        "datasets": sorted(datasets),
+        "strings": len(writer.strings),
+        "size": output_path.stat().st_size,
+        "checksum": checksum.hex(),
+        "output_file": str(output_path),
+    }
+
+
+def default_sources() -> Dict[str, Path]:
+    """Dataset name -> JSON file, as configured in settings"""
+    from app.core.config import settings
+
+    return {
+        "jugadores": Path(settings.JUGADORES_FILE),
+        "tecnicos": Path(settings.TECNICOS_FILE),
+        "tecnicos_jugadores": Path(settings.TECNICOS_JUGADORES_FILE),
+        "clasicos": Path(settings.CLASICOS_GAME_FILE),
+    }
+
+
+def main() -> int:
+    """Build the bundle configured in settings"""
+    from app.core.config import settings
+
+    from app.services.image_manifest import scan_images
+
+    stats = build_bundle(
+        default_sources(),
+        Path(settings.DATA_BUNDLE_FILE),
+        extra_datasets={"imagenes": scan_images(Path(settings.IMAGES_DIR))}
+    )
+    print(f"✅ Bundle generado: {stats['output_file']}")
+    print(f"   📦 Datasets: {', '.join(stats['datasets'])}")
+    print(f"   🔤 Strings: {stats['strings']}")
+    print(f"   💾 Tamaño: {stats['size'] / 1024:.2f} KB")
+    print(f"   🔑 Checksum: {stats['checksum']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
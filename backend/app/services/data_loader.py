@@ -1,82 +1,160 @@
 """
 Service to load data from JSON files
+
+Every dataset and derived index lives in an immutable DataSnapshot.
+DataLoaderService serves the current one; a reload builds a complete new
+snapshot and swaps a single reference, so a request never sees a
+half-loaded state.
 """
 import json
 import os
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Callable, Dict, List, Any, Optional, Tuple, TypeVar
 from pathlib import Path
 from app.core.config import settings
+from app.services.data_bundle import DataBundle, BundleFormatError, default_sources
+from app.services.image_manifest import ImageManifest
+from app.services.indexes import (
+    Candidato,
+    ClubKeyTable,
+    FuzzyIndex,
+    Jugador,
+    PositionTable,
+    PrefixIndex,
+    TecnicoIndexado,
+    build_autocompletado,
+    build_jugadores,
+    build_jugadores_por_nombre,
+    build_jugadores_rc_por_club,
+    build_tecnicos_por_nombre
+)
+from app.utils import TextUtils
 
 
-class DataLoaderService:
-    """Loads and caches data from scraped JSON files"""
+T = TypeVar("T")
+
+
+class DataSnapshot:
+    """
+    One version of the scraped datasets and their indexes
     
-    def __init__(self):
+    Datasets are loaded and indexes built on first use (or all at once with
+    load_all) and never modified afterwards: new data means a new snapshot.
+    The game engine reads snapshots from several threads, so each one is
+    built once under the snapshot's lock (see _una_vez).
+    """
+    
+    def __init__(self, version: int = 0):
+        """
+        Args:
+            version: Data version (derived caches elsewhere are keyed by it)
+        """
+        self.version = version
         self._jugadores_data: Optional[Dict[str, Any]] = None
         self._tecnicos_data: Optional[Dict[str, Any]] = None
         self._tecnicos_jugadores_data: Optional[Dict[str, Any]] = None
-        self._club_posicion_index: Optional[Dict[str, Any]] = None
         self._clasicos_data: Optional[Dict[str, Any]] = None
+        self._jugadores: Optional[Tuple[Jugador, ...]] = None
+        self._jugadores_por_nombre: Optional[Dict[str, Tuple[Jugador, ...]]] = None
+        self._tecnicos_por_nombre: Optional[Dict[str, Tuple[TecnicoIndexado, ...]]] = None
+        self._club_keys: Optional[ClubKeyTable] = None
+        self._position_table: Optional[PositionTable] = None
+        self._jugadores_rc_por_club: Optional[Dict[str, Dict[str, Tuple[Jugador, ...]]]] = None
+        self._image_manifest: Optional[ImageManifest] = None
+        self._autocompletado: Optional[Dict[Optional[str], PrefixIndex]] = None
+        self._nombres_aproximados: Optional[FuzzyIndex] = None
+        self._bundle: Optional[DataBundle] = None
+        self._bundle_checked = False
+        # Reentrant: builders use each other (e.g. the name index the records)
+        self._lock = threading.RLock()
+    
+    def _una_vez(self, campo: str, construir: Callable[[], T]) -> T:
+        """
+        Value of a lazy field, built by `construir` on first use
+        
+        Checked again under the lock, so threads asking for it at the same
+        time build it once; once set, reads don't lock.
+        """
+        valor = getattr(self, campo)
+        if valor is None:
+            with self._lock:
+                valor = getattr(self, campo)
+                if valor is None:
+                    valor = construir()
+                    setattr(self, campo, valor)
+        return valor
+    
+    def _get_bundle(self) -> Optional[DataBundle]:
+        """Open the compiled data bundle once, if enabled and up to date"""
+        if not self._bundle_checked:
+            with self._lock:
+                if not self._bundle_checked:
+                    self._bundle = self._open_bundle()
+                    self._bundle_checked = True
+        
+        return self._bundle
+    
+    @staticmethod
+    def _open_bundle() -> Optional[DataBundle]:
+        """The compiled data bundle, or None if disabled, missing, broken or stale"""
+        path = Path(settings.DATA_BUNDLE_FILE)
+        
+        if not settings.USE_DATA_BUNDLE or not path.exists():
+            return None
+        
+        try:
+            bundle = DataBundle(path)
+        except (OSError, BundleFormatError) as e:
+            print(f"Warning: Could not open data bundle at {path}: {e}")
+            return None
+        
+        if bundle.is_stale(default_sources()):
+            print(f"Warning: Data bundle at {path} is older than the JSON files, ignoring it")
+            print("Run: python build_bundle.py")
+            bundle.close()
+            return None
+        
+        print(f"Using data bundle: {path} (checksum {bundle.checksum})")
+        return bundle
+    
+    def _load_from_bundle(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a dataset from the bundle (read-only view) or None"""
+        bundle = self._get_bundle()
+        if bundle is not None and bundle.has_dataset(name):
+            return bundle.dataset(name)
+        return None
+    
+    def _load_dataset(self, name: str, file: str, vacio: Dict[str, Any]) -> Dict[str, Any]:
+        """A dataset from the bundle, else from its JSON file (`vacio` if the file is missing)"""
+        data = self._load_from_bundle(name)
+        if data is not None:
+            return data
+        
+        path = Path(file)
+        print(f"Loading {name} from: {path}")
+        
+        if not path.exists():
+            print(f"Warning: {name.capitalize()} file not found at {path}")
+            return vacio
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
     
     def load_jugadores(self) -> Dict[str, Any]:
         """Load players data"""
-        if self._jugadores_data is None:
-            path = Path(settings.JUGADORES_FILE)
-            print(f"Loading jugadores from: {path}")
-            
-            if not path.exists():
-                print(f"Warning: Jugadores file not found at {path}")
-                return {"jugadores": []}
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                self._jugadores_data = json.load(f)
-        
-        return self._jugadores_data
+        return self._una_vez('_jugadores_data', lambda: self._load_dataset("jugadores", settings.JUGADORES_FILE, {"jugadores": []}))
     
     def load_tecnicos(self) -> Dict[str, Any]:
         """Load coaches data"""
-        if self._tecnicos_data is None:
-            path = Path(settings.TECNICOS_FILE)
-            print(f"Loading tecnicos from: {path}")
-            
-            if not path.exists():
-                print(f"Warning: Tecnicos file not found at {path}")
-                return {"tecnicos": {}}
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                self._tecnicos_data = json.load(f)
-        
-        return self._tecnicos_data
+        return self._una_vez('_tecnicos_data', lambda: self._load_dataset("tecnicos", settings.TECNICOS_FILE, {"tecnicos": {}}))
     
     def load_tecnicos_jugadores(self) -> Dict[str, Any]:
         """Load coaches-players relationship data"""
-        if self._tecnicos_jugadores_data is None:
-            path = Path(settings.TECNICOS_JUGADORES_FILE)
-            print(f"Loading tecnicos_jugadores from: {path}")
-            
-            if not path.exists():
-                print(f"Warning: Tecnicos_jugadores file not found at {path}")
-                return {"tecnicos": {}}
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                self._tecnicos_jugadores_data = json.load(f)
-        
-        return self._tecnicos_jugadores_data
+        return self._una_vez('_tecnicos_jugadores_data', lambda: self._load_dataset("tecnicos_jugadores", settings.TECNICOS_JUGADORES_FILE, {"tecnicos": {}}))
     
     def load_clasicos(self) -> Dict[str, Any]:
         """Load classic matches data (Rosario Central vs Newell's)"""
-        if self._clasicos_data is None:
-            path = Path(settings.CLASICOS_GAME_FILE)
-            print(f"Loading clasicos from: {path}")
-            
-            if not path.exists():
-                print(f"Warning: Clasicos file not found at {path}")
-                return {"partidos": []}
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                self._clasicos_data = json.load(f)
-        
-        return self._clasicos_data
+        return self._una_vez('_clasicos_data', lambda: self._load_dataset("clasicos", settings.CLASICOS_GAME_FILE, {"partidos": []}))
     
     def get_all_clasicos(self) -> List[Dict[str, Any]]:
         """Get all classic matches as list"""
@@ -92,124 +170,346 @@ class DataLoaderService:
         return None
     
     def get_all_jugadores(self) -> List[Dict[str, Any]]:
-        """Get all players as list"""
+        """
+        Get all players as list, as raw records of rosario_central_jugadores.json
+        
+        The games use get_jugadores; the raw records are released once those
+        are built, so this loads them again.
+        """
         data = self.load_jugadores()
         return data.get("jugadores", [])
     
-    def get_jugadores_con_minimo_partidos(self, min_partidos: int = 10) -> List[Dict[str, Any]]:
-        """Get players with minimum number of games"""
-        jugadores = self.get_all_jugadores()
-        return [j for j in jugadores if j.get("partidos", 0) >= min_partidos]
+    def get_jugadores(self) -> Tuple[Jugador, ...]:
+        """All players as compact records, indexed by player id (read-only)"""
+        def construir() -> Tuple[Jugador, ...]:
+            jugadores = build_jugadores(
+                self.get_all_jugadores(),
+                self.get_club_keys(),
+                self.get_position_table()
+            )
+            # Everything the games read is in the records now
+            self._jugadores_data = None
+            return jugadores
+        
+        return self._una_vez('_jugadores', construir)
     
-    def get_jugadores_con_clubes_nacionales(self, min_clubes: int = 2) -> List[Dict[str, Any]]:
-        """Get players who played in multiple Argentine clubs"""
-        jugadores = self.get_all_jugadores()
-        result = []
+    def get_jugador(self, jugador_id: int) -> Jugador:
+        """Get a player by id (position in the players list)"""
+        return self.get_jugadores()[jugador_id]
+    
+    def get_jugadores_por_nombre(self) -> Dict[str, Tuple[Jugador, ...]]:
+        """Player name index: normalized surname / full name -> players (read-only)"""
+        return self._una_vez('_jugadores_por_nombre', lambda: build_jugadores_por_nombre(self.get_jugadores()))
+    
+    def buscar_jugadores_por_nombre(self, nombre_normalizado: str) -> Tuple[Jugador, ...]:
+        """
+        Find players by normalized surname or full name (O(1) lookup)
         
-        for j in jugadores:
-            clubes_arg = [
-                c for c in j.get("clubes_historia", [])
-                if c.get("pais") == "Argentina"
-            ]
-            if len(clubes_arg) >= min_clubes:
-                result.append(j)
+        Args:
+            nombre_normalizado: Name already passed through TextUtils.normalize_text
         
-        return result
+        Returns:
+            Matching players (with canonical club keys), in dataset order
+        """
+        return self.get_jugadores_por_nombre().get(nombre_normalizado, ())
     
-    def get_jugadores_con_clubes_internacionales(self, min_clubes: int = 1) -> List[Dict[str, Any]]:
-        """Get players who played in international clubs"""
-        jugadores = self.get_all_jugadores()
-        result = []
+    def get_autocompletado(self) -> Dict[Optional[str], PrefixIndex]:
+        """Prefix indexes of player, coach and referee names, by alcance (None: all)"""
+        return self._una_vez('_autocompletado', lambda: build_autocompletado(
+            self.get_jugadores(),
+            self.get_all_tecnicos(),
+            self.get_all_clasicos()
+        ))
+    
+    @property
+    def autocompletado_cargado(self) -> bool:
+        """Whether autocompletar answers without loading anything"""
+        return self._autocompletado is not None
+    
+    def autocompletar(self, texto: str, limite: int, alcance: Optional[str] = None) -> List[Candidato]:
+        """
+        Names with a word starting with the text (typeahead)
         
-        for j in jugadores:
-            clubes_int = [
-                c for c in j.get("clubes_historia", [])
-                if c.get("pais") != "Argentina"
-            ]
-            if len(clubes_int) >= min_clubes:
-                result.append(j)
+        Args:
+            texto: What the user typed so far (normalized here)
+            limite: Maximum number of names
+            alcance: Only 'jugadores', 'jugadores_rc' (played in Rosario Central),
+                'entrenadores' or 'arbitros'; None for all of them
         
-        return result
+        Returns:
+            Candidatos sorted by the matching part of the name
+        """
+        return self.get_autocompletado()[alcance].buscar(TextUtils.normalize_text(texto), limite)
+    
+    def get_jugadores_con_minimo_partidos(self, min_partidos: int = 10) -> List[Jugador]:
+        """Get players with minimum number of games"""
+        return [j for j in self.get_jugadores() if j.partidos >= min_partidos]
+    
+    def get_jugadores_con_clubes_nacionales(self, min_clubes: int = 2) -> List[Jugador]:
+        """Get players who played in multiple Argentine clubs"""
+        return [j for j in self.get_jugadores() if j.clubes_argentina >= min_clubes]
+    
+    def get_jugadores_con_clubes_internacionales(self, min_clubes: int = 1) -> List[Jugador]:
+        """Get players who played in international clubs"""
+        return [j for j in self.get_jugadores() if len(j.clubes) - j.clubes_argentina >= min_clubes]
     
     def get_all_tecnicos(self) -> Dict[str, Dict[str, Any]]:
         """Get all coaches"""
         data = self.load_tecnicos()
         return data.get("tecnicos", {})
     
+    def get_tecnicos_por_nombre(self) -> Dict[str, Tuple[TecnicoIndexado, ...]]:
+        """Coach name index: normalized surname / full name -> coach records (read-only)"""
+        return self._una_vez('_tecnicos_por_nombre', lambda: build_tecnicos_por_nombre(
+            self.get_all_tecnicos(),
+            self.get_club_keys()
+        ))
+    
+    def buscar_tecnicos_por_nombre(self, nombre_normalizado: str) -> Tuple[TecnicoIndexado, ...]:
+        """
+        Find coaches by normalized surname or full name (O(1) lookup)
+        
+        Args:
+            nombre_normalizado: Name already passed through TextUtils.normalize_text
+        
+        Returns:
+            Matching coach records (with canonical club keys), in dataset order
+        """
+        return self.get_tecnicos_por_nombre().get(nombre_normalizado, ())
+    
+    def tecnico_dirigio_club(self, nombre_normalizado: str, club_key: str) -> Optional[TecnicoIndexado]:
+        """
+        Get the first coach matching the name who managed the given club
+        
+        Args:
+            nombre_normalizado: Normalized coach surname or full name
+            club_key: Canonical club key (see resolve_club)
+        
+        Returns:
+            The coach record or None
+        """
+        for entry in self.buscar_tecnicos_por_nombre(nombre_normalizado):
+            if club_key in entry.clubes_norm:
+                return entry
+        return None
+    
+    def get_nombres_aproximados(self) -> FuzzyIndex:
+        """Typo-tolerant index of every player and coach name key"""
+        return self._una_vez('_nombres_aproximados', lambda: FuzzyIndex(
+            list(self.get_jugadores_por_nombre()) + list(self.get_tecnicos_por_nombre())
+        ))
+    
+    def es_nombre_conocido(self, nombre_normalizado: str) -> bool:
+        """Whether a normalized name is exactly a player's or coach's surname or full name"""
+        return (
+            nombre_normalizado in self.get_jugadores_por_nombre()
+            or nombre_normalizado in self.get_tecnicos_por_nombre()
+        )
+    
+    def corregir_respuesta(
+        self,
+        nombre_normalizado: str,
+        club_key: str
+    ) -> Tuple[Optional[TecnicoIndexado], Tuple[Jugador, ...]]:
+        """
+        Closest coach, or players who played in Rosario Central, of a club to a misspelled name
+        
+        Names are tried from the closest one (within the edits tolerated
+        for the guess's length, see typos_permitidos); the first distance
+        with a match wins. At that distance a coach wins, as with exact
+        names; otherwise every matching player is returned.
+        
+        A name that is exactly someone else's (a real player who never
+        played for the club) is a wrong answer, not a typo: nothing is
+        corrected then.
+        
+        Args:
+            nombre_normalizado: Guess already passed through TextUtils.normalize_text
+            club_key: Canonical club key (see resolve_club)
+        
+        Returns:
+            (coach or None, players in dataset order), both empty if nothing is close
+        """
+        if self.es_nombre_conocido(nombre_normalizado):
+            return None, ()
+        
+        encontrados = self.get_nombres_aproximados().buscar(nombre_normalizado)
+        
+        for distancia in sorted({d for d, _ in encontrados}):
+            claves = [clave for d, clave in encontrados if d == distancia]
+            
+            for clave in claves:
+                tecnico = self.tecnico_dirigio_club(clave, club_key)
+                if tecnico is not None:
+                    return tecnico, ()
+            
+            jugadores = {
+                jugador.id: jugador
+                for clave in claves
+                for jugador in self.buscar_jugadores_por_nombre(clave)
+                if jugador.tiene_rc and club_key in jugador.clubes_norm
+            }
+            if jugadores:
+                return None, tuple(jugadores[i] for i in sorted(jugadores))
+        
+        return None, ()
+    
     def get_jugadores_por_tecnico(self, tecnico_nombre: str) -> Optional[Dict[str, Any]]:
         """Get players coached by a specific coach"""
         data = self.load_tecnicos_jugadores()
         tecnicos = data.get("tecnicos", {})
         return tecnicos.get(tecnico_nombre)
     
-    def load_club_posicion_index(self) -> Dict[str, Any]:
-        """
-        Load optimized club-position index for O(1) lookups
+    def load_club_aliases(self) -> Dict[str, List[str]]:
+        """Load alternative club names (club name in the data -> aliases)"""
+        path = Path(settings.CLUB_ALIASES_FILE)
         
-        Returns:
-            Dict[club][position] -> List[player]
+        if not path.exists():
+            print(f"Warning: Club aliases file not found at {path}")
+            return {}
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("alias", {})
+    
+    def get_club_keys(self) -> ClubKeyTable:
         """
-        if self._club_posicion_index is None:
-            # Try to load index file
-            data_dir = Path(settings.JUGADORES_FILE).parent
-            index_path = data_dir / 'club_posicion_index.json'
+        Canonical club key table built from every club name in the datasets
+        (players' and coaches' history)
+        """
+        def construir() -> ClubKeyTable:
+            nombres: List[str] = []
+            for jugador in self.get_all_jugadores():
+                nombres.extend(c.get('nombre', '') for c in jugador.get('clubes_historia', []))
+            for tecnico in self.get_all_tecnicos().values():
+                nombres.extend(c.get('club', '') for c in tecnico.get('clubes_historia', []))
             
-            print(f"Loading club_posicion_index from: {index_path}")
+            return ClubKeyTable(nombres, self.load_club_aliases())
+        
+        return self._una_vez('_club_keys', construir)
+    
+    def get_position_table(self) -> PositionTable:
+        """Game positions of the Transfermarkt positions (formaciones.json)"""
+        def construir() -> PositionTable:
+            path = Path(settings.FORMACIONES_FILE)
             
-            if not index_path.exists():
-                print(f"Warning: Index file not found at {index_path}")
-                print("Run: python3 scraping/scripts/generar_indice_club_posicion.py")
-                return {}
+            if not path.exists():
+                print(f"Warning: Formaciones file not found at {path}")
+                return PositionTable({})
             
-            with open(index_path, 'r', encoding='utf-8') as f:
-                self._club_posicion_index = json.load(f)
+            with open(path, 'r', encoding='utf-8') as f:
+                return PositionTable(json.load(f))
         
-        return self._club_posicion_index
+        return self._una_vez('_position_table', construir)
     
-    def get_jugadores_por_club_posicion(
-        self, 
-        club_nombre: str, 
-        posicion: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    def resolve_club(self, club_nombre: str) -> str:
+        """Canonical key of a club name or alias (e.g. 'Ind. Rivadavia')"""
+        return self.get_club_keys().resolve(club_nombre)
+    
+    def get_jugadores_rc_club(self, club_nombre: str) -> Dict[str, Tuple[Jugador, ...]]:
         """
-        Get players for a specific club and position (O(1) lookup)
+        Players who played in Rosario Central and in a club, by game position
         
-        Args:
-            club_nombre: Club name
-            posicion: Optional position filter (e.g., 'DEL', 'MC')
+        Built from the player records and keyed by canonical club key, so
+        it holds exactly the players a guess for that club and position
+        accepts (the scraped club-position index has no 'PI', for one).
         
         Returns:
-            List of players matching criteria
+            Dict[position] -> players (empty if none played in the club)
         """
-        index = self.load_club_posicion_index()
-        
-        # Get club data
-        club_data = index.get(club_nombre, {})
-        
-        if not club_data:
-            return []
+        por_club = self._una_vez('_jugadores_rc_por_club', lambda: build_jugadores_rc_por_club(self.get_jugadores()))
+        return por_club.get(self.resolve_club(club_nombre), {})
+    
+    def get_image_manifest(self) -> ImageManifest:
+        """
+        Manifest of the static images directory (stem -> file)
         
-        # If no position specified, return all players for the club
-        if posicion is None:
-            all_players = []
-            for pos_players in club_data.values():
-                all_players.extend(pos_players)
-            return all_players
+        Taken from the data bundle when available, otherwise built with a
+        single walk of IMAGES_DIR, so URL helpers never probe the filesystem.
+        """
+        def construir() -> ImageManifest:
+            entries = self._load_from_bundle("imagenes")
+            if entries is None:
+                print(f"Scanning images in: {settings.IMAGES_DIR}")
+                return ImageManifest.from_directory(Path(settings.IMAGES_DIR))
+            return ImageManifest(entries)
         
-        # Return players for specific position
-        return club_data.get(posicion, [])
+        return self._una_vez('_image_manifest', construir)
     
-    def reload_all(self):
-        """Force reload all data"""
-        self._jugadores_data = None
-        self._tecnicos_data = None
-        self._tecnicos_jugadores_data = None
-        self._club_posicion_index = None
+    def load_all(self) -> "DataSnapshot":
+        """
+        Load every dataset and build every index now instead of on first use
+        
+        Used to build reloaded snapshots before publishing them, and by the
+        prefork server (serve.py) so the forked workers share everything.
         
-        self.load_jugadores()
+        Returns:
+            self
+        """
+        self.get_jugadores()
         self.load_tecnicos()
         self.load_tecnicos_jugadores()
-        self.load_club_posicion_index()
+        self.load_clasicos()
+        self.get_jugadores_por_nombre()
+        self.get_tecnicos_por_nombre()
+        # Lazy indexes built on their first lookup
+        self.get_jugadores_rc_club("")
+        self.get_image_manifest()
+        self.get_autocompletado()
+        self.get_nombres_aproximados()
+        return self
+
+
+class DataLoaderService:
+    """Serves the current DataSnapshot and swaps in reloaded ones"""
+    
+    def __init__(self):
+        self._snapshot = DataSnapshot()
+        # One reload at a time; readers never lock
+        self._reload_lock = threading.Lock()
+    
+    @property
+    def snapshot(self) -> DataSnapshot:
+        """
+        Current data snapshot
+        
+        Take it once per operation: two reads may return different snapshots
+        if a reload lands in between.
+        """
+        return self._snapshot
+    
+    @property
+    def data_version(self) -> int:
+        """Version of the current data (changes after reload_all)"""
+        return self._snapshot.version
+    
+    def preload_all(self):
+        """Load every dataset and index of the current snapshot now"""
+        self._snapshot.load_all()
+    
+    def reload_all(self) -> DataSnapshot:
+        """
+        Load every dataset again into a new snapshot and swap it in
+        
+        The current snapshot keeps serving until the new one is complete.
+        It is not closed: requests in flight and the games built from it
+        keep using it until they drop their references.
+        
+        Returns:
+            The new current snapshot
+        
+        Raises:
+            ValueError / OSError if the files can't be loaded; the current
+            snapshot is kept then
+        """
+        with self._reload_lock:
+            snapshot = DataSnapshot(self._snapshot.version + 1).load_all()
+            if not snapshot.get_jugadores():
+                # Missing or half-written files: keep serving the current data
+                raise ValueError("Reloaded data has no players")
+            # Single reference assignment: atomic for every reader
+            self._snapshot = snapshot
+        
+        return snapshot
 
 
 # Singleton instance
@@ -0,0 +1,159 @@
+"""
+Hot reload of the scraped data
+
+The watcher polls the files of DATA_DIR from the FastAPI lifespan (like the
+daily game scheduler). Once a change has settled (same files on two polls
+in a row, so a scraper that is still writing is not picked up half way) it
+rebuilds every dataset and index into a new DataSnapshot in a worker thread
+and swaps it in (DataLoaderService.reload_all). The admin endpoint and
+SIGHUP trigger the same path.
+
+Games already built keep the snapshot they were built from, so the
+sessions in progress never see their players change; the games built
+after the reload use the new data.
+"""
+import asyncio
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.services.data_loader import DataLoaderService, data_loader_service
+
+
+# (file name, mtime in ns, size) of every watched file
+Firma = Tuple[Tuple[str, int, int], ...]
+
+# Files a re-scrape (or build_bundle.py) writes
+EXTENSIONES = ('.json', '.bundle')
+
+
+class DataReloader:
+    """Reloads DataLoaderService when the files of the data directory change"""
+
+    def __init__(self, data_loader: DataLoaderService, data_dir: Path, intervalo_segundos: float = 30):
+        """
+        Args:
+            data_loader: Service whose snapshot is rebuilt and swapped
+            data_dir: Directory of the scraping output (DATA_DIR)
+            intervalo_segundos: Poll interval of the watcher (0 disables it)
+        """
+        self.data_loader = data_loader
+        self.data_dir = Path(data_dir)
+        self.intervalo = intervalo_segundos
+        # Prefork master to forward reloads to (set in the workers by serve.py)
+        self.master_pid: Optional[int] = None
+        # Taken before the data is loaded, so workers forked later from the
+        # prefork master still notice changes made after it loaded
+        self._firma = self._firma_archivos()
+        self._task: Optional[asyncio.Task] = None
+        self._recarga_senal: Optional[asyncio.Task] = None
+
+    def _firma_archivos(self) -> Firma:
+        """Name, mtime and size of the watched files"""
+        firma = []
+        try:
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(EXTENSIONES) and entry.is_file():
+                        stat = entry.stat()
+                        firma.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            pass
+        return tuple(sorted(firma))
+
+    def recargar(self, motivo: str) -> Dict[str, Any]:
+        """
+        Rebuild the data and swap it in (blocking: call it from a worker thread)
+
+        Args:
+            motivo: What triggered the reload, for the logs
+
+        Returns:
+            Dict with the new data version, the time it took and the reason
+
+        Raises:
+            ValueError / OSError if the files can't be loaded (nothing changes then)
+        """
+        firma = self._firma_archivos()
+        inicio = time.perf_counter()
+
+        snapshot = self.data_loader.reload_all()
+        segundos = time.perf_counter() - inicio
+        self._firma = firma
+
+        print(f"✅ Datos recargados ({motivo}): versión {snapshot.version} en {segundos:.2f}s")
+        return {'version': snapshot.version, 'segundos': round(segundos, 3), 'motivo': motivo}
+
+    def recargar_todos(self) -> bool:
+        """
+        Ask the prefork master to reload every worker (SIGHUP)
+
+        Returns:
+            False when not running under serve.py: reload this process instead
+        """
+        if self.master_pid is None:
+            return False
+
+        os.kill(self.master_pid, signal.SIGHUP)
+        return True
+
+    def start(self) -> None:
+        """Start the watcher on the running event loop, and reload on SIGHUP"""
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self._on_sighup)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            # No SIGHUP (Windows) or not the main thread
+            pass
+
+        if self.intervalo > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="data-watcher")
+
+    def _on_sighup(self) -> None:
+        self._recarga_senal = asyncio.create_task(self._recargar_async("SIGHUP"))
+
+    async def stop(self) -> None:
+        """Cancel the watcher"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        pendiente: Optional[Firma] = None
+        fallida: Optional[Firma] = None
+
+        while True:
+            await asyncio.sleep(self.intervalo)
+            firma = await asyncio.to_thread(self._firma_archivos)
+
+            if firma in (self._firma, fallida):
+                pendiente = None
+            elif firma != pendiente:
+                # Changed since the last poll: wait until it settles
+                pendiente = firma
+            else:
+                pendiente = None
+                if not await self._recargar_async("archivos modificados"):
+                    # Not retried until the files change again
+                    fallida = firma
+
+    async def _recargar_async(self, motivo: str) -> bool:
+        try:
+            await asyncio.to_thread(self.recargar, motivo)
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Warning: Could not reload data ({motivo}), keeping version {self.data_loader.data_version}: {e}")
+            return False
+
+
+# Singleton instance
+data_reloader = DataReloader(data_loader_service, Path(settings.DATA_DIR), settings.DATA_WATCH_SECONDS)
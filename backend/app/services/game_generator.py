@@ -2,14 +2,33 @@
 Service to generate daily games
 Nueva mecánica: Mostrar club -> Usuario adivina jugador que jugó en RC + ese club
 """
+import copy
+import hashlib
 import random
 import json
-import unicodedata
+import threading
+from itertools import chain
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional, Set, Tuple
+from collections.abc import Sequence
+from typing import Dict, FrozenSet, List, Any, NamedTuple, Optional, Set, Tuple
 from pathlib import Path
 from app.core.config import settings
-from app.services.data_loader import data_loader_service
+from app.services.data_loader import DataSnapshot, data_loader_service
+from app.services.answer_verification import (
+    build_verificacion_clasico,
+    build_verificacion_equipo,
+    sal_del_juego
+)
+from app.services.game_state_store import GameStateStore, StaleStateError, create_game_state_store
+from app.services.progress_token import ProgressTokenCodec, create_progress_token_codec
+from app.services.indexes import (
+    FuzzyIndex,
+    Jugador,
+    JugadorElegible,
+    build_jugadores_elegibles,
+    emparejamiento_maximo
+)
+from app.utils import DateUtils, TextUtils
 from app.schemas.game import (
     EquipoDelDiaGame,
     PosicionVacia,
@@ -17,40 +36,66 @@ from app.schemas.game import (
 )
 
 
+class PistaJugador(NamedTuple):
+    """Hint material of a candidate player of an Equipo del Día club"""
+    id: int  # Player id
+    letra_inicial: str  # Of the surname
+    posicion: str  # Main position (Transfermarkt name)
+    otro_club: Optional[str]  # First other club of his history (not RC, not the game's club)
+
+
+class CandidatosPosicion(NamedTuple):
+    """Players who can fill a position for a club of an Equipo del Día game"""
+    libres: Tuple[PistaJugador, ...]  # The one assigned to the club first, then dataset order
+    reservados: Tuple[PistaJugador, ...]  # Assigned to later clubs: used only when no other is left
+
+
 class GameGeneratorService:
     """Generates daily games with deterministic randomness based on date"""
     
+    # Equipo del Día games -> category of clubes.json
+    CATEGORIAS = {
+        'equipo_nacional': 'Nacional',
+        'equipo_europeo': 'Internacional',
+        'equipo_latinoamericano': 'Latinoamérica'
+    }
+    
+    # Every daily game, in generation order
+    JUEGOS_DEL_DIA = ('equipo_nacional', 'equipo_europeo', 'equipo_latinoamericano', 'clasico')
+    
+    # Club lists drawn before giving up on one that can fill every position
+    SORTEOS_LISTA_CLUBES = 50
     
     def __init__(self):
         self.data_loader = data_loader_service
         self.clubes_data = self._load_clubes()
+        # Índices de clubes.json: club normalizado -> (país, categoría) y categoría -> clubes
+        self._club_paises, self._clubes_por_categoria = self._build_club_index(self.clubes_data)
         self.formaciones_data = self._load_formaciones()
-        # Cache de juegos activos por game_id
+        # Definiciones de los juegos del día por game_id (compartidas, solo lectura)
         self._games_cache: Dict[str, Dict] = {}
-        # Cache de formaciones usadas por día (para no repetir)
-        self._formaciones_usadas_hoy: Set[str] = set()
+        # Single-flight: un solo thread genera cada juego, los demás esperan su resultado
+        self._generando: Dict[str, threading.Lock] = {}
+        self._generando_lock = threading.Lock()
+        self._publicar_lock = threading.Lock()
+        # Progreso de cada jugador: tokens firmados (GAME_STATE_MODE=token) o store por sesión
+        self._progress_tokens: Optional[ProgressTokenCodec] = create_progress_token_codec(settings)
+        self._game_states: Optional[GameStateStore] = (
+            create_game_state_store(settings) if self._progress_tokens is None else None
+        )
+        # Estado leído por cada thread, para que _save_progreso no pise otro más nuevo
+        self._progreso_leido = threading.local()
+        # Pools de jugadores elegibles por categoría (inmutables, por versión de datos)
+        self._pools: Dict[Tuple[int, str], Tuple[JugadorElegible, ...]] = {}
+        # Logo URLs ya resueltas contra el manifest de imágenes
+        self._logo_urls: Dict[Tuple[str, str], Optional[str]] = {}
+        # Versión de datos de la que salen los dos caches anteriores
+        self._caches_version: Optional[int] = None
     
     @staticmethod
     def _normalize_text(text: str) -> str:
-        """
-        Normalize text by removing accents/tildes and converting to lowercase
-        Keeps dots, spaces, and other punctuation to maintain club name consistency
-        
-        Examples:
-            'Ángel Di María' -> 'angel di maria'
-            'Pérez' -> 'perez'
-            'Ind. Rivadavia' -> 'ind. rivadavia'
-            'Def. y Justicia' -> 'def. y justicia'
-        """
-        if not text:
-            return ""
-        # Convert to NFD (decomposed) form, then remove combining characters (accents)
-        nfd = unicodedata.normalize('NFD', text)
-        without_accents = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
-        # Convert to lowercase and normalize whitespace
-        cleaned = without_accents.lower()
-        cleaned = ' '.join(cleaned.split())
-        return cleaned
+        """Normalize text for comparisons (see TextUtils.normalize_text)"""
+        return TextUtils.normalize_text(text)
     
     def _load_clubes(self) -> Dict:
         """Load clubes.json file"""
@@ -64,95 +109,66 @@ class GameGeneratorService:
         with open(formaciones_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
-    def _get_all_clubs_by_category(self, categoria: str) -> Set[str]:
-        """Get all club names for a category"""
-        clubs = set()
-        for pais, clubes_list in self.clubes_data.get(categoria, {}).items():
-            clubs.update(clubes_list)
-        return clubs
-    
-    def _get_daily_seed(self, game_type: str) -> int:
-        """Generate seed based on current date and game type"""
-        today = date.today()
-        type_offset = hash(game_type) % 1000
-        return int(today.strftime("%Y%m%d")) + type_offset
-    
-    def _get_game_id(self, game_type: str) -> str:
-        """Generate unique game ID for today"""
-        today = date.today()
-        return f"{game_type}_{today.strftime('%Y%m%d')}"
-    
-    def _normalize_position(self, pos: str) -> List[str]:
+    def _build_club_index(
+        self,
+        clubes_data: Dict
+    ) -> Tuple[Dict[str, Tuple[str, str]], Dict[str, FrozenSet[str]]]:
         """
-        Get possible game positions for a Transfermarkt position using formaciones.json considerations
-        """
-        pos_lower = pos.lower().strip()
-        
-        # Build a combined map from all formations' considerations
-        posiciones_resultado = set()
-        
-        for formacion_nombre, formacion_data in self.formaciones_data['formaciones'].items():
-            consideraciones = formacion_data.get('consideraciones', {})
-            
-            # Check for exact match
-            for tm_pos, game_pos in consideraciones.items():
-                if tm_pos.lower() == pos_lower:
-                    posiciones_resultado.add(game_pos)
-        
-        # If we found matches, return them
-        if posiciones_resultado:
-            return list(posiciones_resultado)
-        
-        # Fallback: partial match
-        if 'porter' in pos_lower or 'arquer' in pos_lower:
-            return ['PO']
-        elif 'defens' in pos_lower and 'central' in pos_lower:
-            return ['DC']
-        elif 'lateral' in pos_lower:
-            if 'derech' in pos_lower:
-                return ['ED']
-            elif 'izquier' in pos_lower:
-                return ['EI']
-            return ['ED', 'EI']
-        elif 'defens' in pos_lower:
-            return ['DC']
-        elif 'medio' in pos_lower or 'volante' in pos_lower:
-            if 'ofensivo' in pos_lower:
-                return ['MO', 'MC']
-            if 'derech' in pos_lower:
-                return ['MD', 'MC']
-            elif 'izquier' in pos_lower:
-                return ['MI', 'MC']
-            return ['MC']
-        elif 'delant' in pos_lower or 'atac' in pos_lower:
-            return ['DEL']
-        
-        return ['MC']  # Default
-    
-    def _get_all_valid_positions(self, jugador: Dict) -> List[str]:
-        """
-        Get all valid game positions for a player based on their positions list
+        Build the club lookups of clubes.json in a single pass
         
         Args:
-            jugador: Player dict with 'posiciones' (list) or 'posicion' (string)
+            clubes_data: Dict[categoria][pais] -> List[club]
             
         Returns:
-            List of all valid game positions (without duplicates)
+            (Dict[normalized club] -> (pais, categoria), Dict[categoria] -> club names)
+            If a club is listed twice (e.g. 'Racing'), the first entry wins,
+            as with the previous linear scan.
         """
-        todas_posiciones = set()
+        club_paises: Dict[str, Tuple[str, str]] = {}
+        clubes_por_categoria: Dict[str, FrozenSet[str]] = {}
         
-        # Try to get positions list first
-        posiciones_lista = jugador.get('posiciones', [])
-        if posiciones_lista:
-            for pos in posiciones_lista:
-                todas_posiciones.update(self._normalize_position(pos))
+        for categoria, paises in clubes_data.items():
+            clubs = set()
+            for pais, clubes_list in paises.items():
+                for club_nombre in clubes_list:
+                    club_paises.setdefault(self._normalize_text(club_nombre), (pais, categoria))
+                    clubs.add(club_nombre)
+            clubes_por_categoria[categoria] = frozenset(clubs)
         
-        # Fallback to single position field
-        if not todas_posiciones:
-            posicion_single = jugador.get('posicion', 'MC')
-            todas_posiciones.update(self._normalize_position(posicion_single))
+        return club_paises, clubes_por_categoria
+    
+    def _get_all_clubs_by_category(self, categoria: str) -> FrozenSet[str]:
+        """Get all club names for a category"""
+        return self._clubes_por_categoria.get(categoria, frozenset())
+    
+    def _get_daily_seed(self, game_type: str, fecha: Optional[date] = None) -> int:
+        """
+        Generate seed based on the game date and game type
         
-        return list(todas_posiciones)
+        Uses SHA-256 instead of hash(), which is salted per process
+        (PYTHONHASHSEED), so every worker and node derives the same games.
+        """
+        fecha = fecha or DateUtils.fecha_juego()
+        digest = hashlib.sha256(f"{fecha.isoformat()}:{game_type}".encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big')
+    
+    @staticmethod
+    def _rng_partida(game_id: str, progreso: Dict[str, Any], uso: str) -> random.Random:
+        """
+        Random generator for a reveal or hint, seeded with the game and the player's progress
+        
+        Every call gets its own generator (the global random is never used), so
+        concurrent requests can't interfere and the same progress always gets
+        the same result, on any worker.
+        """
+        estado = json.dumps(progreso, sort_keys=True, separators=(',', ':'))
+        digest = hashlib.sha256(f"{game_id}:{uso}:{estado}".encode('utf-8')).digest()
+        return random.Random(int.from_bytes(digest[:8], 'big'))
+    
+    def _get_game_id(self, game_type: str, fecha: Optional[date] = None) -> str:
+        """Generate unique game ID for a game date (today's by default)"""
+        fecha = fecha or DateUtils.fecha_juego()
+        return f"{game_type}_{fecha.strftime('%Y%m%d')}"
     
     def _get_club_country(self, club_nombre: str) -> Optional[str]:
         """
@@ -164,11 +180,8 @@ class GameGeneratorService:
         Returns:
             Country name or None
         """
-        for categoria, paises in self.clubes_data.items():
-            for pais, clubes_list in paises.items():
-                if club_nombre in clubes_list:
-                    return pais
-        return None
+        entry = self._club_paises.get(self._normalize_text(club_nombre))
+        return entry[0] if entry else None
     
     def _convert_image_path_to_url(self, image_path: Optional[str]) -> Optional[str]:
         """
@@ -210,18 +223,17 @@ class GameGeneratorService:
         
         return None
     
-    def _get_jugador_image_url(self, jugador: Dict) -> Optional[str]:
+    def _get_jugador_image_url(self, jugador: Jugador) -> Optional[str]:
         """
         Get player image URL
         
         Args:
-            jugador: Player dict with 'image_profile' field
+            jugador: Player record
             
         Returns:
             URL path to player image or None
         """
-        image_profile = jugador.get('image_profile')
-        return self._convert_image_path_to_url(image_profile)
+        return self._convert_image_path_to_url(jugador.image_profile)
     
     def _get_tecnico_image_url(self, tecnico_info: Dict) -> Optional[str]:
         """
@@ -255,136 +267,246 @@ class GameGeneratorService:
         if not pais:
             pais = "Argentina"
         
-        # Normalize club name for filename (same logic as scraper in text_utils.py)
-        import unicodedata
-        import re
-        
-        filename = club_nombre.lower()
-        # Remove accents
-        nfd = unicodedata.normalize('NFD', filename)
-        filename = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
-        # Replace ALL special characters (not just some) with underscore
-        # This matches the scraper's logic: re.sub(r'[^a-z0-9]+', '_', nombre_limpio)
-        # Examples: "Newell's" -> "newell_s", "O'Higgins" -> "o_higgins", "San Martín (T)" -> "san_martin_t"
-        filename = re.sub(r'[^a-z0-9]+', '_', filename)
-        # Remove trailing underscores
-        filename = filename.strip('_')
-        
-        # Normalize country name for folder (same normalization as club name)
-        pais_folder = pais.lower()
-        # Remove accents from country name (España -> espana, Turquía -> turquia)
-        nfd_pais = unicodedata.normalize('NFD', pais_folder)
-        pais_folder = ''.join(char for char in nfd_pais if unicodedata.category(char) != 'Mn')
-        # Replace special characters with underscore
-        pais_folder = re.sub(r'[^a-z0-9]+', '_', pais_folder)
-        pais_folder = pais_folder.strip('_')
-        
-        # Try different extensions in country subfolder
-        for ext in ['png', 'jpg', 'jpeg', 'svg']:
-            logo_path = Path(settings.IMAGES_DIR) / 'clubes' / pais_folder / f"{filename}.{ext}"
-            if logo_path.exists():
-                return f"/api/v1/static/clubes/{pais_folder}/{filename}.{ext}"
-        
-        # Fallback: try root clubes folder (for backwards compatibility)
-        for ext in ['png', 'jpg', 'jpeg', 'svg']:
-            logo_path = Path(settings.IMAGES_DIR) / 'clubes' / f"{filename}.{ext}"
-            if logo_path.exists():
-                return f"/api/v1/static/clubes/{filename}.{ext}"
+        # Resolved once per (club, country): the manifest is fixed until reload
+        datos = self.data_loader.snapshot
+        self._sincronizar_caches(datos)
+        key = (club_nombre, pais)
+        if key not in self._logo_urls:
+            # Club file name and country folder use the scraper's slug (text_utils.py)
+            # Examples: "Newell's" -> "newell_s", "San Martín (T)" -> "san_martin_t", España -> espana
+            manifest = datos.get_image_manifest()
+            self._logo_urls[key] = manifest.logo_url(
+                TextUtils.slugify(club_nombre),
+                TextUtils.slugify(pais)
+            )
         
-        return None
+        return self._logo_urls[key]
     
-    def _get_jugadores_con_clubes(self, clubs_permitidos: Set[str]) -> List[Dict]:
-        """Get players who played in Rosario Central AND in allowed clubs"""
-        jugadores = self.data_loader.get_all_jugadores()
-        result = []
+    def _sincronizar_caches(self, datos: DataSnapshot) -> None:
+        """Drop the pools and logo URLs derived from older data versions"""
+        if self._caches_version is None or datos.version > self._caches_version:
+            self._pools = {}
+            self._logo_urls = {}
+            self._caches_version = datos.version
+    
+    def _get_jugadores_elegibles(self, datos: DataSnapshot, categoria: str) -> Tuple[JugadorElegible, ...]:
+        """
+        Players who played in RC and in a club of the category
         
-        for jugador in jugadores:
-            clubes_historia = jugador.get('clubes_historia', [])
-            
-            # Check if played in Rosario Central
-            tiene_rc = any('rosario central' in c.get('nombre', '').lower() 
-                          for c in clubes_historia)
-            
-            if not tiene_rc:
-                continue
+        Pools are computed once per data version and never mutated, so
+        generation only samples from them.
+        
+        Args:
+            datos: Data snapshot the game is built from
+            categoria: 'Nacional', 'Internacional' or 'Latinoamérica'
+        """
+        self._sincronizar_caches(datos)
+        
+        # Keyed by version too: a generation that started before a reload
+        # must not pick up the pool of the new data
+        key = (datos.version, categoria)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = build_jugadores_elegibles(
+                datos.get_jugadores(),
+                self._get_all_clubs_by_category(categoria)
+            )
+            self._pools[key] = pool
+        
+        return pool
+    
+    @staticmethod
+    def _adyacencia_clubes(datos: DataSnapshot, clubes: List[str], posiciones: List[PosicionVacia]) -> List[Tuple[int, ...]]:
+        """Indices of the positions each club has Rosario Central players for"""
+        adyacencia = []
+        for club in clubes:
+            posiciones_club = datos.get_jugadores_rc_club(club)
+            adyacencia.append(tuple(i for i, p in enumerate(posiciones) if posiciones_club.get(p.posicion)))
+        return adyacencia
+    
+    @staticmethod
+    def _asignar_jugadores(
+        datos: DataSnapshot,
+        clubes: List[str],
+        posiciones: List[PosicionVacia],
+        asignacion: List[int]
+    ) -> List[int]:
+        """
+        A different player for each club at its assigned position (maximum
+        bipartite matching clubs -> players), or -1 for the clubs left out
+        """
+        candidatos = [
+            [j.id for j in datos.get_jugadores_rc_club(club).get(posiciones[i].posicion, ())] if i != -1 else []
+            for club, i in zip(clubes, asignacion)
+        ]
+        # Players renumbered 0..n-1 for the matching
+        numeros = {jugador_id: n for n, jugador_id in enumerate(sorted(set(chain.from_iterable(candidatos))))}
+        pareja = emparejamiento_maximo([[numeros[j] for j in ids] for ids in candidatos], len(numeros))
+        ids = sorted(numeros)
+        return [ids[n] if n != -1 else -1 for n in pareja]
+    
+    @staticmethod
+    def _pista_jugador(datos: DataSnapshot, jugador: Jugador, club_key: str) -> PistaJugador:
+        """Hint material of a player for a club (the other club is never that one)"""
+        otro_club = next(
+            (
+                club for club in jugador.clubes
+                if 'rosario central' not in club.lower() and datos.resolve_club(club) != club_key
+            ),
+            None
+        )
+        return PistaJugador(
+            id=jugador.id,
+            letra_inicial=jugador.apellido[0].upper() if jugador.apellido else '?',
+            posicion=jugador.posicion_principal or 'Desconocida',
+            otro_club=otro_club
+        )
+    
+    def _tabla_candidatos(
+        self,
+        datos: DataSnapshot,
+        clubes: List[str],
+        posiciones: List[PosicionVacia],
+        jugadores_asignados: List[int]
+    ) -> List[Dict[str, CandidatosPosicion]]:
+        """
+        Hint and reveal candidates of every (club, position) of a game
+        
+        Computed once with the definition, so hints and reveals only skip
+        the session's revealed players instead of looking the club up,
+        filtering and normalizing club names on every request.
+        
+        Returns:
+            Per club index: Dict[position] -> CandidatosPosicion (positions
+            with no player are left out)
+        """
+        tablas = []
+        codigos = list(dict.fromkeys(p.posicion for p in posiciones))
+        
+        for i, club in enumerate(clubes):
+            club_key = datos.resolve_club(club)
+            posiciones_club = datos.get_jugadores_rc_club(club)
+            asignado = jugadores_asignados[i]
+            reservados = set(jugadores_asignados[i + 1:])
+            # One PistaJugador per player, shared by the club's positions
+            pistas: Dict[int, PistaJugador] = {}
+            tabla: Dict[str, CandidatosPosicion] = {}
             
-            # Get clubs that are in the permitted list (normalize for comparison)
-            clubes_validos = []
-            for c in clubes_historia:
-                club_nombre = c['nombre']
-                # Skip Rosario Central
-                if 'rosario central' in club_nombre.lower():
-                    continue
+            for codigo in codigos:
+                libres: List[PistaJugador] = []
+                reservas: List[PistaJugador] = []
+                for jugador in posiciones_club.get(codigo, ()):
+                    pista = pistas.get(jugador.id)
+                    if pista is None:
+                        pista = pistas[jugador.id] = self._pista_jugador(datos, jugador, club_key)
+                    
+                    if jugador.id == asignado:
+                        libres.insert(0, pista)
+                    elif jugador.id in reservados:
+                        reservas.append(pista)
+                    else:
+                        libres.append(pista)
                 
-                # Check if this club matches any in the permitted list (normalized)
-                club_normalizado = self._normalize_text(club_nombre)
-                for club_permitido in clubs_permitidos:
-                    club_permitido_normalizado = self._normalize_text(club_permitido)
-                    if club_normalizado == club_permitido_normalizado:
-                        clubes_validos.append(club_nombre)
-                        break
+                if libres or reservas:
+                    tabla[codigo] = CandidatosPosicion(tuple(libres), tuple(reservas))
             
-            if clubes_validos and jugador.get('partidos', 0) >= 1:
-                jugador['clubes_validos'] = clubes_validos
-                result.append(jugador)
+            tablas.append(tabla)
         
-        return result
+        return tablas
     
-    def _generar_lista_clubes(self, jugadores: List[Dict], posiciones: List[PosicionVacia], rng: random.Random) -> List[str]:
-        """Generate ordered list of clubs to show (one per position)"""
+    def _generar_lista_clubes(
+        self,
+        datos: DataSnapshot,
+        jugadores: Tuple[JugadorElegible, ...],
+        posiciones: List[PosicionVacia],
+        rng: random.Random
+    ) -> Tuple[List[str], List[Tuple[int, ...]], List[int], List[int]]:
+        """
+        Generate ordered list of clubs to show (one per position)
+        
+        The clubs are drawn again (same rng, so the same list every time)
+        until each one can be given a different position it has players for
+        and a different player for that position (maximum bipartite
+        matchings clubs -> positions and clubs -> players), so the team can
+        always be completed.
+        
+        Returns:
+            (clubs, positions each club has players for, position assigned
+            to each club, player assigned to each club)
+        
+        Raises:
+            ValueError: If no draw completes the team within SORTEOS_LISTA_CLUBES
+        """
         # Get all unique clubs
         todos_clubes = set()
         for jugador in jugadores:
-            todos_clubes.update(jugador.get('clubes_validos', []))
+            todos_clubes.update(jugador.clubes_validos)
         
-        todos_clubes_list = list(todos_clubes)
-        rng.shuffle(todos_clubes_list)
+        # Sorted first: set order depends on the process hash seed
+        todos_clubes_list = sorted(todos_clubes)
+        if len(todos_clubes_list) < len(posiciones):
+            raise ValueError(f"No hay suficientes clubes ({len(todos_clubes_list)}) para el juego")
         
-        # Need as many clubs as positions (11)
-        clubes_orden = todos_clubes_list[:len(posiciones)]
+        for _ in range(self.SORTEOS_LISTA_CLUBES):
+            rng.shuffle(todos_clubes_list)
+            
+            # Need as many clubs as positions (11)
+            clubes_orden = todos_clubes_list[:len(posiciones)]
+            adyacencia = self._adyacencia_clubes(datos, clubes_orden, posiciones)
+            asignacion = emparejamiento_maximo(adyacencia, len(posiciones))
+            jugadores_asignados = self._asignar_jugadores(datos, clubes_orden, posiciones, asignacion)
+            
+            if -1 not in jugadores_asignados:
+                return clubes_orden, adyacencia, asignacion, jugadores_asignados
         
-        return clubes_orden
+        raise ValueError(
+            f"Ninguna lista de clubes completa el equipo después de {self.SORTEOS_LISTA_CLUBES} sorteos"
+        )
     
-    def _elegir_formacion(self, rng: random.Random) -> Tuple[str, List[Dict]]:
+    def _elegir_formacion(self, game_type: str, fecha: date) -> Tuple[str, List[Dict]]:
         """
-        Choose a formation that hasn't been used today
+        Choose the formation of an Equipo del Día game
+        
+        The formations of a date are shuffled with the date's seed and dealt
+        to the Equipo games in JUEGOS_DEL_DIA order, so games of the same day
+        don't repeat a formation and the choice doesn't depend on which game
+        a process happens to generate first.
         
         Returns:
             Tuple of (formation_name, positions_list)
         """
-        formaciones_disponibles = list(self.formaciones_data['formaciones'].keys())
-        
-        # Filter out formations already used today
-        formaciones_no_usadas = [f for f in formaciones_disponibles if f not in self._formaciones_usadas_hoy]
-        
-        # If all have been used, reset
-        if not formaciones_no_usadas:
-            self._formaciones_usadas_hoy.clear()
-            formaciones_no_usadas = formaciones_disponibles
+        formaciones = sorted(self.formaciones_data['formaciones'].keys())
+        random.Random(self._get_daily_seed('formaciones', fecha)).shuffle(formaciones)
         
-        # Choose one
-        formacion_elegida = rng.choice(formaciones_no_usadas)
-        self._formaciones_usadas_hoy.add(formacion_elegida)
+        equipos = [t for t in self.JUEGOS_DEL_DIA if t in self.CATEGORIAS]
+        formacion_elegida = formaciones[equipos.index(game_type) % len(formaciones)]
         
         # Get positions list
         posiciones_config = self.formaciones_data['formaciones'][formacion_elegida]['posiciones']
         
         return formacion_elegida, posiciones_config
     
-    def _generate_equipo_del_dia(self, game_type: str, clubs_permitidos: Set[str]) -> EquipoDelDiaGame:
-        """Generate Equipo del Día game with new mechanics"""
-        seed = self._get_daily_seed(game_type)
+    def _crear_equipo_del_dia(self, game_type: str, categoria: str, fecha: date) -> Dict[str, Any]:
+        """
+        Build the shared definition of an Equipo del Día game
+        
+        The definition is the same for every player of the day; each
+        session only stores its progress (see _nuevo_progreso_equipo).
+        """
+        seed = self._get_daily_seed(game_type, fecha)
         rng = random.Random(seed)
-        game_id = self._get_game_id(game_type)
+        # The game keeps using this snapshot after a data reload: the player
+        # ids in its sessions' progress point into it
+        datos = self.data_loader.snapshot
         
-        # Get players who played in RC + permitted clubs
-        jugadores = self._get_jugadores_con_clubes(clubs_permitidos)
+        # Get players who played in RC + clubs of the category (precomputed pool)
+        jugadores = self._get_jugadores_elegibles(datos, categoria)
         
         if len(jugadores) < 11:
             raise ValueError(f"No hay suficientes jugadores ({len(jugadores)}) para el juego")
         
         # Choose formation (ensuring no repetition within the day)
-        formacion_nombre, posiciones_config = self._elegir_formacion(rng)
+        formacion_nombre, posiciones_config = self._elegir_formacion(game_type, fecha)
         
         # Create empty positions based on formation config (coordinate-based structure)
         posiciones = []
@@ -396,36 +518,59 @@ class GameGeneratorService:
                 y=pos_def['pos']['y']   # Coordenada Y
             ))
         
-        # Generate club list (11 clubs, one per position)
-        clubes_list = self._generar_lista_clubes(jugadores, posiciones, rng)
-        
-        # Select first club
-        primer_club = clubes_list[0] if clubes_list else "River Plate"
+        # Generate club list (11 clubs, one per position) and the position
+        # each club fills in a complete team
+        clubes_list, adyacencia, asignacion, jugadores_asignados = self._generar_lista_clubes(
+            datos, jugadores, posiciones, rng
+        )
         
         # Select a coach
-        tecnicos_jugadores = self.data_loader.load_tecnicos_jugadores()
+        tecnicos_jugadores = datos.load_tecnicos_jugadores()
         tecnicos = list(tecnicos_jugadores.get('tecnicos', {}).keys())
         entrenador = rng.choice(tecnicos) if tecnicos else "Miguel Russo"
         
-        # Store game state in cache
-        self._games_cache[game_id] = {
+        # Salted answer hashes for clients that verify guesses locally
+        verificacion = build_verificacion_equipo(
+            sal_del_juego(self._get_game_id(game_type, fecha), seed),
+            [(self._normalize_text(c), datos.resolve_club(c)) for c in clubes_list],
+            datos.get_jugadores_por_nombre(),
+            datos.get_tecnicos_por_nombre()
+        )
+        
+        return {
+            'game_type': game_type,
+            'fecha': fecha.isoformat(),
             'clubes_list': clubes_list,
-            'clubes_index': 0,
-            # 'jugadores': jugadores,  # ❌ REMOVED: No longer needed - we search all players now
             'formacion_nombre': formacion_nombre,
             'posiciones_config': posiciones_config,
-            'posiciones': [p.model_dump() for p in posiciones],
+            'posiciones': [p.model_dump() for p in posiciones],  # Plantilla, nunca se modifica
+            'adyacencia': adyacencia,  # Posiciones con jugadores de cada club
+            'asignacion': asignacion,  # Posición de cada club en un equipo completo
+            'jugadores_asignados': jugadores_asignados,  # Y el jugador que la ocupa
+            'candidatos': self._tabla_candidatos(datos, clubes_list, posiciones, jugadores_asignados),  # Pistas y revelados
             'entrenador': entrenador,
             'categoria': game_type.replace('equipo_', ''),
-            'jugadores_revelados': set()  # ✅ Track already revealed players
+            'verificacion': verificacion,
+            'datos': datos
         }
+    
+    def _generate_equipo_del_dia(self, game_type: str, session_id: Optional[str] = None) -> EquipoDelDiaGame:
+        """Generate Equipo del Día game with new mechanics (starts a new game for the session)"""
+        game_id = self._get_game_id(game_type)
+        definicion = self._get_definicion(game_id)
+        
+        # Loading the game starts over: forget the session's previous progress
+        self.reiniciar_partida(game_id, session_id)
+        
+        primer_club = definicion['clubes_list'][0]
+        entrenador = definicion['entrenador']
         
         return EquipoDelDiaGame(
             game_id=game_id,
-            fecha=date.today().isoformat(),
+            fecha=definicion['fecha'],
             tipo=game_type,
-            formacion=formacion_nombre,
-            posiciones=posiciones,
+            formacion=definicion['formacion_nombre'],
+            posiciones=[PosicionVacia(**p) for p in definicion['posiciones']],
             club_actual=ClubActual(
                 nombre=primer_club,
                 logo_url=self._get_logo_url(primer_club),
@@ -438,96 +583,503 @@ class GameGeneratorService:
             pistas_disponibles=3
         )
     
-    def generate_equipo_nacional(self) -> EquipoDelDiaGame:
+    def generate_equipo_nacional(self, session_id: Optional[str] = None) -> EquipoDelDiaGame:
         """Generate Equipo Nacional del Día"""
-        clubs_argentinos = self._get_all_clubs_by_category('Nacional')
-        return self._generate_equipo_del_dia('equipo_nacional', clubs_argentinos)
+        return self._generate_equipo_del_dia('equipo_nacional', session_id)
     
-    def generate_equipo_europeo(self) -> EquipoDelDiaGame:
+    def generate_equipo_europeo(self, session_id: Optional[str] = None) -> EquipoDelDiaGame:
         """Generate Equipo Europeo del Día"""
-        clubs_europeos = self._get_all_clubs_by_category('Internacional')
-        return self._generate_equipo_del_dia('equipo_europeo', clubs_europeos)
+        return self._generate_equipo_del_dia('equipo_europeo', session_id)
     
-    def generate_equipo_latinoamericano(self) -> EquipoDelDiaGame:
+    def generate_equipo_latinoamericano(self, session_id: Optional[str] = None) -> EquipoDelDiaGame:
         """Generate Equipo Latinoamericano del Día"""
-        clubs_latinoamericanos = self._get_all_clubs_by_category('Latinoamérica')
-        return self._generate_equipo_del_dia('equipo_latinoamericano', clubs_latinoamericanos)
+        return self._generate_equipo_del_dia('equipo_latinoamericano', session_id)
+    
+    # ========================
+    # ESTADO DE PARTIDA
+    # ========================
+    
+    def _crear_definicion(self, game_type: str, fecha: date) -> Dict[str, Any]:
+        """Build the definition of a daily game for a game date"""
+        if game_type == 'clasico':
+            return self._crear_clasico_del_dia(fecha)
+        return self._crear_equipo_del_dia(game_type, self.CATEGORIAS[game_type], fecha)
+    
+    def _get_definicion(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the shared definition of a game, building it if it is today's
+        
+        Returns:
+            Game definition or None if the game_id is unknown or from another day
+        """
+        definicion = self._games_cache.get(game_id)
+        if definicion is not None:
+            return definicion
+        
+        # Not pre-generated (e.g. scheduler disabled): build it on demand
+        game_type = game_id.rsplit('_', 1)[0]
+        if game_type not in self.JUEGOS_DEL_DIA or game_id != self._get_game_id(game_type):
+            return None
+        
+        return self._generar_una_vez(game_id, game_type, DateUtils.fecha_juego())
+    
+    def _generar_una_vez(self, game_id: str, game_type: str, fecha: date) -> Dict[str, Any]:
+        """
+        Build and publish a game definition, once (single-flight)
+        
+        Concurrent requests for a game that is not built yet wait for the
+        first one instead of all generating it.
+        """
+        with self._generando_lock:
+            lock = self._generando.setdefault(game_id, threading.Lock())
+        
+        try:
+            with lock:
+                definicion = self._games_cache.get(game_id)
+                if definicion is None:
+                    definicion = self._crear_definicion(game_type, fecha)
+                    self._publicar_definiciones({game_id: definicion})
+        finally:
+            with self._generando_lock:
+                self._generando.pop(game_id, None)
+        
+        return definicion
     
-    def verificar_respuesta(self, game_id: str, game_type: str, respuesta: str) -> Dict[str, Any]:
+    def _publicar_definiciones(self, definiciones: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Add game definitions to the cache, dropping games older than today
+        
+        The cache is never modified in place: a new dict is built and swapped
+        in with a single assignment, so readers always see a complete cache.
+        """
+        hoy = DateUtils.fecha_juego().strftime('%Y%m%d')
+        # Writers are serialized so no publication is lost; readers never lock
+        with self._publicar_lock:
+            cache = {
+                game_id: definicion
+                for game_id, definicion in self._games_cache.items()
+                if game_id.rsplit('_', 1)[-1] >= hoy
+            }
+            cache.update(definiciones)
+            self._games_cache = cache
+    
+    def pregenerar_juegos(self, fecha: date) -> List[str]:
+        """
+        Build and publish every daily game of a game date
+        
+        Called by the scheduler ahead of the day rollover, so no request
+        has to pay for generating the new games. Games already built (or
+        being built by a request) are not generated again.
+        
+        Args:
+            fecha: Game date
+        
+        Returns:
+            Game IDs generated (a game that cannot be built is left out)
+        """
+        game_ids = []
+        for game_type in self.JUEGOS_DEL_DIA:
+            game_id = self._get_game_id(game_type, fecha)
+            try:
+                self._generar_una_vez(game_id, game_type, fecha)
+            except ValueError as e:
+                # One game that cannot be built must not hold back the others
+                print(f"Warning: could not pre-generate {game_id}: {e}")
+                continue
+            game_ids.append(game_id)
+        
+        return game_ids
+    
+    def get_verificacion(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Client-side verification bundle of a daily game
+        (see app/services/answer_verification.py)
+        
+        Returns:
+            Salted answer hashes, or None if the game is unknown
+        """
+        definicion = self._get_definicion(game_id)
+        return definicion.get('verificacion') if definicion else None
+    
+    def descartar_juegos_anteriores(self) -> None:
+        """Drop the definitions of games older than today"""
+        self._publicar_definiciones({})
+    
+    def cerrar_store(self) -> None:
+        """Close the session store (the prefork master does it before forking)"""
+        if self._game_states is not None:
+            self._game_states.close()
+    
+    def reabrir_store(self) -> None:
+        """Reopen the session store in a forked worker"""
+        if self._game_states is not None:
+            self._game_states.reopen()
+    
+    def get_game_id_del_dia(self, game_type: str) -> str:
+        """Game ID of today's game of a type"""
+        return self._get_game_id(game_type)
+    
+    @property
+    def progreso_en_cliente(self) -> bool:
+        """True in token mode: the server keeps no progress, responses only depend on the request"""
+        return self._progress_tokens is not None
+    
+    def get_progreso(
+        self,
+        game_id: str,
+        session_id: Optional[str] = None,
+        progress_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Current progress of a player in a game (a new one if there is none)"""
+        nuevo = self._nuevo_progreso_clasico if game_id.startswith('clasico_') else self._nuevo_progreso_equipo
+        return self._load_progreso(game_id, session_id, nuevo, progress_token)
+    
+    def reiniciar_partida(self, game_id: str, session_id: Optional[str] = None) -> None:
+        """Forget a session's progress in a game (nothing to do in token mode)"""
+        if self._game_states is not None:
+            self._game_states.delete(self._session_key(game_id, session_id))
+    
+    @staticmethod
+    def _session_key(game_id: str, session_id: Optional[str]) -> str:
+        """Store key of a player's progress (no session = shared progress)"""
+        return f"{game_id}:{session_id or ''}"
+    
+    def _load_progreso(
+        self,
+        game_id: str,
+        session_id: Optional[str],
+        nuevo,
+        progress_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a player's progress, or a new one built by `nuevo`
+        
+        In token mode the progress comes from the client's signed token
+        (an invalid or missing token starts a new game); otherwise from the
+        session store.
+        """
+        if self._progress_tokens is not None:
+            progreso = self._progress_tokens.decode(progress_token, game_id) if progress_token else None
+        else:
+            key = self._session_key(game_id, session_id)
+            progreso = self._game_states.get(key)
+            # Callers update it in place: keep what was read for the save
+            self._progreso_leido.key = key
+            self._progreso_leido.estado = copy.deepcopy(progreso)
+        
+        return progreso if progreso is not None else nuevo()
+    
+    def _save_progreso(
+        self,
+        game_id: str,
+        session_id: Optional[str],
+        progreso: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Save a player's progress and return the response
+        
+        In token mode nothing is stored: the signed progress is added to the
+        response as 'progress_token' for the client to send back.
+        
+        Raises:
+            StaleStateError: If another worker saved this session's progress
+                after it was loaded (AsyncGameService.run_locked retries)
+        """
+        if self._progress_tokens is not None:
+            result['progress_token'] = self._progress_tokens.encode(game_id, progreso)
+        else:
+            key = self._session_key(game_id, session_id)
+            leido = self._progreso_leido.estado if getattr(self._progreso_leido, 'key', None) == key else None
+            if not self._game_states.replace(key, leido, progreso):
+                raise StaleStateError(key)
+        
+        return result
+    
+    @staticmethod
+    def _nuevo_progreso_equipo() -> Dict[str, Any]:
+        """
+        Progress of an Equipo del Día game
+        
+        - clubes_index: Current club in the definition's clubes_list
+        - revelados: Bitmask of revealed positions
+        - jugadores: [position index, player id] pairs, in reveal order
+        - entrenador_revelado: Coach guessed
+        - pendiente_jugadores: Player ids to choose from (same surname), optional
+        - pendiente_posicion: {'jugador': id, 'indices': [...]} to choose from, optional
+        """
+        return {
+            'clubes_index': 0,
+            'revelados': 0,
+            'jugadores': [],
+            'entrenador_revelado': False
+        }
+    
+    def _posiciones_equipo(self, definicion: Dict[str, Any], progreso: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Positions of the definition with the session's revealed players filled in"""
+        posiciones = [dict(p) for p in definicion['posiciones']]
+        
+        for pos_index, jugador_id in progreso['jugadores']:
+            jugador = definicion['datos'].get_jugador(jugador_id)
+            posiciones[pos_index].update(
+                revelado=True,
+                jugador_nombre=jugador.nombre,
+                jugador_apellido=jugador.apellido,
+                image_url=self._get_jugador_image_url(jugador)
+            )
+        
+        return posiciones
+    
+    @staticmethod
+    def _revelar_posicion(progreso: Dict[str, Any], pos_index: int, jugador_id: int) -> None:
+        """Assign a player to a position"""
+        progreso['revelados'] |= 1 << pos_index
+        progreso['jugadores'].append([pos_index, jugador_id])
+    
+    @staticmethod
+    def _jugadores_revelados(progreso: Dict[str, Any]) -> Set[int]:
+        """Ids of the players already revealed"""
+        return {jugador_id for _, jugador_id in progreso['jugadores']}
+    
+    @staticmethod
+    def _posiciones_libres(definicion: Dict[str, Any], progreso: Dict[str, Any], posiciones_jugador: Sequence[str]) -> List[Dict[str, Any]]:
+        """Empty positions a player can occupy, as {'posicion', 'index'}"""
+        revelados = progreso['revelados']
+        return [
+            {'posicion': pos['posicion'], 'index': i}
+            for i, pos in enumerate(definicion['posiciones'])
+            if not revelados & (1 << i) and pos['posicion'] in posiciones_jugador
+        ]
+    
+    @staticmethod
+    def _posicion_para_club(definicion: Dict[str, Any], progreso: Dict[str, Any]) -> Optional[int]:
+        """
+        Empty position for the current club's hints and reveals
+        
+        The one the generation assigned to the club while it is still empty.
+        Once the session filled it with another club's player, the clubs
+        left are matched again against the empty positions (11 x 11 at most),
+        so the one chosen still lets the rest of the clubs complete the team.
+        """
+        indice = progreso['clubes_index']
+        if indice >= len(definicion['clubes_list']):
+            return None
+        
+        revelados = progreso['revelados']
+        asignada = definicion['asignacion'][indice]
+        if asignada != -1 and not revelados & (1 << asignada):
+            return asignada
+        
+        adyacencia = [
+            [i for i in posiciones if not revelados & (1 << i)]
+            for posiciones in definicion['adyacencia'][indice:]
+        ]
+        asignacion = emparejamiento_maximo(adyacencia, len(definicion['posiciones']))
+        return asignacion[0] if asignacion[0] != -1 else None
+    
+    @staticmethod
+    def _avanzar_club(definicion: Dict[str, Any], progreso: Dict[str, Any]) -> str:
+        """Move to the next club (stays on the last one) and return it"""
+        clubes_list = definicion['clubes_list']
+        progreso['clubes_index'] = min(progreso['clubes_index'] + 1, len(clubes_list) - 1)
+        return clubes_list[progreso['clubes_index']]
+    
+    @staticmethod
+    def _equipo_completo(progreso: Dict[str, Any]) -> bool:
+        """Victoria: 11 jugadores + 1 técnico = 12 personas"""
+        return bin(progreso['revelados']).count('1') >= 11 and progreso['entrenador_revelado']
+    
+    def _club_info(self, club_nombre: str) -> Dict[str, Any]:
+        """Club payload for responses (nuevo_club)"""
+        return {
+            'nombre': club_nombre,
+            'logo_url': self._get_logo_url(club_nombre),
+            'pais': self._get_club_country(club_nombre) or "Desconocido"
+        }
+    
+    def _asignar_jugador(
+        self,
+        definicion: Dict[str, Any],
+        progreso: Dict[str, Any],
+        jugador_id: int,
+        posicion_elegida: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Reveal a guessed player at a position and move to the next club"""
+        jugador = definicion['datos'].get_jugador(jugador_id)
+        posicion_asignada = posicion_elegida['posicion']
+        
+        # Assign to position (also marks this player as revealed)
+        self._revelar_posicion(progreso, posicion_elegida['index'], jugador_id)
+        
+        # Move to next club
+        club_actual = definicion['clubes_list'][progreso['clubes_index']]
+        next_club = self._avanzar_club(definicion, progreso)
+        
+        # ✅ Verificar victoria: 11 jugadores + 1 técnico = 12 personas
+        game_over = self._equipo_completo(progreso)
+        victoria = game_over
+        
+        mensaje = f'¡Correcto! {jugador.nombre} - {posicion_asignada}'
+        if victoria:
+            mensaje = f'🎉 ¡Felicitaciones! Completaste el equipo con {jugador.nombre}'
+        
+        return {
+            'correcto': True,
+            'mensaje': mensaje,
+            'jugador_revelado': {
+                'nombre': jugador.nombre,
+                'apellido': jugador.apellido,
+                'posicion': posicion_asignada,
+                'club': club_actual,
+                'image_url': self._get_jugador_image_url(jugador)
+            },
+            'posicion_asignada': posicion_asignada,
+            'nuevo_club': self._club_info(next_club),
+            'game_over': game_over,
+            'victoria': victoria
+        }
+    
+    def _ubicar_jugador(self, definicion: Dict[str, Any], progreso: Dict[str, Any], jugador_id: int) -> Dict[str, Any]:
+        """Assign a player to his only position type, or ask the user to choose one"""
+        jugador = definicion['datos'].get_jugador(jugador_id)
+        
+        # Find ALL available positions that this player can occupy
+        posiciones_disponibles = self._posiciones_libres(definicion, progreso, jugador.posiciones)
+        
+        if not posiciones_disponibles:
+            return {
+                'correcto': False,
+                'mensaje': f'{jugador.nombre} no puede ocupar ninguna posición vacía'
+            }
+        
+        # Get unique position types available
+        posiciones_unicas = list(set(p['posicion'] for p in posiciones_disponibles))
+        
+        # If multiple position TYPES available, ask user to choose
+        if len(posiciones_unicas) > 1:
+            # Store pending player in the session's progress
+            progreso['pendiente_posicion'] = {
+                'jugador': jugador_id,
+                'indices': [p['index'] for p in posiciones_disponibles]
+            }
+            
+            return {
+                'correcto': True,
+                'requiere_seleccion': True,
+                'mensaje': f'¡Correcto! {jugador.nombre} puede jugar en varias posiciones. Elegí una:',
+                'jugador_revelado': {
+                    'nombre': jugador.nombre,
+                    'apellido': jugador.apellido,
+                    'image_url': self._get_jugador_image_url(jugador)
+                },
+                'posiciones_disponibles': sorted(posiciones_unicas)  # Unique positions only, sorted
+            }
+        
+        # Only one position available, assign automatically
+        return self._asignar_jugador(definicion, progreso, jugador_id, posiciones_disponibles[0])
+    
+    def verificar_respuesta(self, game_id: str, game_type: str, respuesta: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """Verify player guess - NEW LOGIC"""
         # Normalize user input (remove accents, lowercase)
         respuesta_normalizada = self._normalize_text(respuesta.strip())
         
-        # Get game state
-        if game_id not in self._games_cache:
-            # Regenerate game
-            if 'nacional' in game_type:
-                self.generate_equipo_nacional()
-            elif 'europeo' in game_type:
-                self.generate_equipo_europeo()
-            elif 'latinoamericano' in game_type:
-                self.generate_equipo_latinoamericano()
-        
-        game_state = self._games_cache.get(game_id)
-        if not game_state:
+        # Get game definition (regenerated if it is today's and not cached)
+        definicion = self._get_definicion(game_id)
+        if not definicion:
             return {'correcto': False, 'mensaje': 'Juego no encontrado'}
         
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_equipo, progress_token)
+        result = self._verificar_respuesta(definicion, progreso, respuesta_normalizada)
+        return self._save_progreso(game_id, session_id, progreso, result)
+    
+    def verificar_respuestas(
+        self,
+        game_id: str,
+        game_type: str,
+        respuestas: Sequence[str],
+        session_id: Optional[str] = None,
+        progress_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify several queued guesses in order, as consecutive verificar_respuesta
+        calls would, loading and saving the progress once
+        
+        Stops after a guess that ends the game or asks the user to choose a
+        position / player: the guesses after it are not applied, the client
+        sends them again once the choice is made.
+        
+        Args:
+            game_id: Game ID
+            game_type: Game type
+            respuestas: Guesses, in the order they were made
+            session_id: Player session
+            progress_token: Signed progress (token mode)
+        
+        Returns:
+            Dict with 'resultados' (one per applied guess) and, in token
+            mode, the final 'progress_token'
+        """
+        definicion = self._get_definicion(game_id)
+        if not definicion:
+            return {'resultados': [{'correcto': False, 'mensaje': 'Juego no encontrado'}]}
+        
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_equipo, progress_token)
+        resultados = []
+        for respuesta in respuestas:
+            result = self._verificar_respuesta(definicion, progreso, self._normalize_text(respuesta.strip()))
+            resultados.append(result)
+            if result.get('game_over') or result.get('requiere_seleccion') or result.get('requiere_seleccion_jugador'):
+                break
+        
+        return self._save_progreso(game_id, session_id, progreso, {'resultados': resultados})
+    
+    def _verificar_respuesta(self, definicion: Dict[str, Any], progreso: Dict[str, Any], respuesta_normalizada: str) -> Dict[str, Any]:
+        """Verify a normalized guess against the session's progress (updates it)"""
         # Get current club
-        club_index = game_state['clubes_index']
-        club_actual = game_state['clubes_list'][club_index]
-        
-        # Check if it's a coach that managed the current club
-        tecnicos_data = self.data_loader.load_tecnicos()
-        tecnicos_dict = tecnicos_data.get('tecnicos', {})
-        
-        tecnico_encontrado = None
-        for tecnico_nombre, tecnico_info in tecnicos_dict.items():
-            # Normalize coach names
-            tecnico_apellido = tecnico_nombre.split()[-1]
-            tecnico_apellido_normalizado = self._normalize_text(tecnico_apellido)
-            tecnico_nombre_completo_normalizado = self._normalize_text(tecnico_nombre)
+        club_actual = definicion['clubes_list'][progreso['clubes_index']]
+        
+        # Check if it's a coach that managed the current club (coach index, O(1))
+        datos = definicion['datos']
+        club_actual_key = datos.resolve_club(club_actual)
+        tecnico_entry = datos.tecnico_dirigio_club(respuesta_normalizada, club_actual_key)
+        
+        # Search for ALL players matching the input
+        # 🔧 FIX: Search in ALL players, not just the game's players
+        # This allows any player who played in RC + current club to be valid
+        # Name index: one lookup by normalized apellido / full name, then a set membership test
+        jugadores_encontrados = []
+        if tecnico_entry is None:
+            jugadores_encontrados = [
+                entry
+                for entry in datos.buscar_jugadores_por_nombre(respuesta_normalizada)
+                if entry.tiene_rc and club_actual_key in entry.clubes_norm
+            ]
             
-            # Check if the user's answer matches this coach
-            if (tecnico_apellido_normalizado == respuesta_normalizada or 
-                tecnico_nombre_completo_normalizado == respuesta_normalizada):
-                
-                # Check if this coach managed the current club
-                clubes_historia = tecnico_info.get('clubes_historia', [])
-                for club_periodo in clubes_historia:
-                    club_nombre = club_periodo.get('club', '')
-                    if self._normalize_text(club_nombre) == self._normalize_text(club_actual):
-                        tecnico_encontrado = tecnico_nombre
-                        break
-                
-                if tecnico_encontrado:
-                    break
+            if not jugadores_encontrados:
+                # Typos ("Dimaria", "Rubne"): closest coach or players of this club
+                tecnico_entry, jugadores_encontrados = datos.corregir_respuesta(respuesta_normalizada, club_actual_key)
+        
+        tecnico_encontrado = tecnico_entry.nombre if tecnico_entry else None
         
         if tecnico_encontrado:
             # Verificar si el técnico ya fue revelado
-            if game_state.get('entrenador_revelado', False):
+            if progreso['entrenador_revelado']:
                 return {
                     'correcto': False,
                     'mensaje': 'El técnico ya fue adivinado'
                 }
             
             # Get tecnico info for image
-            tecnico_info = tecnicos_dict.get(tecnico_encontrado, {})
+            tecnico_info = tecnico_entry.tecnico
             
             # Marcar técnico como revelado
-            game_state['entrenador_revelado'] = True
+            progreso['entrenador_revelado'] = True
             
             # ✅ Cambiar al siguiente club (igual que con jugadores)
-            club_index = game_state['clubes_index']
-            game_state['clubes_index'] = min(club_index + 1, len(game_state['clubes_list']) - 1)
-            next_club = game_state['clubes_list'][game_state['clubes_index']]
+            next_club = self._avanzar_club(definicion, progreso)
             
             # ✅ Verificar si el juego terminó (11 jugadores + 1 técnico = 12 personas)
-            posiciones = game_state['posiciones']
-            jugadores_revelados = sum(1 for p in posiciones if p.get('revelado', False))
-            entrenador_revelado = game_state.get('entrenador_revelado', False)
-            
-            # Victoria si 11 jugadores + técnico revelados
-            game_over = (jugadores_revelados >= 11 and entrenador_revelado)
+            game_over = self._equipo_completo(progreso)
             victoria = game_over
             
             mensaje = f'¡Correcto! DT: {tecnico_encontrado}'
@@ -544,47 +1096,11 @@ class GameGeneratorService:
                     'image_url': self._get_tecnico_image_url(tecnico_info)
                 },
                 'posicion_asignada': 'DT',
-                'nuevo_club': {
-                    'nombre': next_club,
-                    'logo_url': self._get_logo_url(next_club),
-                    'pais': self._get_club_country(next_club) or "Desconocido"
-                },
+                'nuevo_club': self._club_info(next_club),
                 'game_over': game_over,
                 'victoria': victoria
             }
         
-        # Search for ALL players matching the input
-        # 🔧 FIX: Search in ALL players, not just game_state players
-        # This allows any player who played in RC + current club to be valid
-        all_jugadores = self.data_loader.get_all_jugadores()
-        jugadores_encontrados = []
-        
-        for jugador in all_jugadores:
-            # Use 'apellido' field if available, fallback to splitting nombre
-            apellido_original = jugador.get('apellido', jugador['nombre'].split()[-1])
-            apellido_normalizado = self._normalize_text(apellido_original)
-            nombre_completo_normalizado = self._normalize_text(jugador['nombre'])
-            
-            # Match by apellido or full name (both normalized)
-            if apellido_normalizado == respuesta_normalizada or nombre_completo_normalizado == respuesta_normalizada:
-                # 🔧 FIX: Check if played in Rosario Central first
-                clubes_historia = jugador.get('clubes_historia', [])
-                tiene_rc = any('rosario central' in c.get('nombre', '').lower() for c in clubes_historia)
-                
-                if not tiene_rc:
-                    continue
-                
-                # Check if played in current club (normalize club names for comparison)
-                club_actual_normalizado = self._normalize_text(club_actual)
-                
-                # Check if any of the player's clubs matches the current club
-                for club_hist in clubes_historia:
-                    club_nombre = club_hist.get('nombre', '')
-                    club_normalizado = self._normalize_text(club_nombre)
-                    if club_actual_normalizado == club_normalizado:
-                        jugadores_encontrados.append(jugador)
-                        break  # ✅ Break ONLY if we found a match
-        
         if not jugadores_encontrados:
             return {
                 'correcto': False,
@@ -592,41 +1108,28 @@ class GameGeneratorService:
             }
         
         # ✅ NUEVO: Si hay múltiples jugadores con el mismo apellido, filtrar por posiciones disponibles
-        posiciones = game_state['posiciones']
-        
-        # ✅ Get set of already revealed players (by normalized name)
-        if 'jugadores_revelados' not in game_state:
-            game_state['jugadores_revelados'] = set()
+        # ✅ Players already revealed in this session (by id)
+        jugadores_revelados = self._jugadores_revelados(progreso)
         
         jugadores_con_posiciones = []
         
-        for jugador in jugadores_encontrados:
+        for entry in jugadores_encontrados:
             # ✅ Check if this specific player was already revealed
-            jugador_nombre_normalizado = self._normalize_text(jugador['nombre'])
-            if jugador_nombre_normalizado in game_state['jugadores_revelados']:
+            if entry.id in jugadores_revelados:
                 continue  # Skip, this player was already revealed
             
-            posiciones_jugador = self._get_all_valid_positions(jugador)
             # Check if this player can occupy any available position
-            puede_jugar = False
-            for pos in posiciones:
-                if not pos['revelado'] and pos['posicion'] in posiciones_jugador:
-                    puede_jugar = True
-                    break
-            
-            if puede_jugar:
-                jugadores_con_posiciones.append(jugador)
+            if self._posiciones_libres(definicion, progreso, entry.posiciones):
+                jugadores_con_posiciones.append(entry)
         
         if not jugadores_con_posiciones:
             # ✅ Check if the player was found but already revealed
-            if jugadores_encontrados:
-                jugador_ejemplo = jugadores_encontrados[0]
-                jugador_nombre_norm = self._normalize_text(jugador_ejemplo['nombre'])
-                if jugador_nombre_norm in game_state['jugadores_revelados']:
-                    return {
-                        'correcto': False,
-                        'mensaje': f'{jugador_ejemplo["nombre"]} ya fue adivinado'
-                    }
+            jugador_ejemplo = jugadores_encontrados[0]
+            if jugador_ejemplo.id in jugadores_revelados:
+                return {
+                    'correcto': False,
+                    'mensaje': f'{jugador_ejemplo.nombre} ya fue adivinado'
+                }
             
             return {
                 'correcto': False,
@@ -635,12 +1138,9 @@ class GameGeneratorService:
         
         # ✅ NUEVO: Si hay múltiples jugadores válidos, pedir selección
         if len(jugadores_con_posiciones) > 1:
-            game_state['pending_player_selection'] = {
-                'jugadores': jugadores_con_posiciones,
-                'apellido': respuesta.strip()
-            }
+            progreso['pendiente_jugadores'] = [entry.id for entry in jugadores_con_posiciones]
             
-            opciones = [f"{j['nombre']}" for j in jugadores_con_posiciones]
+            opciones = [entry.nombre for entry in jugadores_con_posiciones]
             
             return {
                 'correcto': True,
@@ -650,370 +1150,135 @@ class GameGeneratorService:
             }
         
         # Solo hay un jugador válido
-        jugador_encontrado = jugadores_con_posiciones[0]
-        
-        # Find available positions for this player
-        posiciones = game_state['posiciones']
-        # Get all valid positions for this player (from posiciones list)
-        posiciones_jugador = self._get_all_valid_positions(jugador_encontrado)
-        
-        # Find ALL available positions that this player can occupy
-        posiciones_disponibles = []
-        for i, pos in enumerate(posiciones):
-            if not pos['revelado']:
-                pos_type = pos['posicion']
-                if pos_type in posiciones_jugador:
-                    posiciones_disponibles.append({
-                        'posicion': pos_type,
-                        'index': i
-                    })
-        
-        if not posiciones_disponibles:
-            return {
-                'correcto': False,
-                'mensaje': f'{jugador_encontrado["nombre"]} no puede ocupar ninguna posición vacía'
-            }
-        
-        # Get unique position types available
-        posiciones_unicas = list(set(p['posicion'] for p in posiciones_disponibles))
-        
-        # If multiple position TYPES available, ask user to choose
-        if len(posiciones_unicas) > 1:
-            # Store pending player in game state
-            game_state['pending_player'] = {
-                'jugador': jugador_encontrado,
-                'posiciones_disponibles': posiciones_disponibles
-            }
-            
-            return {
-                'correcto': True,
-                'requiere_seleccion': True,
-                'mensaje': f'¡Correcto! {jugador_encontrado["nombre"]} puede jugar en varias posiciones. Elegí una:',
-                'jugador_revelado': {
-                    'nombre': jugador_encontrado['nombre'],
-                    'apellido': jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1]),
-                    'image_url': self._get_jugador_image_url(jugador_encontrado)
-                },
-                'posiciones_disponibles': sorted(posiciones_unicas)  # Unique positions only, sorted
-            }
-        
-        # Only one position available, assign automatically
-        posicion_elegida = posiciones_disponibles[0]
-        posicion_asignada = posicion_elegida['posicion']
-        pos_index = posicion_elegida['index']
-        
-        # Assign to position
-        posiciones[pos_index]['revelado'] = True
-        posiciones[pos_index]['jugador_nombre'] = jugador_encontrado['nombre']
-        posiciones[pos_index]['jugador_apellido'] = jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1])
-        posiciones[pos_index]['image_url'] = self._get_jugador_image_url(jugador_encontrado)
-        
-        # ✅ Mark this player as revealed
-        jugador_nombre_normalizado = self._normalize_text(jugador_encontrado['nombre'])
-        game_state['jugadores_revelados'].add(jugador_nombre_normalizado)
-        
-        # Move to next club
-        game_state['clubes_index'] = min(club_index + 1, len(game_state['clubes_list']) - 1)
-        next_club = game_state['clubes_list'][game_state['clubes_index']]
-        
-        # ✅ Verificar victoria: 11 jugadores + 1 técnico = 12 personas
-        jugadores_revelados = sum(1 for p in posiciones if p.get('revelado', False))
-        entrenador_revelado = game_state.get('entrenador_revelado', False)
-        game_over = (jugadores_revelados >= 11 and entrenador_revelado)
-        victoria = game_over
-        
-        mensaje = f'¡Correcto! {jugador_encontrado["nombre"]} - {posicion_asignada}'
-        if victoria:
-            mensaje = f'🎉 ¡Felicitaciones! Completaste el equipo con {jugador_encontrado["nombre"]}'
-        
-        return {
-            'correcto': True,
-            'mensaje': mensaje,
-            'jugador_revelado': {
-                'nombre': jugador_encontrado['nombre'],
-                'apellido': jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1]),
-                'posicion': posicion_asignada,
-                'club': club_actual,
-                'image_url': self._get_jugador_image_url(jugador_encontrado)
-            },
-            'posicion_asignada': posicion_asignada,
-            'nuevo_club': {
-                'nombre': next_club,
-                'logo_url': self._get_logo_url(next_club),
-                'pais': self._get_club_country(next_club) or "Desconocido"
-            },
-            'game_over': game_over,
-            'victoria': victoria
-        }
+        return self._ubicar_jugador(definicion, progreso, jugadores_con_posiciones[0].id)
     
-    def confirmar_posicion(self, game_id: str, posicion_elegida: str) -> Dict[str, Any]:
+    def confirmar_posicion(self, game_id: str, posicion_elegida: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """Confirm the position chosen by the user for a multi-position player"""
-        game_state = self._games_cache.get(game_id)
-        if not game_state:
+        definicion = self._get_definicion(game_id)
+        if not definicion:
             return {'correcto': False, 'mensaje': 'Juego no encontrado'}
         
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_equipo, progress_token)
+        
         # Get pending player
-        pending_data = game_state.get('pending_player')
+        pending_data = progreso.get('pendiente_posicion')
         if not pending_data:
             return {'correcto': False, 'mensaje': 'No hay jugador pendiente de asignación'}
         
-        jugador_encontrado = pending_data['jugador']
-        posiciones_disponibles = pending_data['posiciones_disponibles']
-        
         # Find the FIRST available position of the chosen type
         posicion_data = None
-        for p in posiciones_disponibles:
-            if p['posicion'] == posicion_elegida:
-                posicion_data = p
+        for pos_index in pending_data['indices']:
+            if definicion['posiciones'][pos_index]['posicion'] == posicion_elegida:
+                posicion_data = {'posicion': posicion_elegida, 'index': pos_index}
                 break  # Take the first one of this type
         
         if not posicion_data:
             return {'correcto': False, 'mensaje': 'Posición no válida'}
         
-        # Assign player to the first available position of chosen type
-        posiciones = game_state['posiciones']
-        pos_index = posicion_data['index']
-        posiciones[pos_index]['revelado'] = True
-        posiciones[pos_index]['jugador_nombre'] = jugador_encontrado['nombre']
-        posiciones[pos_index]['jugador_apellido'] = jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1])
-        posiciones[pos_index]['image_url'] = self._get_jugador_image_url(jugador_encontrado)
-        
-        # ✅ Mark this player as revealed
-        jugador_nombre_normalizado = self._normalize_text(jugador_encontrado['nombre'])
-        game_state['jugadores_revelados'].add(jugador_nombre_normalizado)
-        
-        # Get current club
-        club_index = game_state['clubes_index']
-        club_actual = game_state['clubes_list'][club_index]
-        
-        # Move to next club
-        game_state['clubes_index'] = min(club_index + 1, len(game_state['clubes_list']) - 1)
-        next_club = game_state['clubes_list'][game_state['clubes_index']]
-        
-        # ✅ Verificar victoria: 11 jugadores + 1 técnico = 12 personas
-        jugadores_revelados = sum(1 for p in posiciones if p.get('revelado', False))
-        entrenador_revelado = game_state.get('entrenador_revelado', False)
-        game_over = (jugadores_revelados >= 11 and entrenador_revelado)
-        victoria = game_over
-        
-        mensaje = f'¡Correcto! {jugador_encontrado["nombre"]} - {posicion_elegida}'
-        if victoria:
-            mensaje = f'🎉 ¡Felicitaciones! Completaste el equipo con {jugador_encontrado["nombre"]}'
-        
-        # Clear pending player
-        del game_state['pending_player']
-        
-        return {
-            'correcto': True,
-            'mensaje': mensaje,
-            'jugador_revelado': {
-                'nombre': jugador_encontrado['nombre'],
-                'apellido': jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1]),
-                'posicion': posicion_elegida,
-                'club': club_actual,
-                'image_url': self._get_jugador_image_url(jugador_encontrado)
-            },
-            'posicion_asignada': posicion_elegida,
-            'nuevo_club': {
-                'nombre': next_club,
-                'logo_url': self._get_logo_url(next_club),
-                'pais': self._get_club_country(next_club) or "Desconocido"
-            },
-            'game_over': game_over,
-            'victoria': victoria
-        }
+        # Clear pending player and assign him to the chosen position
+        del progreso['pendiente_posicion']
+        result = self._asignar_jugador(definicion, progreso, pending_data['jugador'], posicion_data)
+        return self._save_progreso(game_id, session_id, progreso, result)
     
-    def confirmar_jugador(self, game_id: str, nombre_jugador: str) -> Dict[str, Any]:
+    def confirmar_jugador(self, game_id: str, nombre_jugador: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """Confirm the player chosen by the user when multiple players match"""
-        game_state = self._games_cache.get(game_id)
-        if not game_state:
+        definicion = self._get_definicion(game_id)
+        if not definicion:
             return {'correcto': False, 'mensaje': 'Juego no encontrado'}
         
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_equipo, progress_token)
+        
         # Get pending player selection
-        pending_data = game_state.get('pending_player_selection')
-        if not pending_data:
+        jugadores_disponibles = progreso.get('pendiente_jugadores')
+        if not jugadores_disponibles:
             return {'correcto': False, 'mensaje': 'No hay selección de jugador pendiente'}
         
-        jugadores_disponibles = pending_data['jugadores']
-        
         # Find the selected player
-        jugador_encontrado = None
-        for jugador in jugadores_disponibles:
-            if jugador['nombre'] == nombre_jugador:
-                jugador_encontrado = jugador
+        jugador_id = None
+        for candidato_id in jugadores_disponibles:
+            if definicion['datos'].get_jugador(candidato_id).nombre == nombre_jugador:
+                jugador_id = candidato_id
                 break
         
-        if not jugador_encontrado:
+        if jugador_id is None:
             return {'correcto': False, 'mensaje': 'Jugador no válido'}
         
-        # Clear pending selection
-        del game_state['pending_player_selection']
-        
-        # Now continue with normal flow: find positions for this player
-        posiciones = game_state['posiciones']
-        posiciones_jugador = self._get_all_valid_positions(jugador_encontrado)
-        
-        # Find ALL available positions that this player can occupy
-        posiciones_disponibles = []
-        for i, pos in enumerate(posiciones):
-            if not pos['revelado']:
-                pos_type = pos['posicion']
-                if pos_type in posiciones_jugador:
-                    posiciones_disponibles.append({
-                        'posicion': pos_type,
-                        'index': i
-                    })
-        
-        if not posiciones_disponibles:
-            return {
-                'correcto': False,
-                'mensaje': f'{jugador_encontrado["nombre"]} no puede ocupar ninguna posición vacía'
-            }
-        
-        # Get unique position types available
-        posiciones_unicas = list(set(p['posicion'] for p in posiciones_disponibles))
-        
-        # If multiple position TYPES available, ask user to choose
-        if len(posiciones_unicas) > 1:
-            game_state['pending_player'] = {
-                'jugador': jugador_encontrado,
-                'posiciones_disponibles': posiciones_disponibles
-            }
-            
-            return {
-                'correcto': True,
-                'requiere_seleccion': True,
-                'mensaje': f'¡Correcto! {jugador_encontrado["nombre"]} puede jugar en varias posiciones. Elegí una:',
-                'jugador_revelado': {
-                    'nombre': jugador_encontrado['nombre'],
-                    'apellido': jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1]),
-                    'image_url': self._get_jugador_image_url(jugador_encontrado)
-                },
-                'posiciones_disponibles': sorted(posiciones_unicas)
-            }
-        
-        # Only one position available, assign automatically
-        club_index = game_state['clubes_index']
-        club_actual = game_state['clubes_list'][club_index]
-        
-        posicion_elegida = posiciones_disponibles[0]
-        posicion_asignada = posicion_elegida['posicion']
-        pos_index = posicion_elegida['index']
-        
-        # Assign to position
-        posiciones[pos_index]['revelado'] = True
-        posiciones[pos_index]['jugador_nombre'] = jugador_encontrado['nombre']
-        posiciones[pos_index]['jugador_apellido'] = jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1])
-        posiciones[pos_index]['image_url'] = self._get_jugador_image_url(jugador_encontrado)
-        
-        # ✅ Mark this player as revealed
-        jugador_nombre_normalizado = self._normalize_text(jugador_encontrado['nombre'])
-        game_state['jugadores_revelados'].add(jugador_nombre_normalizado)
-        
-        # Move to next club
-        game_state['clubes_index'] = min(club_index + 1, len(game_state['clubes_list']) - 1)
-        next_club = game_state['clubes_list'][game_state['clubes_index']]
-        
-        # Verificar victoria: 11 jugadores + 1 técnico = 12 personas
-        jugadores_revelados = sum(1 for p in posiciones if p.get('revelado', False))
-        entrenador_revelado = game_state.get('entrenador_revelado', False)
-        game_over = (jugadores_revelados >= 11 and entrenador_revelado)
-        victoria = game_over
-        
-        mensaje = f'¡Correcto! {jugador_encontrado["nombre"]} - {posicion_asignada}'
-        if victoria:
-            mensaje = f'🎉 ¡Felicitaciones! Completaste el equipo con {jugador_encontrado["nombre"]}'
-        
-        return {
-            'correcto': True,
-            'mensaje': mensaje,
-            'jugador_revelado': {
-                'nombre': jugador_encontrado['nombre'],
-                'apellido': jugador_encontrado.get('apellido', jugador_encontrado['nombre'].split()[-1]),
-                'posicion': posicion_asignada,
-                'club': club_actual,
-                'image_url': self._get_jugador_image_url(jugador_encontrado)
-            },
-            'posicion_asignada': posicion_asignada,
-            'nuevo_club': {
-                'nombre': next_club,
-                'logo_url': self._get_logo_url(next_club),
-                'pais': self._get_club_country(next_club) or "Desconocido"
-            },
-            'game_over': game_over,
-            'victoria': victoria
-        }
+        # Clear pending selection, then continue with normal flow: find positions for this player
+        del progreso['pendiente_jugadores']
+        result = self._ubicar_jugador(definicion, progreso, jugador_id)
+        return self._save_progreso(game_id, session_id, progreso, result)
     
-    def obtener_pista(self, game_id: str) -> Dict[str, Any]:
+    def obtener_pista(self, game_id: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get hints for the current club using optimized index (O(1) lookup)
+        Get hints for the current club from the candidates precomputed with
+        the game (see _tabla_candidatos)
         
         Returns hints:
-        - Primera letra del apellido  
+        - Primera letra del apellido
         - Posición principal del jugador
         - Otro club donde jugó (si hay alguno disponible)
         """
-        game_state = self._games_cache.get(game_id)
-        if not game_state:
+        definicion = self._get_definicion(game_id)
+        if not definicion:
             return {'error': 'Juego no encontrado'}
         
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_equipo, progress_token)
+        
         # Get current club
-        club_index = game_state['clubes_index']
-        club_actual = game_state['clubes_list'][club_index]
-        posiciones = game_state['posiciones']
+        clubes_index = progreso['clubes_index']
+        if clubes_index >= len(definicion['clubes_list']):
+            return {'error': 'No hay más clubes disponibles'}
+        club_actual = definicion['clubes_list'][clubes_index]
         
-        # Find first available position
+        # Position the club fills (see _posicion_para_club), else the first available one
         posicion_disponible = None
-        for pos in posiciones:
-            if not pos['revelado']:
-                posicion_disponible = pos['posicion']
-                break
+        indice_posicion = self._posicion_para_club(definicion, progreso)
+        if indice_posicion is not None:
+            posicion_disponible = definicion['posiciones'][indice_posicion]['posicion']
+        else:
+            for i, pos in enumerate(definicion['posiciones']):
+                if not progreso['revelados'] & (1 << i):
+                    posicion_disponible = pos['posicion']
+                    break
         
         if not posicion_disponible:
             return {'error': 'No hay posiciones disponibles'}
         
-        # Get players for this club and position using optimized index (O(1))
-        jugadores_posibles = self.data_loader.get_jugadores_por_club_posicion(
-            club_actual,
-            posicion_disponible
-        )
-        
-        if not jugadores_posibles:
-            # Fallback: try getting any player for this club
-            jugadores_posibles = self.data_loader.get_jugadores_por_club_posicion(
-                club_actual
-            )
+        # Candidates precomputed with the game: first one not revealed yet
+        tabla = definicion['candidatos'][clubes_index]
+        jugadores_revelados = self._jugadores_revelados(progreso)
+        pista = None
+        if posicion_disponible in tabla:
+            pista = self._primer_candidato(tabla[posicion_disponible], jugadores_revelados)
+        
+        if pista is None:
+            # Fallback: any player for this club
+            for candidatos in tabla.values():
+                pista = self._primer_candidato(candidatos, jugadores_revelados)
+                if pista is not None:
+                    break
             
-            if not jugadores_posibles:
+            if pista is None:
                 return {'error': 'No se encontró jugador válido para generar pista'}
         
-        # Take first player
-        jugador_sugerido = jugadores_posibles[0]
-        
-        # Generate hints
-        apellido = jugador_sugerido.get('apellido', 'Desconocido')
-        primera_letra = apellido[0].upper() if apellido else '?'
-        
-        # Main position
-        posiciones_jugador = jugador_sugerido.get('posiciones', [])
-        posicion_principal = posiciones_jugador[0] if posiciones_jugador else 'Desconocida'
-        
-        # Find another club (not RC, not current club)
-        otros_clubes = jugador_sugerido.get('otros_clubes', [])
-        # Filter out the current club from otros_clubes to avoid giving it away
-        otros_clubes_filtrados = [club for club in otros_clubes if self._normalize_text(club) != self._normalize_text(club_actual)]
-        otro_club = otros_clubes_filtrados[0] if otros_clubes_filtrados else None
-        
         return {
             'pistas': {
-                'letra_inicial': primera_letra,
-                'posicion': posicion_principal,
-                'otro_club': otro_club
+                'letra_inicial': pista.letra_inicial,
+                'posicion': pista.posicion,
+                'otro_club': pista.otro_club
             },
             'club_actual': club_actual
         }
     
-    def revelar_jugador_aleatorio(self, game_id: str) -> dict:
+    @staticmethod
+    def _primer_candidato(candidatos: CandidatosPosicion, jugadores_revelados: Set[int]) -> Optional[PistaJugador]:
+        """First candidate not revealed yet (players reserved for later clubs last)"""
+        for pista in chain(candidatos.libres, candidatos.reservados):
+            if pista.id not in jugadores_revelados:
+                return pista
+        return None
+    
+    def revelar_jugador_aleatorio(self, game_id: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> dict:
         """
         Revela un jugador aleatorio que cumpla con club y posiciones disponibles.
         Solo para modo FÁCIL.
@@ -1025,130 +1290,108 @@ class GameGeneratorService:
         4. Si no hay jugadores, saltar al siguiente club (máx 3 intentos)
         5. Elegir jugador al azar y revelar
         """
-        game_state = self._games_cache.get(game_id)
-        if not game_state:
+        definicion = self._get_definicion(game_id)
+        if not definicion:
             return {"error": "Juego no encontrado"}
         
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_equipo, progress_token)
+        result = self._revelar_jugador_aleatorio(definicion, progreso, self._rng_partida(game_id, progreso, 'revelar'))
+        return self._save_progreso(game_id, session_id, progreso, result)
+    
+    def _revelar_jugador_aleatorio(
+        self,
+        definicion: Dict[str, Any],
+        progreso: Dict[str, Any],
+        rng: random.Random,
+        intentos: int = 0
+    ) -> dict:
+        """Reveal a random player for the session's current club (updates its progress)"""
         # PASO 1: Obtener club actual
-        clubes_index = game_state.get('clubes_index', 0)
-        clubes_list = game_state.get('clubes_list', [])
+        clubes_index = progreso['clubes_index']
+        clubes_list = definicion['clubes_list']
         if clubes_index >= len(clubes_list):
             return {"error": "No hay más clubes disponibles"}
         
         club_actual = clubes_list[clubes_index]  # String con nombre del club
         
         # PASO 2: Obtener posiciones disponibles (no reveladas)
-        posiciones = game_state.get('posiciones', [])
         posiciones_vacias = []
-        for i, p in enumerate(posiciones):
-            if isinstance(p, dict) and not p.get('revelado', False):
+        for i, p in enumerate(definicion['posiciones']):
+            if not progreso['revelados'] & (1 << i):
                 posiciones_vacias.append((i, p))  # Guardar índice y posición
         
         if not posiciones_vacias:
             return {"error": "No hay posiciones disponibles"}
         
         # PASO 3: Buscar jugadores para distintas posiciones hasta encontrar
-        indice = self.data_loader.load_club_posicion_index()
-        if not indice:
-            return {"error": "Índice no disponible"}
-        
-        # Normalizar club para búsqueda
-        club_normalizado = self._normalize_text(club_actual)
+        # (candidatos del club por posición, precalculados con el juego)
+        tabla = definicion['candidatos'][clubes_index]
         
-        # Mezclar posiciones para intentar en orden aleatorio
-        random.shuffle(posiciones_vacias)
+        # Mezclar posiciones para intentar en orden aleatorio, empezando por
+        # la que le toca al club (tiene jugadores y deja completar el equipo)
+        rng.shuffle(posiciones_vacias)
+        indice_posicion = self._posicion_para_club(definicion, progreso)
+        posiciones_vacias.sort(key=lambda vacia: vacia[0] != indice_posicion)
         
         idx_seleccionado = None
-        posicion_seleccionada = None
         posicion_juego = None
         jugadores_disponibles = []
         
+        # Filtrar jugadores ya revelados; los que completan el equipo con los
+        # clubes que faltan solo si no queda otro
+        jugadores_revelados = self._jugadores_revelados(progreso)
+        
         # Intentar con cada posición vacía hasta encontrar jugadores
         for idx, pos in posiciones_vacias:
             pos_tipo = pos.get('posicion')
+            candidatos = tabla.get(pos_tipo)
+            if candidatos is None:
+                continue
             
-            # Buscar el club en el índice
-            for club_key, posiciones_data in indice.items():
-                if self._normalize_text(club_key) == club_normalizado:
-                    # Club encontrado
-                    if pos_tipo in posiciones_data:
-                        jugadores_list = posiciones_data[pos_tipo]
-                        
-                        # Filtrar jugadores ya revelados
-                        apellidos_revelados = {p.get('jugador_apellido') for p in posiciones if isinstance(p, dict) and p.get('revelado')}
-                        
-                        for j in jugadores_list:
-                            if isinstance(j, dict):
-                                apellido = j.get('apellido')
-                                if apellido and apellido not in apellidos_revelados:
-                                    jugadores_disponibles.append(j)
-                    break
+            jugadores_disponibles = (
+                [p for p in candidatos.libres if p.id not in jugadores_revelados]
+                or [p for p in candidatos.reservados if p.id not in jugadores_revelados]
+            )
             
             # Si encontramos jugadores, usar esta posición
             if jugadores_disponibles:
                 idx_seleccionado = idx
-                posicion_seleccionada = pos
                 posicion_juego = pos_tipo
                 break
         
         # Si no hay jugadores para este club, saltar al siguiente
         if not jugadores_disponibles:
-            game_state['clubes_index'] += 1
-            # Intentar recursivamente con el siguiente club (máximo 3 intentos)
-            if game_state['clubes_index'] < len(clubes_list) and game_state.get('_revelar_intentos', 0) < 3:
-                game_state['_revelar_intentos'] = game_state.get('_revelar_intentos', 0) + 1
-                result = self.revelar_jugador_aleatorio(game_id)
-                game_state['_revelar_intentos'] = 0  # Reset
-                return result
-            else:
-                game_state['_revelar_intentos'] = 0
-                return {"error": f"No se encontraron jugadores disponibles después de varios intentos"}
+            progreso['clubes_index'] += 1
+            # Intentar con el siguiente club (máximo 3 intentos)
+            if progreso['clubes_index'] < len(clubes_list) and intentos < 3:
+                return self._revelar_jugador_aleatorio(definicion, progreso, rng, intentos + 1)
+            return {"error": f"No se encontraron jugadores disponibles después de varios intentos"}
         
         # PASO 4: Elegir jugador al azar
-        jugador = random.choice(jugadores_disponibles)
+        jugador = definicion['datos'].get_jugador(rng.choice(jugadores_disponibles).id)
         
         # PASO 5: Revelar el jugador
-        # Actualizar game_state usando el índice que guardamos
-        game_state['posiciones'][idx_seleccionado]['revelado'] = True
-        game_state['posiciones'][idx_seleccionado]['jugador_apellido'] = jugador.get('apellido', '')
-        game_state['posiciones'][idx_seleccionado]['jugador_nombre'] = jugador.get('nombre', '')
-        
-        # Imagen
-        img_path = jugador.get('image_profile', '')
-        if img_path:
-            filename = img_path.split('/')[-1]
-            game_state['posiciones'][idx_seleccionado]['image_url'] = f'/api/v1/static/jugadores/{filename}'
+        self._revelar_posicion(progreso, idx_seleccionado, jugador.id)
         
         # Cambiar al siguiente club
-        game_state['clubes_index'] += 1
+        progreso['clubes_index'] += 1
         
         # Nuevo club para respuesta
         nuevo_club = None
-        if game_state['clubes_index'] < len(clubes_list):
-            next_name = clubes_list[game_state['clubes_index']]
-            nuevo_club = {
-                'nombre': next_name,
-                'logo_url': self._get_logo_url(next_name),
-                'pais': self._get_club_country(next_name) or "Desconocido"
-            }
+        if progreso['clubes_index'] < len(clubes_list):
+            nuevo_club = self._club_info(clubes_list[progreso['clubes_index']])
         
         # Verificar victoria
-        revelados = sum(1 for p in game_state['posiciones'] if isinstance(p, dict) and p.get('revelado'))
-        entrenador_revelado = game_state.get('entrenador_revelado', False)
-        game_over = (revelados >= 11 and entrenador_revelado)
-        
-        if game_over:
-            game_state['game_over'] = True
-            game_state['victoria'] = True
+        game_over = self._equipo_completo(progreso)
         
         # Respuesta
-        img_path = jugador.get('image_profile', '')
+        img_path = jugador.image_profile
         img_url = ''
         if img_path:
             img_url = f'/api/v1/static/jugadores/{img_path.split("/")[-1]}'
         
-        nombre = jugador.get('nombre', '')
-        apellido = jugador.get('apellido', '')
+        nombre = jugador.nombre
+        apellido = jugador.apellido
         
         return {
             "jugador_revelado": {
@@ -1157,7 +1400,7 @@ class GameGeneratorService:
                 "posicion": posicion_juego,
                 "image_url": img_url
             },
-            "posiciones": game_state['posiciones'],
+            "posiciones": self._posiciones_equipo(definicion, progreso),
             "nuevo_club": nuevo_club,
             "game_over": game_over,
             "mensaje": "🎉 ¡Felicitaciones! Completaste el equipo" if game_over else f"✨ {nombre} {apellido} revelado"
@@ -1167,36 +1410,18 @@ class GameGeneratorService:
     # CLÁSICO DEL DÍA
     # ========================
     
-    def generate_clasico_del_dia(self) -> Dict[str, Any]:
+    def _crear_clasico_del_dia(self, fecha: date) -> Dict[str, Any]:
         """
-        Generate a daily classic match game (Rosario Central vs Newell's Old Boys)
-        Similar to Equipo games but with a specific match formation
+        Build the shared definition of the daily classic match game
         
         Returns:
-            Dict with game data including formation, players, coach, result, and referee
+            Dict with game data including formation, players, coach, result,
+            referee and the internal answers used for verification
         """
-        game_id = self._get_game_id("clasico")
-        
-        # Check if game already exists in cache
-        if game_id in self._games_cache:
-            cached_game = self._games_cache[game_id]
-            # Return public data without internal state
-            return {
-                "game_id": cached_game["game_id"],
-                "fecha": cached_game["fecha"],
-                "competicion": cached_game["competicion"],
-                "local": cached_game["local"],
-                "visitante": cached_game["visitante"],
-                "rosario_central_local": cached_game["rosario_central_local"],
-                "esquema": cached_game["esquema"],
-                "posiciones": cached_game["posiciones"],
-                "entrenador": cached_game["entrenador"],
-                "resultado": cached_game["resultado"],
-                "arbitro": cached_game["arbitro"]
-            }
+        game_id = self._get_game_id("clasico", fecha)
         
         # Load all classic matches
-        clasicos = self.data_loader.get_all_clasicos()
+        clasicos = self.data_loader.snapshot.get_all_clasicos()
         
         if not clasicos:
             raise ValueError("No hay partidos clásicos disponibles")
@@ -1211,12 +1436,12 @@ class GameGeneratorService:
         if not clasicos_completos:
             raise ValueError("No hay partidos clásicos con datos completos")
         
-        # Get today's seed for deterministic selection
-        seed = self._get_daily_seed("clasico")
-        random.seed(seed)
+        # Get the date's seed for deterministic selection (own generator, global random untouched)
+        seed = self._get_daily_seed("clasico", fecha)
+        rng = random.Random(seed)
         
         # Shuffle matches for deterministic but random selection
-        random.shuffle(clasicos_completos)
+        rng.shuffle(clasicos_completos)
         
         # Try to find a compatible match (with retries for incompatible formations)
         partido = None
@@ -1293,7 +1518,7 @@ class GameGeneratorService:
         
         # Map jugadores by position to respect formaciones.json order
         # Create a list to track which jugadores have been used
-        jugadores_disponibles = partido["jugadores"].copy()
+        jugadores_disponibles = list(partido["jugadores"])
         
         # Build posiciones array following formaciones.json order
         posiciones = []
@@ -1336,8 +1561,8 @@ class GameGeneratorService:
                 "revelado": False,
                 "jugador_apellido": jugador["apellido"],
                 "jugador_nombre_completo": jugador["nombre_completo"],
-                "otros_clubes": jugador.get("otros_clubes", []),
-                "posiciones_disponibles": jugador.get("posiciones", []),
+                "otros_clubes": list(jugador.get("otros_clubes", [])),
+                "posiciones_disponibles": list(jugador.get("posiciones", [])),
                 "image_url": self._convert_image_path_to_url(jugador.get("foto_url")),
                 "goles": jugador.get("goles", 0),
                 "x": pos_config["pos"]["x"],  # ✅ Coordenada X correcta
@@ -1381,17 +1606,64 @@ class GameGeneratorService:
                 },
                 "entrenador_apellido_norm": self._normalize_text(partido["entrenador"]["apellido"]),
                 "arbitro_apellido_norm": self._normalize_text(partido["arbitro"]["apellido"]),
-                "resultado_norm": partido["resultado"].split("(")[0].strip(),
-                "pistas_usadas": 0,
-                "revelaciones_usadas": 0,
-                "jugadores_revelados": set()  # ✅ Track already revealed players
+                "resultado_norm": partido["resultado"].split("(")[0].strip()
             }
         }
+        internal = game_data["_internal"]
+        internal["respuestas_aproximadas"] = FuzzyIndex([
+            *internal["jugadores_map"],
+            internal["entrenador_apellido_norm"],
+            internal["arbitro_apellido_norm"]
+        ])
+        
+        # Salted answer hashes for clients that verify guesses locally
+        game_data["verificacion"] = build_verificacion_clasico(
+            sal_del_juego(game_id, seed),
+            game_data["_internal"]
+        )
+        
+        return game_data
+    
+    def generate_clasico_del_dia(self, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate a daily classic match game (Rosario Central vs Newell's Old Boys)
+        Similar to Equipo games but with a specific match formation
+        
+        Args:
+            session_id: Player session (its progress is kept between requests)
         
-        # Cache the game
-        self._games_cache[game_id] = game_data
+        Returns:
+            Dict with game data including formation, players, coach, result, and referee
+        """
+        game_id = self._get_game_id("clasico")
+        definicion = self._get_definicion(game_id)
+        progreso = self._load_progreso(game_id, session_id, self._nuevo_progreso_clasico, progress_token)
         
-        # Return public data
+        # Return public data (with the session's progress) without internal state
+        return self._vista_clasico(definicion, progreso)
+    
+    @staticmethod
+    def _nuevo_progreso_clasico() -> Dict[str, Any]:
+        """
+        Progress of a Clásico del Día game
+        
+        - revelados: Bitmask of revealed positions
+        - entrenador_revelado / arbitro_revelado / resultado_revelado
+        - pistas_usadas / revelaciones_usadas: Counters
+        """
+        return {
+            'revelados': 0,
+            'entrenador_revelado': False,
+            'arbitro_revelado': False,
+            'resultado_revelado': False,
+            'pistas_usadas': 0,
+            'revelaciones_usadas': 0
+        }
+    
+    @staticmethod
+    def _vista_clasico(game_data: Dict[str, Any], progreso: Dict[str, Any]) -> Dict[str, Any]:
+        """Public data of a classic match game with the session's progress applied"""
+        revelados = progreso['revelados']
         return {
             "game_id": game_data["game_id"],
             "fecha": game_data["fecha"],
@@ -1400,16 +1672,39 @@ class GameGeneratorService:
             "visitante": game_data["visitante"],
             "rosario_central_local": game_data["rosario_central_local"],
             "esquema": game_data["esquema"],
-            "posiciones": game_data["posiciones"],
-            "entrenador": game_data["entrenador"],
-            "resultado": game_data["resultado"],
-            "arbitro": game_data["arbitro"]
+            "posiciones": [
+                dict(pos, revelado=bool(revelados & (1 << i)))
+                for i, pos in enumerate(game_data["posiciones"])
+            ],
+            "entrenador": dict(game_data["entrenador"], revelado=progreso['entrenador_revelado']),
+            "resultado": dict(game_data["resultado"], revelado=progreso['resultado_revelado']),
+            "arbitro": dict(game_data["arbitro"], revelado=progreso['arbitro_revelado'])
         }
     
+    @staticmethod
+    def estado_vista_clasico(progreso: Dict[str, Any]) -> Tuple[int, bool, bool, bool]:
+        """Progress fields _vista_clasico depends on (the counters don't change the view)"""
+        return (
+            progreso['revelados'],
+            progreso['entrenador_revelado'],
+            progreso['arbitro_revelado'],
+            progreso['resultado_revelado']
+        )
+    
+    def _load_clasico(self, game_id: str, session_id: Optional[str], progress_token: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Definition and session progress of a classic match game"""
+        game_data = self._get_definicion(game_id)
+        if not game_data or game_id.rsplit('_', 1)[0] != "clasico":
+            raise ValueError(f"Game {game_id} not found")
+        
+        return game_data, self._load_progreso(game_id, session_id, self._nuevo_progreso_clasico, progress_token)
+    
     def verificar_respuesta_clasico(
-        self, 
-        game_id: str, 
-        respuesta: str
+        self,
+        game_id: str,
+        respuesta: str,
+        session_id: Optional[str] = None,
+        progress_token: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Verify a player/coach/referee answer for the classic match game
@@ -1418,45 +1713,58 @@ class GameGeneratorService:
         Args:
             game_id: Game ID
             respuesta: User's answer (player/coach/referee surname)
-            
+            session_id: Player session
+        
         Returns:
             Dict with verification result
         """
-        if game_id not in self._games_cache:
-            raise ValueError(f"Game {game_id} not found")
-        
-        game_data = self._games_cache[game_id]
+        game_data, progreso = self._load_clasico(game_id, session_id, progress_token)
+        result = self._verificar_respuesta_clasico(game_data, progreso, respuesta)
+        return self._save_progreso(game_id, session_id, progreso, result)
+    
+    def _verificar_respuesta_clasico(self, game_data: Dict[str, Any], progreso: Dict[str, Any], respuesta: str) -> Dict[str, Any]:
+        """Verify a classic match answer against the session's progress (updates it)"""
         internal = game_data["_internal"]
         posiciones = game_data["posiciones"]
-        entrenador = game_data["entrenador"]
-        arbitro = game_data["arbitro"]
+        num_posiciones = len(posiciones)
         
         # Normalize answer
         respuesta_norm = self._normalize_text(respuesta)
         
+        es_respuesta = respuesta_norm in internal["jugadores_map"] or respuesta_norm in (
+            internal["entrenador_apellido_norm"],
+            internal["arbitro_apellido_norm"]
+        )
+        if not es_respuesta and not self.data_loader.snapshot.es_nombre_conocido(respuesta_norm):
+            # Typos: the answer of this match closest to it, if only one is
+            # (the exact name of another player or coach is just wrong)
+            respuesta_norm = internal["respuestas_aproximadas"].corregir(respuesta_norm) or respuesta_norm
+        
         # Check if it's the coach
-        if respuesta_norm == internal["entrenador_apellido_norm"] and not entrenador["revelado"]:
-            entrenador["revelado"] = True
+        if respuesta_norm == internal["entrenador_apellido_norm"] and not progreso["entrenador_revelado"]:
+            progreso["entrenador_revelado"] = True
+            vista = self._vista_clasico(game_data, progreso)
             
             # Check if game is complete
-            todos_revelados = all(p["revelado"] for p in posiciones)
-            game_over = todos_revelados and entrenador["revelado"]
+            todos_revelados = progreso["revelados"] == (1 << num_posiciones) - 1
+            game_over = todos_revelados and progreso["entrenador_revelado"]
             
             return {
                 "correcto": True,
-                "mensaje": f"✅ ¡Correcto! {entrenador['apellido']} fue el entrenador",
-                "entrenador_revelado": entrenador,
+                "mensaje": f"✅ ¡Correcto! {vista['entrenador']['apellido']} fue el entrenador",
+                "entrenador_revelado": vista["entrenador"],
                 "game_over": game_over,
                 "victoria": game_over
             }
         
         # Check if it's the referee
-        if respuesta_norm == internal["arbitro_apellido_norm"] and not arbitro["revelado"]:
-            arbitro["revelado"] = True
+        if respuesta_norm == internal["arbitro_apellido_norm"] and not progreso["arbitro_revelado"]:
+            progreso["arbitro_revelado"] = True
+            vista = self._vista_clasico(game_data, progreso)
             return {
                 "correcto": True,
-                "mensaje": f"✅ ¡Correcto! {arbitro['apellido']} fue el árbitro",
-                "arbitro_revelado": arbitro,
+                "mensaje": f"✅ ¡Correcto! {vista['arbitro']['apellido']} fue el árbitro",
+                "arbitro_revelado": vista["arbitro"],
                 "game_over": False,
                 "victoria": False
             }
@@ -1466,7 +1774,7 @@ class GameGeneratorService:
             idx = internal["jugadores_map"][respuesta_norm]
             jugador_pos = posiciones[idx]
             
-            if jugador_pos["revelado"]:
+            if progreso["revelados"] & (1 << idx):
                 return {
                     "correcto": False,
                     "mensaje": f"⚠️ Ya adivinaste a {jugador_pos['jugador_apellido']}",
@@ -1474,15 +1782,11 @@ class GameGeneratorService:
                 }
             
             # Reveal player
-            jugador_pos["revelado"] = True
-            
-            # ✅ Mark this player as revealed
-            jugador_nombre_normalizado = self._normalize_text(jugador_pos['jugador_nombre_completo'])
-            internal['jugadores_revelados'].add(jugador_nombre_normalizado)
+            progreso["revelados"] |= 1 << idx
             
             # Check if game is complete
-            todos_revelados = all(p["revelado"] for p in posiciones)
-            game_over = todos_revelados and entrenador["revelado"]
+            todos_revelados = progreso["revelados"] == (1 << num_posiciones) - 1
+            game_over = todos_revelados and progreso["entrenador_revelado"]
             
             return {
                 "correcto": True,
@@ -1507,37 +1811,36 @@ class GameGeneratorService:
             "game_over": False
         }
     
-    def obtener_pista_clasico(self, game_id: str) -> Dict[str, Any]:
+    def obtener_pista_clasico(self, game_id: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """
         Get a hint for a non-revealed player in the classic match
         Returns first letter of surname and another club where they played
         
         Args:
             game_id: Game ID
-            
+            session_id: Player session
+        
         Returns:
             Dict with hint information
         """
-        if game_id not in self._games_cache:
-            raise ValueError(f"Game {game_id} not found")
-        
-        game_data = self._games_cache[game_id]
-        internal = game_data["_internal"]
+        game_data, progreso = self._load_clasico(game_id, session_id, progress_token)
+        rng = self._rng_partida(game_id, progreso, 'pista')
         posiciones = game_data["posiciones"]
+        no_revelados = [p for i, p in enumerate(posiciones) if not progreso["revelados"] & (1 << i)]
         
         # Find first non-revealed player with clubs
-        jugadores_no_revelados = [p for p in posiciones if not p["revelado"] and p.get("otros_clubes")]
+        jugadores_no_revelados = [p for p in no_revelados if p.get("otros_clubes")]
         
         if not jugadores_no_revelados:
             # Try without club requirement
-            jugadores_no_revelados = [p for p in posiciones if not p["revelado"]]
+            jugadores_no_revelados = no_revelados
             if not jugadores_no_revelados:
                 return {
                     "error": "No hay jugadores sin revelar"
                 }
         
         # Get random non-revealed player
-        jugador = random.choice(jugadores_no_revelados)
+        jugador = rng.choice(jugadores_no_revelados)
         
         # Build hint
         letra_apellido = jugador["jugador_apellido"][0].upper()
@@ -1548,75 +1851,73 @@ class GameGeneratorService:
         otro_club = None
         if jugador.get("otros_clubes"):
             otros_clubes_filtrados = [
-                club for club in jugador["otros_clubes"] 
+                club for club in jugador["otros_clubes"]
                 if self._normalize_text(club) not in ['rosario central', 'rosariocentral']
             ]
             if otros_clubes_filtrados:
-                otro_club = random.choice(otros_clubes_filtrados)
+                otro_club = rng.choice(otros_clubes_filtrados)
         
-        internal["pistas_usadas"] += 1
+        progreso["pistas_usadas"] += 1
         
-        return {
+        return self._save_progreso(game_id, session_id, progreso, {
             "letra_apellido": letra_apellido,
             "posicion_principal": posicion_principal,
             "otro_club": otro_club,
             "jugador_apellido": jugador["jugador_apellido"],  # ✅ Agregar apellido completo para identificar al jugador
-            "pistas_usadas": internal["pistas_usadas"]
-        }
+            "pistas_usadas": progreso["pistas_usadas"]
+        })
     
-    def revelar_jugador_clasico(self, game_id: str) -> Dict[str, Any]:
+    def revelar_jugador_clasico(self, game_id: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """
         Reveal a random non-revealed player in the classic match
         Only available in EASY mode
         
         Args:
             game_id: Game ID
-            
+            session_id: Player session
+        
         Returns:
             Dict with revealed player information
         """
-        if game_id not in self._games_cache:
-            raise ValueError(f"Game {game_id} not found")
-        
-        game_data = self._games_cache[game_id]
-        internal = game_data["_internal"]
+        game_data, progreso = self._load_clasico(game_id, session_id, progress_token)
         posiciones = game_data["posiciones"]
-        entrenador = game_data["entrenador"]
         
         # Find non-revealed positions
-        no_revelados = [p for p in posiciones if not p["revelado"]]
+        no_revelados = [i for i in range(len(posiciones)) if not progreso["revelados"] & (1 << i)]
         
         if not no_revelados:
             # Try to reveal coach
-            if not entrenador["revelado"]:
-                entrenador["revelado"] = True
-                internal["revelaciones_usadas"] += 1
+            if not progreso["entrenador_revelado"]:
+                progreso["entrenador_revelado"] = True
+                progreso["revelaciones_usadas"] += 1
+                entrenador = self._vista_clasico(game_data, progreso)["entrenador"]
                 
-                return {
+                return self._save_progreso(game_id, session_id, progreso, {
                     "success": True,
                     "tipo": "entrenador",
                     "entrenador_revelado": entrenador,
-                    "revelaciones_usadas": internal["revelaciones_usadas"],
+                    "revelaciones_usadas": progreso["revelaciones_usadas"],
                     "game_over": True,
                     "victoria": True,
                     "mensaje": f"✨ Entrenador revelado: {entrenador['apellido']}"
-                }
+                })
             else:
                 return {
                     "error": "No hay más jugadores para revelar"
                 }
         
         # Select random player to reveal
-        jugador_pos = random.choice(no_revelados)
-        jugador_pos["revelado"] = True
+        idx = self._rng_partida(game_id, progreso, 'revelar').choice(no_revelados)
+        jugador_pos = posiciones[idx]
+        progreso["revelados"] |= 1 << idx
         
-        internal["revelaciones_usadas"] += 1
+        progreso["revelaciones_usadas"] += 1
         
         # Check if game is complete
-        todos_revelados = all(p["revelado"] for p in posiciones)
-        game_over = todos_revelados and entrenador["revelado"]
+        todos_revelados = progreso["revelados"] == (1 << len(posiciones)) - 1
+        game_over = todos_revelados and progreso["entrenador_revelado"]
         
-        return {
+        return self._save_progreso(game_id, session_id, progreso, {
             "success": True,
             "tipo": "jugador",
             "jugador_revelado": {
@@ -1628,31 +1929,28 @@ class GameGeneratorService:
                 "goles": jugador_pos["goles"]
             },
             "posicion_asignada": jugador_pos["posicion"],
-            "revelaciones_usadas": internal["revelaciones_usadas"],
+            "revelaciones_usadas": progreso["revelaciones_usadas"],
             "game_over": game_over,
             "victoria": game_over,
             "mensaje": f"✨ {jugador_pos['jugador_apellido']} revelado"
-        }
+        })
     
-    def verificar_resultado_clasico(self, game_id: str, resultado: str) -> Dict[str, Any]:
+    def verificar_resultado_clasico(self, game_id: str, resultado: str, session_id: Optional[str] = None, progress_token: Optional[str] = None) -> Dict[str, Any]:
         """
         Verify the match result
         
         Args:
             game_id: Game ID
             resultado: Result string (e.g., "2-0", "1:1")
-            
+            session_id: Player session
+        
         Returns:
             Dict with verification result
         """
-        if game_id not in self._games_cache:
-            raise ValueError(f"Game {game_id} not found")
-        
-        game_data = self._games_cache[game_id]
+        game_data, progreso = self._load_clasico(game_id, session_id, progress_token)
         internal = game_data["_internal"]
-        resultado_data = game_data["resultado"]
         
-        if resultado_data["revelado"]:
+        if progreso["resultado_revelado"]:
             return {
                 "correcto": False,
                 "mensaje": "⚠️ Ya adivinaste el resultado"
@@ -1663,12 +1961,13 @@ class GameGeneratorService:
         resultado_correcto_norm = internal["resultado_norm"].replace(" ", "").replace(":", "").replace("-", "")
         
         if resultado_norm == resultado_correcto_norm:
-            resultado_data["revelado"] = True
-            return {
+            progreso["resultado_revelado"] = True
+            resultado_data = self._vista_clasico(game_data, progreso)["resultado"]
+            return self._save_progreso(game_id, session_id, progreso, {
                 "correcto": True,
                 "mensaje": f"✅ ¡Correcto! El resultado fue {resultado_data['resultado_completo']}",
                 "resultado_revelado": resultado_data
-            }
+            })
         else:
             return {
                 "correcto": False,
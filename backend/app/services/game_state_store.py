@@ -0,0 +1,300 @@
+"""
+Per-session game progress stores
+
+The game definition of the day (clubs, formation, answers) is shared by
+every player and lives in GameGeneratorService. What each player has
+revealed so far is small and lives here, keyed by "{game_id}:{session_id}".
+
+States are stored serialized as compact JSON, so both backends hand out
+fresh dicts: callers load a state, update it and save it back.
+
+Backends:
+- memory: LRU + TTL, bounded by number of sessions and total bytes
+- sqlite: survives restarts and is shared by every worker of the host
+
+Updates are compare-and-set: replace(key, expected, state) only saves if
+the stored state is still the one the caller loaded, so two workers updating
+the same session can't lose each other's changes. The check and the write
+run in one short transaction(key); nothing is locked while the caller
+computes the update, and the one whose state went stale starts over.
+"""
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+def _dumps(state: Dict[str, Any]) -> str:
+    return json.dumps(state, separators=(',', ':'), ensure_ascii=False)
+
+
+class StaleStateError(Exception):
+    """A state update was computed from a state that has changed since it was loaded"""
+
+
+class GameStateStore(ABC):
+    """Key-value store of game progress with expiration"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Saved state, or None if missing or expired"""
+
+    @abstractmethod
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        """Save a state (resets its TTL)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Forget a state"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored states"""
+
+    @contextmanager
+    def transaction(self, key: str) -> Iterator[None]:
+        """
+        Make a get -> set of a key atomic for every thread and process using
+        the store (see replace)
+        """
+        yield
+
+    def replace(self, key: str, expected: Optional[Dict[str, Any]], state: Dict[str, Any]) -> bool:
+        """
+        Save a state only if the stored one is still `expected`
+
+        Args:
+            key: State key
+            expected: State the update was computed from (None: there was none)
+            state: New state
+
+        Returns:
+            False, without saving, if the state changed in the meantime
+        """
+        with self.transaction(key):
+            if self.get(key) != expected:
+                return False
+            self.set(key, state)
+            return True
+
+    def close(self) -> None:
+        """Release the store's connections, if any"""
+
+    def reopen(self) -> None:
+        """Reconnect after close() (e.g. in a forked worker)"""
+
+
+class MemoryGameStateStore(GameStateStore):
+    """
+    In-process store with LRU eviction and TTL
+
+    Args:
+        ttl_seconds: Idle time after which a state expires
+        max_sessions: Maximum number of states kept
+        max_bytes: Maximum total size of the serialized states
+    """
+
+    def __init__(self, ttl_seconds: int, max_sessions: int, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        # key -> (expires_at, serialized state), least recently used first
+        self._states: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._bytes = 0
+        # Reentrant: get/set run inside transaction()
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._states.get(key)
+            if entry is None:
+                return None
+
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self._states.move_to_end(key)
+            return json.loads(data)
+
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        data = _dumps(state)
+        with self._lock:
+            if key in self._states:
+                self._remove(key)
+
+            self._states[key] = (time.monotonic() + self.ttl_seconds, data)
+            self._bytes += len(key) + len(data)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._states:
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    @contextmanager
+    def transaction(self, key: str) -> Iterator[None]:
+        # Private to this process: the store's own lock is enough
+        with self._lock:
+            yield
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by the states (keys + serialized data)"""
+        return self._bytes
+
+    def _remove(self, key: str) -> None:
+        _, data = self._states.pop(key)
+        self._bytes -= len(key) + len(data)
+
+    def _evict(self) -> None:
+        """Drop expired states, then least recently used ones over the caps"""
+        now = time.monotonic()
+
+        # Entries are in LRU order, so expired ones are usually at the front
+        while self._states:
+            key, (expires_at, _) = next(iter(self._states.items()))
+            if expires_at > now:
+                break
+            self._remove(key)
+
+        while self._states and (len(self._states) > self.max_sessions or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._states)))
+
+
+class SQLiteGameStateStore(GameStateStore):
+    """
+    SQLite store, shared by every process that opens the same file
+
+    Args:
+        db_path: Database file (created if missing)
+        ttl_seconds: Idle time after which a state expires
+        max_sessions: Maximum number of states kept (oldest are pruned)
+    """
+
+    # Expired / excess rows are pruned every N writes
+    PRUNE_EVERY = 500
+
+    def __init__(self, db_path: Path, ttl_seconds: int, max_sessions: int):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        # Reentrant: get/set run inside transaction() on the same connection
+        self._lock = threading.RLock()
+        self._writes = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS game_state ("
+            " key TEXT PRIMARY KEY,"
+            " state TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS game_state_expires ON game_state (expires_at)")
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM game_state WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        data = _dumps(state)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO game_state (key, state, expires_at) VALUES (?, ?, ?)",
+                (key, data, time.time() + self.ttl_seconds)
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._prune()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM game_state WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM game_state").fetchone()[0]
+
+    @contextmanager
+    def transaction(self, key: str) -> Iterator[None]:
+        # The callers' locks are per process: BEGIN IMMEDIATE takes the
+        # database write lock before the state is read, so another worker
+        # updating the same key waits (busy timeout) instead of overwriting.
+        # Only replace() holds it, for one read and one write
+        with self._lock:
+            if self._conn.in_transaction:
+                yield
+                return
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _prune(self) -> None:
+        """Delete expired rows and the ones that expire first over the cap"""
+        self._conn.execute("DELETE FROM game_state WHERE expires_at <= ?", (time.time(),))
+        self._conn.execute(
+            "DELETE FROM game_state WHERE key IN ("
+            " SELECT key FROM game_state ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_sessions,)
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def reopen(self) -> None:
+        # SQLite connections must not cross fork(): the master closes its
+        # connection before forking and every worker opens its own
+        with self._lock:
+            self._conn = self._connect()
+
+
+def create_game_state_store(settings) -> GameStateStore:
+    """
+    Build the store selected by GAME_STATE_BACKEND
+
+    Args:
+        settings: Application settings
+    """
+    backend = settings.GAME_STATE_BACKEND.lower()
+
+    if backend == "sqlite":
+        return SQLiteGameStateStore(
+            Path(settings.GAME_STATE_DB_FILE),
+            ttl_seconds=settings.GAME_STATE_TTL_SECONDS,
+            max_sessions=settings.GAME_STATE_MAX_SESSIONS
+        )
+
+    if backend != "memory":
+        print(f"Warning: Unknown GAME_STATE_BACKEND '{settings.GAME_STATE_BACKEND}', using memory")
+
+    return MemoryGameStateStore(
+        ttl_seconds=settings.GAME_STATE_TTL_SECONDS,
+        max_sessions=settings.GAME_STATE_MAX_SESSIONS,
+        max_bytes=settings.GAME_STATE_MAX_BYTES
+    )
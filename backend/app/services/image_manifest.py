@@ -0,0 +1,82 @@
+"""
+In-memory manifest of the static images directory
+
+Maps image stems (path relative to IMAGES_DIR, without extension) to the
+file that exists on disk, so building responses never touches the
+filesystem. Built once from the data bundle or from a single directory
+walk at startup.
+"""
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Optional
+
+
+# When several files share a stem, the first extension in this list wins
+EXTENSIONS = ('png', 'jpg', 'jpeg', 'svg', 'gif', 'webp', 'avif')
+
+STATIC_URL_PREFIX = "/api/v1/static"
+
+
+def scan_images(images_dir: Path) -> Dict[str, str]:
+    """
+    Walk the images directory once
+
+    Args:
+        images_dir: Root images directory (scraping/data/images)
+
+    Returns:
+        Dict[stem] -> relative path, e.g.
+        'clubes/argentina/dep_riestra' -> 'clubes/argentina/dep_riestra.png'
+    """
+    images_dir = Path(images_dir)
+    prioridad = {ext: i for i, ext in enumerate(EXTENSIONS)}
+    manifest: Dict[str, str] = {}
+
+    if not images_dir.exists():
+        return manifest
+
+    for root, _, files in os.walk(images_dir):
+        relative_root = Path(root).relative_to(images_dir).as_posix()
+        for filename in files:
+            stem, _, ext = filename.rpartition('.')
+            ext = ext.lower()
+            if not stem or ext not in prioridad:
+                continue
+
+            key = stem if relative_root == '.' else f"{relative_root}/{stem}"
+            relative_path = filename if relative_root == '.' else f"{relative_root}/{filename}"
+            actual = manifest.get(key)
+            if actual is None or prioridad[ext] < prioridad[actual.rpartition('.')[2].lower()]:
+                manifest[key] = relative_path
+
+    return dict(sorted(manifest.items()))
+
+
+class ImageManifest:
+    """Lookup of static image URLs by stem"""
+
+    def __init__(self, entries: Mapping):
+        self._entries = entries
+
+    @classmethod
+    def from_directory(cls, images_dir: Path) -> "ImageManifest":
+        return cls(scan_images(images_dir))
+
+    def url(self, stem: str) -> Optional[str]:
+        """Static URL of an image stem, or None if there is no such file"""
+        relative_path = self._entries.get(stem)
+        if relative_path is None:
+            return None
+        return f"{STATIC_URL_PREFIX}/{relative_path}"
+
+    def logo_url(self, club_slug: str, pais_slug: str) -> Optional[str]:
+        """Club logo URL: country subfolder first, then the root clubes folder"""
+        return self.url(f"clubes/{pais_slug}/{club_slug}") or self.url(f"clubes/{club_slug}")
+
+    def jugador_url(self, jugador_slug: str) -> Optional[str]:
+        """Player photo URL by file slug (e.g. 'federico_carrizo')"""
+        return self.url(f"jugadores/{jugador_slug}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,705 @@
+"""
+Load-time lookup indexes over the scraped datasets
+
+Built once per dataset load so request handlers resolve guesses with a
+dict lookup instead of re-normalizing every player on every request.
+"""
+import sys
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.utils import TextUtils
+
+
+class ClubKeyTable:
+    """
+    Canonical club keys
+
+    The canonical key of a club is its normalized name as it appears in the
+    scraped data. Aliases (e.g. 'Independiente Rivadavia' for
+    'Ind. Rivadavia') resolve to the key of the club they name.
+    """
+
+    def __init__(self, nombres: Iterable[str], aliases: Mapping):
+        normalize = TextUtils.normalize_text
+        self._keys: Dict[str, str] = {}
+        self._nombres: Dict[str, str] = {}
+
+        for nombre in nombres:
+            key = normalize(nombre)
+            if key and key not in self._keys:
+                self._keys[key] = key
+                self._nombres[key] = nombre
+
+        for nombre, alias_list in aliases.items():
+            key = normalize(nombre)
+            self._keys.setdefault(key, key)
+            self._nombres.setdefault(key, nombre)
+            for alias in alias_list:
+                # Never let an alias shadow a club that exists in the data
+                self._keys.setdefault(normalize(alias), key)
+
+    def resolve(self, club_nombre: str) -> str:
+        """Canonical key of a club name or alias (normalized name if unknown)"""
+        key = TextUtils.normalize_text(club_nombre)
+        return self._keys.get(key, key)
+
+    def nombre(self, key: str) -> Optional[str]:
+        """Display name of a canonical key"""
+        return self._nombres.get(key)
+
+    def __contains__(self, club_nombre: str) -> bool:
+        return TextUtils.normalize_text(club_nombre) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._nombres)
+
+
+class PositionTable:
+    """
+    Game position codes (PO, DC, ED...) of Transfermarkt position names
+
+    Uses the 'consideraciones' of every formation in formaciones.json, with
+    a keyword fallback for positions they don't list.
+    """
+
+    def __init__(self, formaciones: Mapping):
+        self._consideraciones: Dict[str, set] = {}
+        for formacion_data in formaciones.get('formaciones', {}).values():
+            for tm_pos, game_pos in formacion_data.get('consideraciones', {}).items():
+                self._consideraciones.setdefault(tm_pos.lower(), set()).add(game_pos)
+        self._codigos: Dict[str, Tuple[str, ...]] = {}
+
+    def codigos(self, pos: str) -> Tuple[str, ...]:
+        """Possible game positions of a Transfermarkt position"""
+        codigos = self._codigos.get(pos)
+        if codigos is None:
+            codigos = tuple(sys.intern(c) for c in self._codigos_de(pos))
+            self._codigos[pos] = codigos
+        return codigos
+
+    def _codigos_de(self, pos: str) -> List[str]:
+        pos_lower = pos.lower().strip()
+
+        # Exact match in the considerations of any formation
+        posiciones_resultado = self._consideraciones.get(pos_lower)
+        if posiciones_resultado:
+            return list(posiciones_resultado)
+
+        # Fallback: partial match
+        if 'porter' in pos_lower or 'arquer' in pos_lower:
+            return ['PO']
+        elif 'defens' in pos_lower and 'central' in pos_lower:
+            return ['DC']
+        elif 'lateral' in pos_lower:
+            if 'derech' in pos_lower:
+                return ['ED']
+            elif 'izquier' in pos_lower:
+                return ['EI']
+            return ['ED', 'EI']
+        elif 'defens' in pos_lower:
+            return ['DC']
+        elif 'medio' in pos_lower or 'volante' in pos_lower:
+            if 'ofensivo' in pos_lower:
+                return ['MO', 'MC']
+            if 'derech' in pos_lower:
+                return ['MD', 'MC']
+            elif 'izquier' in pos_lower:
+                return ['MI', 'MC']
+            return ['MC']
+        elif 'delant' in pos_lower or 'atac' in pos_lower:
+            return ['DEL']
+
+        return ['MC']  # Default
+
+    def posiciones_jugador(self, jugador: Mapping) -> Tuple[str, ...]:
+        """
+        Every game position of a player (without duplicates)
+
+        Args:
+            jugador: Player with 'posiciones' (list) or 'posicion' (string)
+        """
+        todas_posiciones = set()
+
+        for pos in jugador.get('posiciones', []):
+            todas_posiciones.update(self.codigos(pos))
+
+        # Fallback to the single position field
+        if not todas_posiciones:
+            todas_posiciones.update(self.codigos(jugador.get('posicion', 'MC')))
+
+        return tuple(todas_posiciones)
+
+
+class Jugador:
+    """
+    In-memory player record: only the fields the games use, precomputed
+
+    One per player of rosario_central_jugadores.json (the raw records,
+    with every season's stats, are not kept). Club names and keys are
+    interned, so the players share one copy of each.
+    """
+
+    __slots__ = (
+        "id", "nombre", "apellido", "nombre_norm", "apellido_norm",
+        "clubes", "clubes_norm", "clubes_argentina", "tiene_rc", "partidos", "posiciones",
+        "posicion_principal", "image_profile"
+    )
+
+    def __init__(
+        self,
+        id: int,
+        nombre: str,
+        apellido: str,
+        nombre_norm: str,
+        apellido_norm: str,
+        clubes: Tuple[str, ...],
+        clubes_norm: FrozenSet[str],
+        clubes_argentina: int,
+        tiene_rc: bool,
+        partidos: int,
+        posiciones: Tuple[str, ...],
+        posicion_principal: Optional[str],
+        image_profile: Optional[str]
+    ):
+        self.id = id  # Position in rosario_central_jugadores.json
+        self.nombre = nombre
+        self.apellido = apellido
+        self.nombre_norm = nombre_norm
+        self.apellido_norm = apellido_norm
+        self.clubes = clubes  # Club names of the player's history, in order
+        self.clubes_norm = clubes_norm  # Canonical keys of those clubs
+        self.clubes_argentina = clubes_argentina  # Entries of the history in Argentina
+        self.tiene_rc = tiene_rc  # Played in Rosario Central
+        self.partidos = partidos
+        self.posiciones = posiciones  # Game position codes
+        self.posicion_principal = posicion_principal  # First Transfermarkt position (hints)
+        self.image_profile = image_profile
+
+    def __repr__(self) -> str:
+        return f"Jugador({self.id}, {self.nombre!r})"
+
+
+def _apellido(jugador: Mapping) -> str:
+    """Surname from 'apellido', falling back to the last word of the name"""
+    return jugador.get('apellido', jugador['nombre'].split()[-1])
+
+
+def build_jugadores(
+    jugadores: Iterable[Mapping],
+    club_keys: ClubKeyTable,
+    posiciones: PositionTable
+) -> Tuple[Jugador, ...]:
+    """
+    Build the in-memory player records
+
+    Args:
+        jugadores: Players as loaded from rosario_central_jugadores.json
+        club_keys: Canonical club key table
+        posiciones: Game positions of the Transfermarkt positions
+
+    Returns:
+        Tuple of Jugador, indexed by player id
+    """
+    normalize = TextUtils.normalize_text
+    intern = sys.intern
+    # Club name -> (interned name, interned canonical key)
+    clubes_vistos: Dict[str, Tuple[str, str]] = {}
+    registros: List[Jugador] = []
+
+    for jugador_id, jugador in enumerate(jugadores):
+        clubes: List[str] = []
+        claves: List[str] = []
+        clubes_argentina = 0
+        for c in jugador.get('clubes_historia', []):
+            club = c.get('nombre', '')
+            visto = clubes_vistos.get(club)
+            if visto is None:
+                visto = (intern(club), intern(club_keys.resolve(club)))
+                clubes_vistos[visto[0]] = visto
+            clubes.append(visto[0])
+            claves.append(visto[1])
+            clubes_argentina += c.get('pais') == 'Argentina'
+
+        nombre = jugador['nombre']
+        apellido = _apellido(jugador)
+        posiciones_tm = jugador.get('posiciones') or [None]
+        registros.append(Jugador(
+            id=jugador_id,
+            nombre=nombre,
+            apellido=apellido,
+            nombre_norm=normalize(nombre),
+            apellido_norm=normalize(apellido),
+            clubes=tuple(clubes),
+            clubes_norm=frozenset(claves),
+            clubes_argentina=clubes_argentina,
+            tiene_rc=any('rosario central' in c.lower() for c in clubes),
+            partidos=jugador.get('partidos', 0),
+            posiciones=posiciones.posiciones_jugador(jugador),
+            posicion_principal=intern(posiciones_tm[0]) if posiciones_tm[0] else None,
+            image_profile=jugador.get('image_profile')
+        ))
+
+    return tuple(registros)
+
+
+def build_jugadores_por_nombre(jugadores: Iterable[Jugador]) -> Dict[str, Tuple[Jugador, ...]]:
+    """
+    Map normalized surname and normalized full name to players
+
+    Entries keep the dataset order, so callers see matches in the same
+    order as a linear scan over the players would produce.
+
+    Args:
+        jugadores: Player records (build_jugadores)
+
+    Returns:
+        Dict[normalized name] -> tuple of Jugador
+    """
+    index: Dict[str, List[Jugador]] = {}
+
+    for jugador in jugadores:
+        for key in dict.fromkeys((jugador.apellido_norm, jugador.nombre_norm)):
+            index.setdefault(key, []).append(jugador)
+
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
+class TecnicoIndexado(NamedTuple):
+    """Coach record with its pre-normalized lookup keys"""
+    nombre: str
+    tecnico: Mapping
+    clubes_norm: FrozenSet[str]  # Canonical keys of every club of the coach's history
+
+
+def build_tecnicos_por_nombre(
+    tecnicos: Mapping,
+    club_keys: ClubKeyTable
+) -> Dict[str, Tuple[TecnicoIndexado, ...]]:
+    """
+    Map normalized coach surname and normalized full name to coach records
+
+    Args:
+        tecnicos: Dict[coach name] -> coach info, as in rosario_central_tecnicos.json
+        club_keys: Canonical club key table
+
+    Returns:
+        Dict[normalized name] -> tuple of TecnicoIndexado (dataset order)
+    """
+    normalize = TextUtils.normalize_text
+    index: Dict[str, List[TecnicoIndexado]] = {}
+
+    for nombre, tecnico in tecnicos.items():
+        entry = TecnicoIndexado(
+            nombre=nombre,
+            tecnico=tecnico,
+            clubes_norm=frozenset(
+                club_keys.resolve(c.get('club', '')) for c in tecnico.get('clubes_historia', [])
+            )
+        )
+
+        keys = (normalize(nombre.split()[-1]), normalize(nombre))
+        for key in dict.fromkeys(keys):
+            index.setdefault(key, []).append(entry)
+
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
+def build_jugadores_rc_por_club(jugadores: Iterable[Jugador]) -> Dict[str, Dict[str, Tuple[Jugador, ...]]]:
+    """
+    Players who played in Rosario Central by club and game position
+
+    Built from the player records, so it agrees with guess verification
+    (club in clubes_norm, position in posiciones) even for positions the
+    scraped club-position index doesn't have (e.g. 'PI').
+
+    Returns:
+        Dict[canonical club key][position] -> players, in dataset order
+    """
+    por_club: Dict[str, Dict[str, List[Jugador]]] = {}
+
+    for jugador in jugadores:
+        if not jugador.tiene_rc:
+            continue
+        for club_key in jugador.clubes_norm:
+            posiciones = por_club.setdefault(club_key, {})
+            for pos in jugador.posiciones:
+                posiciones.setdefault(pos, []).append(jugador)
+
+    return {
+        club_key: {pos: tuple(lista) for pos, lista in posiciones.items()}
+        for club_key, posiciones in por_club.items()
+    }
+
+
+class JugadorElegible(NamedTuple):
+    """Player eligible for an Equipo del Día category"""
+    id: int  # Position in rosario_central_jugadores.json
+    clubes_validos: Tuple[str, ...]  # Clubs of the category, as named in the player's history
+
+
+def build_jugadores_elegibles(
+    jugadores: Iterable[Jugador],
+    clubs_permitidos: Iterable[str]
+) -> Tuple[JugadorElegible, ...]:
+    """
+    Players who played in Rosario Central and in at least one permitted club
+
+    Args:
+        jugadores: Player records (build_jugadores)
+        clubs_permitidos: Club names of the category (clubes.json)
+
+    Returns:
+        Tuple of JugadorElegible, in dataset order
+    """
+    normalize = TextUtils.normalize_text
+    permitidos = frozenset(normalize(club) for club in clubs_permitidos)
+    pool: List[JugadorElegible] = []
+
+    for jugador in jugadores:
+        if not jugador.tiene_rc:
+            continue
+
+        clubes_validos = tuple(
+            c for c in jugador.clubes
+            if 'rosario central' not in c.lower() and normalize(c) in permitidos
+        )
+
+        if clubes_validos and jugador.partidos >= 1:
+            pool.append(JugadorElegible(id=jugador.id, clubes_validos=clubes_validos))
+
+    return tuple(pool)
+
+
+def emparejamiento_maximo(adyacencia: Sequence[Iterable[int]], n_derecha: int) -> List[int]:
+    """
+    Maximum bipartite matching (Hopcroft-Karp)
+
+    Each phase finds the shortest augmenting paths with a BFS from the free
+    left nodes and augments along vertex-disjoint ones with a DFS, so it
+    takes O(E * sqrt(V)); neighbours are tried in the given order, which
+    makes the result deterministic.
+
+    Args:
+        adyacencia: Right nodes (0 .. n_derecha - 1) each left node can take
+        n_derecha: Number of right nodes
+
+    Returns:
+        Right node matched to each left node, -1 if unmatched
+    """
+    vecinos = [tuple(v) for v in adyacencia]
+    pareja_izq = [-1] * len(vecinos)
+    pareja_der = [-1] * n_derecha
+
+    while True:
+        # BFS: layer of every left node reachable by an alternating path
+        capa = [-1] * len(vecinos)
+        cola = [i for i, pareja in enumerate(pareja_izq) if pareja == -1]
+        for i in cola:
+            capa[i] = 0
+        hay_camino = False
+        for i in cola:
+            for j in vecinos[i]:
+                k = pareja_der[j]
+                if k == -1:
+                    hay_camino = True
+                elif capa[k] == -1:
+                    capa[k] = capa[i] + 1
+                    cola.append(k)
+
+        if not hay_camino:
+            return pareja_izq
+
+        def aumentar(i: int) -> bool:
+            for j in vecinos[i]:
+                k = pareja_der[j]
+                if k == -1 or (capa[k] == capa[i] + 1 and aumentar(k)):
+                    pareja_izq[i] = j
+                    pareja_der[j] = i
+                    return True
+            # Dead end: not visited again in this phase
+            capa[i] = -1
+            return False
+
+        for i in range(len(vecinos)):
+            if pareja_izq[i] == -1:
+                aumentar(i)
+
+
+class Candidato(NamedTuple):
+    """Name suggested by the autocomplete"""
+    nombre: str
+    apellido: str
+    tipo: str  # 'jugador', 'entrenador' or 'arbitro'
+
+
+class PrefixIndex:
+    """
+    Prefix search over normalized names: sorted keys and bisect
+
+    Every name is indexed from the start of each of its words (and by its
+    surname), so 'mari' finds 'Ángel Di María'. A search is a binary
+    search plus a scan of the matching run, whatever the number of names.
+    """
+
+    __slots__ = ("_claves", "_refs", "_candidatos")
+
+    def __init__(self, candidatos: Iterable[Candidato]):
+        normalize = TextUtils.normalize_text
+        self._candidatos = tuple(candidatos)
+        pares: List[Tuple[str, int]] = []
+
+        for ref, candidato in enumerate(self._candidatos):
+            palabras = normalize(candidato.nombre).split()
+            claves = {' '.join(palabras[i:]) for i in range(len(palabras))}
+            claves.add(normalize(candidato.apellido))
+            pares.extend((clave, ref) for clave in claves if clave)
+
+        # Same key: dataset order
+        pares.sort()
+        self._claves = [clave for clave, _ in pares]
+        self._refs = [ref for _, ref in pares]
+
+    def buscar(self, prefijo: str, limite: int) -> List[Candidato]:
+        """
+        Names with a word starting with a prefix, by matching key
+
+        Args:
+            prefijo: Already passed through TextUtils.normalize_text
+            limite: Maximum number of names
+        """
+        if not prefijo or limite <= 0:
+            return []
+
+        claves = self._claves
+        resultado: List[Candidato] = []
+        vistos = set()
+        i = bisect_left(claves, prefijo)
+
+        while i < len(claves) and len(resultado) < limite and claves[i].startswith(prefijo):
+            ref = self._refs[i]
+            if ref not in vistos:
+                vistos.add(ref)
+                resultado.append(self._candidatos[ref])
+            i += 1
+
+        return resultado
+
+    def __len__(self) -> int:
+        return len(self._candidatos)
+
+
+# Typo tolerance: edits allowed by length of the guess (without separators)
+LARGO_MINIMO_TYPO = 4  # Shorter guesses must match exactly
+LARGO_MINIMO_DOS_TYPOS = 9
+MAXIMO_TYPOS = 2
+
+# Spaces and punctuation are not counted as edits ('dimaria' is 'di maria')
+_SEPARADORES = str.maketrans('', '', " .-'")
+
+
+def _compacto(texto: str) -> str:
+    return texto.translate(_SEPARADORES)
+
+
+def typos_permitidos(largo: int) -> int:
+    """Edits tolerated in a guess of this length (spaces and punctuation not counted)"""
+    if largo < LARGO_MINIMO_TYPO:
+        return 0
+    if largo < LARGO_MINIMO_DOS_TYPOS:
+        return 1
+    return MAXIMO_TYPOS
+
+
+def distancia_edicion(a: str, b: str, maximo: int) -> int:
+    """
+    Edit distance with adjacent transpositions (optimal string alignment)
+
+    Returns maximo + 1 as soon as the distance is known to exceed `maximo`.
+    """
+    # The common prefix and suffix cost nothing: typos leave most of a name intact
+    inicio = 0
+    while inicio < len(a) and inicio < len(b) and a[inicio] == b[inicio]:
+        inicio += 1
+    fin_a, fin_b = len(a), len(b)
+    while fin_a > inicio and fin_b > inicio and a[fin_a - 1] == b[fin_b - 1]:
+        fin_a -= 1
+        fin_b -= 1
+    a, b = a[inicio:fin_a], b[inicio:fin_b]
+
+    if abs(len(a) - len(b)) > maximo:
+        return maximo + 1
+    if not a or not b:
+        return max(len(a), len(b))
+
+    # Only the cells within `maximo` of the diagonal can stay within `maximo`
+    tope = maximo + 1
+    anterior2: List[int] = []
+    anterior = [min(j, tope) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        actual = [tope] * (len(b) + 1)
+        actual[0] = min(i, tope)
+        fila_minimo = actual[0]
+        for j in range(max(1, i - maximo), min(len(b), i + maximo) + 1):
+            valor = min(
+                anterior[j] + 1,
+                actual[j - 1] + 1,
+                anterior[j - 1] + (a[i - 1] != b[j - 1])
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                valor = min(valor, anterior2[j - 2] + 1)
+            actual[j] = valor
+            if valor < fila_minimo:
+                fila_minimo = valor
+        if fila_minimo > maximo:
+            return tope
+        anterior2, anterior = anterior, actual
+
+    return min(anterior[-1], tope)
+
+
+def _bigramas(compacto: str) -> FrozenSet[str]:
+    """Distinct bigrams of a name, with start and end markers"""
+    texto = f"^{compacto}$"
+    return frozenset(texto[i:i + 2] for i in range(len(texto) - 1))
+
+
+# Bigrams one edit can remove from a name (a transposition replaces 3)
+_BIGRAMAS_POR_EDICION = 3
+
+
+class FuzzyIndex:
+    """
+    Names within a small edit distance of a guess (bigram index)
+
+    A name within k edits of the guess keeps all but at most 3k of the
+    guess's bigrams, so it must contain one of the guess's 3k + 1 rarest
+    bigrams: only the names in those postings that share enough bigrams
+    are compared with the real edit distance, a handful per lookup
+    instead of every name.
+    """
+
+    __slots__ = ("_compactos", "_claves", "_bigramas", "_postings")
+
+    def __init__(self, claves: Iterable[str]):
+        """
+        Args:
+            claves: Normalized names (TextUtils.normalize_text)
+        """
+        por_compacto: Dict[str, List[str]] = {}
+        for clave in claves:
+            compacto = _compacto(clave)
+            if compacto:
+                por_compacto.setdefault(compacto, []).append(clave)
+
+        self._compactos = tuple(sorted(por_compacto))
+        self._claves = tuple(tuple(sorted(set(por_compacto[c]))) for c in self._compactos)
+        self._bigramas = tuple(_bigramas(c) for c in self._compactos)
+
+        postings: Dict[str, List[int]] = {}
+        for ref, bigramas in enumerate(self._bigramas):
+            for bigrama in bigramas:
+                postings.setdefault(bigrama, []).append(ref)
+        self._postings = {bigrama: tuple(refs) for bigrama, refs in postings.items()}
+
+    def buscar(self, texto_normalizado: str) -> List[Tuple[int, str]]:
+        """
+        Names within the edits tolerated for the guess's length
+
+        Args:
+            texto_normalizado: Guess passed through TextUtils.normalize_text
+
+        Returns:
+            (distance, name), closest first and alphabetical among equals
+        """
+        compacto = _compacto(texto_normalizado)
+        maximo = typos_permitidos(len(compacto))
+        bigramas = _bigramas(compacto)
+        minimo_comun = len(bigramas) - _BIGRAMAS_POR_EDICION * maximo
+
+        if minimo_comun > 0:
+            postings = sorted((self._postings.get(b, ()) for b in bigramas), key=len)
+            candidatos = set(chain.from_iterable(postings[:len(postings) - minimo_comun + 1]))
+        else:
+            # Too short for the filter ('aaaa')
+            candidatos = range(len(self._compactos))
+
+        encontrados: List[Tuple[int, str]] = []
+        for ref in candidatos:
+            candidato = self._compactos[ref]
+            if abs(len(candidato) - len(compacto)) > maximo or len(bigramas & self._bigramas[ref]) < minimo_comun:
+                continue
+            distancia = distancia_edicion(compacto, candidato, maximo)
+            if distancia <= maximo:
+                encontrados.extend((distancia, clave) for clave in self._claves[ref])
+
+        encontrados.sort()
+        return encontrados
+
+    def corregir(self, texto_normalizado: str) -> Optional[str]:
+        """The closest name, or None if there is none or two are equally close"""
+        encontrados = self.buscar(texto_normalizado)
+        if not encontrados or (len(encontrados) > 1 and encontrados[1][0] == encontrados[0][0]):
+            return None
+        return encontrados[0][1]
+
+    def __len__(self) -> int:
+        return len(self._compactos)
+
+
+# Candidate sets of the autocomplete (None: every name)
+ALCANCES_AUTOCOMPLETADO = ("jugadores", "jugadores_rc", "entrenadores", "arbitros")
+
+
+def build_autocompletado(
+    jugadores: Iterable[Jugador],
+    tecnicos: Mapping,
+    clasicos: Iterable[Mapping]
+) -> Dict[Optional[str], PrefixIndex]:
+    """
+    Prefix indexes of every player, coach and referee name
+
+    Args:
+        jugadores: Player records (build_jugadores)
+        tecnicos: Dict[coach name] -> coach info, as in rosario_central_tecnicos.json
+        clasicos: Matches of rosario_central_clasicos_game.json (coaches and referees)
+
+    Returns:
+        Dict[alcance] -> PrefixIndex, with None for all the names
+    """
+    normalize = TextUtils.normalize_text
+    jugadores = tuple(jugadores)
+    candidatos_jugadores = [Candidato(j.nombre, j.apellido, 'jugador') for j in jugadores]
+    entrenadores: Dict[str, Candidato] = {}
+    arbitros: Dict[str, Candidato] = {}
+
+    for nombre in tecnicos:
+        entrenadores.setdefault(normalize(nombre), Candidato(nombre, nombre.split()[-1], 'entrenador'))
+
+    for partido in clasicos:
+        entrenador = partido.get('entrenador') or {}
+        if entrenador.get('nombre_completo'):
+            nombre = entrenador['nombre_completo']
+            entrenadores.setdefault(
+                normalize(nombre), Candidato(nombre, entrenador.get('apellido', nombre), 'entrenador')
+            )
+
+        arbitro = partido.get('arbitro') or {}
+        if arbitro.get('nombre_completo'):
+            nombre = arbitro['nombre_completo']
+            arbitros.setdefault(normalize(nombre), Candidato(nombre, arbitro.get('apellido', nombre), 'arbitro'))
+
+    por_alcance = {
+        "jugadores": candidatos_jugadores,
+        "jugadores_rc": [c for c, j in zip(candidatos_jugadores, jugadores) if j.tiene_rc],
+        "entrenadores": list(entrenadores.values()),
+        "arbitros": list(arbitros.values())
+    }
+
+    indices: Dict[Optional[str], PrefixIndex] = {
+        alcance: PrefixIndex(por_alcance[alcance]) for alcance in ALCANCES_AUTOCOMPLETADO
+    }
+    indices[None] = PrefixIndex(candidatos_jugadores + por_alcance["entrenadores"] + por_alcance["arbitros"])
+    return indices
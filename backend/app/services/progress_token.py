@@ -0,0 +1,103 @@
+"""
+Signed game-progress tokens (GAME_STATE_MODE=token)
+
+The progress of a game travels with the client as a JWT signed with
+GAME_TOKEN_SECRET instead of being kept on the server, so any worker on
+any node can serve any request. Keys are shortened to keep tokens small.
+"""
+import secrets
+import time
+from typing import Any, Dict, Optional
+
+from jose import JWTError, jwt
+
+
+# Progress key -> token key
+_CLAVES = {
+    'clubes_index': 'c',
+    'revelados': 'r',
+    'jugadores': 'j',
+    'entrenador_revelado': 'e',
+    'arbitro_revelado': 'a',
+    'resultado_revelado': 'rs',
+    'pistas_usadas': 'h',
+    'revelaciones_usadas': 'v',
+    'pendiente_jugadores': 'pj',
+    'pendiente_posicion': 'pp'
+}
+_CLAVES_INVERSAS = {corta: larga for larga, corta in _CLAVES.items()}
+
+
+class ProgressTokenCodec:
+    """Encode / decode game progress as signed tokens bound to a game_id"""
+
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str = "HS256",
+        ttl_seconds: int = 36 * 3600,
+        allow_random_secret: bool = False
+    ):
+        """
+        Args:
+            secret: Signing key, shared by every worker
+            algorithm: JWS algorithm (HMAC)
+            ttl_seconds: Token lifetime
+            allow_random_secret: Development only, sign with a per-process
+                random key when no secret is given
+
+        Raises:
+            ValueError: If the secret is empty and the random key is not allowed
+        """
+        if not secret:
+            if not allow_random_secret:
+                raise ValueError(
+                    "GAME_TOKEN_SECRET is required with GAME_STATE_MODE=token "
+                    "(set GAME_TOKEN_ALLOW_RANDOM_SECRET=true only for local development)"
+                )
+            print("Warning: GAME_TOKEN_SECRET is not set, using a random key (tokens only valid in this process)")
+            secret = secrets.token_urlsafe(32)
+
+        self._secret = secret
+        self.algorithm = algorithm
+        self.ttl_seconds = ttl_seconds
+
+    def encode(self, game_id: str, progreso: Dict[str, Any]) -> str:
+        """Sign the progress of a game"""
+        claims = {
+            'g': game_id,
+            'p': {_CLAVES.get(k, k): v for k, v in progreso.items()},
+            'exp': int(time.time()) + self.ttl_seconds
+        }
+        return jwt.encode(claims, self._secret, algorithm=self.algorithm)
+
+    def decode(self, token: str, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify a token and return its progress
+
+        Returns:
+            Progress dict, or None if the token is invalid, expired or
+            belongs to another game
+        """
+        try:
+            claims = jwt.decode(token, self._secret, algorithms=[self.algorithm])
+        except JWTError:
+            return None
+
+        if claims.get('g') != game_id or not isinstance(claims.get('p'), dict):
+            return None
+
+        return {_CLAVES_INVERSAS.get(k, k): v for k, v in claims['p'].items()}
+
+
+def create_progress_token_codec(settings) -> Optional[ProgressTokenCodec]:
+    """Codec for GAME_STATE_MODE=token, None in server mode"""
+    if settings.GAME_STATE_MODE.lower() != "token":
+        return None
+
+    return ProgressTokenCodec(
+        settings.GAME_TOKEN_SECRET,
+        algorithm=settings.GAME_TOKEN_ALGORITHM,
+        ttl_seconds=settings.GAME_STATE_TTL_SECONDS,
+        allow_random_secret=settings.GAME_TOKEN_ALLOW_RANDOM_SECRET
+    )
@@ -0,0 +1,125 @@
+"""
+HTTP response cache for the daily game endpoints
+
+The game payloads are the same for every player of the day, so they are
+built once per (endpoint, game_id, data version), encoded and gzipped once,
+and served as raw bytes with a strong ETag: clients that already have them
+get a 304 Not Modified. Cache-Control makes shared responses expire at the
+next game rollover.
+"""
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+from app.utils import DateUtils, JsonUtils
+
+
+# Smaller bodies are not worth compressing
+GZIP_MIN_BYTES = 512
+
+
+class CachedResponse(NamedTuple):
+    """A pre-encoded response body, its gzip variant and their strong ETags"""
+    body: bytes
+    body_gzip: Optional[bytes]
+    etag: str
+    etag_gzip: str
+
+
+class ResponseCache:
+    """Bounded LRU of built response payloads"""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Args:
+            max_entries: Payloads kept (per-progress variants make the key space open)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, construir: Callable[[], Any]) -> CachedResponse:
+        """
+        Cached payload for a key, built with `construir` on a miss
+
+        Args:
+            key: Must include everything the payload depends on (game_id, data version...)
+            construir: Returns the payload (anything JsonUtils.dumps can encode)
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        body = JsonUtils.dumps(construir())
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        cached = CachedResponse(
+            body=body,
+            # mtime=0: same bytes on every worker
+            body_gzip=gzip.compress(body, compresslevel=9, mtime=0) if len(body) >= GZIP_MIN_BYTES else None,
+            etag=f'"{digest}"',
+            etag_gzip=f'"{digest}-gz"'
+        )
+
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return cached
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def etag_coincide(if_none_match: Optional[str], cached: CachedResponse) -> bool:
+    """
+    If-None-Match check (weak comparison, as RFC 9110 requires for it)
+
+    Either encoding's ETag matches: both have the same content.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        candidato.strip().removeprefix('W/') in (cached.etag, cached.etag_gzip)
+        for candidato in if_none_match.split(',')
+    )
+
+
+def acepta_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip"""
+    for codificacion in (accept_encoding or '').lower().split(','):
+        nombre, _, parametros = codificacion.partition(';')
+        if nombre.strip() in ('gzip', '*'):
+            q = parametros.strip().removeprefix('q=')
+            try:
+                return not q or float(q) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def cache_control(compartida: bool) -> str:
+    """
+    Cache-Control of a daily game response
+
+    Args:
+        compartida: Same response for everyone until the next rollover
+            (browsers and CDNs may keep it). Otherwise it depends on the
+            player's session, so it must be revalidated on every use.
+    """
+    if not compartida:
+        return 'private, no-cache'
+
+    segundos = int((DateUtils.proximo_cambio() - DateUtils.ahora()).total_seconds())
+    return f'public, max-age={max(segundos, 0)}'
@@ -0,0 +1,79 @@
+"""
+Background pre-generation of the daily games
+
+Started from the FastAPI lifespan. Builds today's games at startup and the
+next day's games a few minutes before the rollover (GAME_REFRESH_HOUR in
+TIMEZONE), so no request pays for generating them and there is no
+thundering herd at midnight.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.utils import DateUtils
+
+
+class DailyGameScheduler:
+    """Pre-generates the daily games of GameGeneratorService"""
+
+    # Failed generations are retried; after that requests build the games on demand
+    INTENTOS = 3
+    REINTENTO_SEGUNDOS = 60
+
+    def __init__(self, generator, anticipacion_minutos: int = 5):
+        """
+        Args:
+            generator: GameGeneratorService
+            anticipacion_minutos: How long before the rollover the next day is built
+        """
+        self.generator = generator
+        self.anticipacion = timedelta(minutes=anticipacion_minutos)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the scheduler task on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="daily-game-scheduler")
+
+    async def stop(self) -> None:
+        """Cancel the scheduler task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        # Today's games first, so the first request after startup is fast
+        await self._pregenerar(DateUtils.fecha_juego())
+
+        while True:
+            cambio = DateUtils.proximo_cambio()
+
+            await self._dormir_hasta(cambio - self.anticipacion)
+            await self._pregenerar(DateUtils.fecha_juego(cambio))
+
+            await self._dormir_hasta(cambio)
+            self.generator.descartar_juegos_anteriores()
+
+    async def _pregenerar(self, fecha) -> None:
+        """Build the games of a date in a worker thread, retrying on errors"""
+        for intento in range(1, self.INTENTOS + 1):
+            try:
+                game_ids = await asyncio.to_thread(self.generator.pregenerar_juegos, fecha)
+                print(f"✅ Juegos del {fecha.isoformat()} generados: {', '.join(game_ids)}")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Warning: Could not pre-generate games for {fecha.isoformat()} (attempt {intento}): {e}")
+                if intento < self.INTENTOS:
+                    await asyncio.sleep(self.REINTENTO_SEGUNDOS)
+
+    @staticmethod
+    async def _dormir_hasta(momento: datetime) -> None:
+        segundos = (momento - DateUtils.ahora()).total_seconds()
+        if segundos > 0:
+            await asyncio.sleep(segundos)
@@ -0,0 +1,5 @@
+from .date_utils import DateUtils
+from .json_utils import FastJSONResponse, JsonUtils
+from .text_utils import TextUtils
+
+__all__ = ["DateUtils", "FastJSONResponse", "JsonUtils", "TextUtils"]
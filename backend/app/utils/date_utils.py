@@ -0,0 +1,59 @@
+"""
+Game day helpers: the daily games change at GAME_REFRESH_HOUR in TIMEZONE
+"""
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.config import settings
+
+
+class DateUtils:
+    """Static helpers for the game calendar"""
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_timezone() -> tzinfo:
+        """Configured timezone (UTC if the tz database is not available)"""
+        try:
+            return ZoneInfo(settings.TIMEZONE)
+        except (ZoneInfoNotFoundError, ValueError):
+            print(f"Warning: Unknown timezone '{settings.TIMEZONE}' (is tzdata installed?), using UTC")
+            return timezone.utc
+
+    @staticmethod
+    def ahora() -> datetime:
+        """Current time in the configured timezone"""
+        return datetime.now(DateUtils.get_timezone())
+
+    @staticmethod
+    def fecha_juego(ahora: Optional[datetime] = None) -> date:
+        """
+        Date of the games being played at a given time
+
+        Before GAME_REFRESH_HOUR the previous day's games are still current.
+
+        Args:
+            ahora: Aware datetime (defaults to now)
+        """
+        ahora = (ahora or DateUtils.ahora()).astimezone(DateUtils.get_timezone())
+        if ahora.hour < settings.GAME_REFRESH_HOUR:
+            return ahora.date() - timedelta(days=1)
+        return ahora.date()
+
+    @staticmethod
+    def proximo_cambio(ahora: Optional[datetime] = None) -> datetime:
+        """
+        Next rollover to a new game day
+
+        Args:
+            ahora: Aware datetime (defaults to now)
+
+        Returns:
+            Aware datetime in the configured timezone
+        """
+        tz = DateUtils.get_timezone()
+        ahora = (ahora or DateUtils.ahora()).astimezone(tz)
+        siguiente = DateUtils.fecha_juego(ahora) + timedelta(days=1)
+        return datetime.combine(siguiente, time(hour=settings.GAME_REFRESH_HOUR), tzinfo=tz)
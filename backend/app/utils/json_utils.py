@@ -0,0 +1,44 @@
+"""
+Fast JSON encoding for API responses: orjson when installed, stdlib json otherwise
+"""
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    # Fallback: stdlib json (same JSON, slower)
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Types the encoders don't know: read-only bundle containers and models"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return list(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JsonUtils:
+    """Static JSON helpers"""
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON"""
+        if orjson is not None:
+            return orjson.dumps(obj, default=_default)
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with JsonUtils.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        return JsonUtils.dumps(content)
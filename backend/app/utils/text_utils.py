@@ -0,0 +1,52 @@
+"""
+Text helpers shared by the data loader and the game generator
+"""
+import re
+import unicodedata
+from functools import lru_cache
+
+
+class TextUtils:
+    """Static text normalization helpers"""
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def normalize_text(text: str) -> str:
+        """
+        Normalize text by removing accents/tildes and converting to lowercase
+        Keeps dots, spaces, and other punctuation to maintain club name consistency
+        
+        Examples:
+            'Ángel Di María' -> 'angel di maria'
+            'Pérez' -> 'perez'
+            'Ind. Rivadavia' -> 'ind. rivadavia'
+            'Def. y Justicia' -> 'def. y justicia'
+        """
+        if not text:
+            return ""
+        # Convert to NFD (decomposed) form, then remove combining characters (accents)
+        nfd = unicodedata.normalize('NFD', text)
+        without_accents = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+        # Convert to lowercase and normalize whitespace
+        cleaned = without_accents.lower()
+        cleaned = ' '.join(cleaned.split())
+        return cleaned
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def slugify(text: str) -> str:
+        """
+        File-name slug, same logic as the scraper (text_utils.py)
+        
+        Examples:
+            "Newell's" -> 'newell_s'
+            'San Martín (T)' -> 'san_martin_t'
+            'España' -> 'espana'
+        """
+        slug = text.lower()
+        # Remove accents
+        nfd = unicodedata.normalize('NFD', slug)
+        slug = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+        # Replace ALL special characters with underscore and trim them at the ends
+        slug = re.sub(r'[^a-z0-9]+', '_', slug)
+        return slug.strip('_')
@@ -0,0 +1,9 @@
+"""
+Compile the scraped JSON data into the binary data bundle
+"""
+import sys
+
+from app.services.data_bundle import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 """
-Run the FastAPI server
+Run the FastAPI development server (auto-reload)
+
+For production use serve.py: pre-forked workers sharing the loaded data
 """
 import uvicorn
 
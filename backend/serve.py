@@ -0,0 +1,9 @@
+"""
+Run the production server: data loaded once, shared by pre-forked workers
+"""
+import sys
+
+from app.core.prefork import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Tests de la tolerancia a errores de tipeo en las respuestas
+"""
+
+import unittest
+from datetime import date
+
+from app.services.data_loader import data_loader_service
+from app.services.game_generator import game_generator_service
+from app.services.indexes import FuzzyIndex
+
+
+class TestCorreccionEquipo(unittest.TestCase):
+    """Tests de la corrección de respuestas del Equipo del Día"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.datos = data_loader_service.snapshot
+        definicion = game_generator_service._crear_equipo_del_dia('equipo_nacional', 'Nacional', date(2026, 3, 4))
+        # Todos los clubes del juego son Boca Juniors
+        cls.definicion = dict(definicion, clubes_list=['Boca Juniors'] * len(definicion['clubes_list']))
+    
+    def _verificar(self, respuesta):
+        progreso = game_generator_service._nuevo_progreso_equipo()
+        return game_generator_service._verificar_respuesta(
+            self.definicion, progreso, game_generator_service._normalize_text(respuesta)
+        )
+    
+    def test_nombre_exacto_de_otro_jugador_no_se_corrige(self):
+        """Test de que un jugador real que no jugó en el club es incorrecto (Hernández no es Fernández)"""
+        self.assertTrue(self.datos.es_nombre_conocido('hernandez'))
+        self.assertEqual(self.datos.corregir_respuesta('hernandez', self.datos.resolve_club('Boca Juniors')), (None, ()))
+        
+        result = self._verificar('Hernández')
+        self.assertFalse(result['correcto'])
+    
+    def test_error_de_tipeo_se_corrige(self):
+        """Test de corrección de un nombre mal escrito"""
+        result = self._verificar('Pol Fernandes')
+        self.assertTrue(result['correcto'])
+        self.assertIn('Pol Fernández', result['mensaje'])
+
+
+
+class TestCorreccionClasico(unittest.TestCase):
+    """Tests de la corrección de respuestas del Clásico del Día"""
+    
+    def setUp(self):
+        posicion = {
+            'posicion': 'MC',
+            'numero': 5,
+            'jugador_apellido': 'Fernández',
+            'jugador_nombre_completo': 'Pol Fernández',
+            'image_url': None,
+            'goles': 0
+        }
+        internal = {
+            'jugadores_map': {'fernandez': 0},
+            'entrenador_apellido_norm': 'russo',
+            'arbitro_apellido_norm': 'loustau',
+            'resultado_norm': '1-0'
+        }
+        internal['respuestas_aproximadas'] = FuzzyIndex(['fernandez', 'russo', 'loustau'])
+        self.game_data = {'posiciones': [posicion], '_internal': internal}
+        self.progreso = game_generator_service._nuevo_progreso_clasico()
+    
+    def test_nombre_exacto_de_otro_jugador_no_se_corrige(self):
+        """Test de que un jugador real a una letra de una respuesta es incorrecto"""
+        self.assertTrue(data_loader_service.snapshot.es_nombre_conocido('hernandez'))
+        
+        result = game_generator_service._verificar_respuesta_clasico(self.game_data, self.progreso, 'Hernández')
+        self.assertFalse(result['correcto'])
+        self.assertEqual(self.progreso['revelados'], 0)
+    
+    def test_error_de_tipeo_se_corrige(self):
+        """Test de corrección de un apellido mal escrito"""
+        result = game_generator_service._verificar_respuesta_clasico(self.game_data, self.progreso, 'Fernandes')
+        self.assertTrue(result['correcto'])
+        self.assertEqual(self.progreso['revelados'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
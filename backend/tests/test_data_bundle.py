@@ -0,0 +1,164 @@
+"""
+Tests del bundle binario de datos (app/services/data_bundle.py)
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from app.services.data_bundle import (
+    FORMAT_VERSION,
+    MAGIC,
+    _HEADER,
+    BundleFormatError,
+    DataBundle,
+    build_bundle,
+)
+
+
+JUGADORES = {
+    "metadata": {"total_jugadores": 2, "fecha": "2026-03-04"},
+    "jugadores": [
+        {
+            "nombre": "Marco Ruben",
+            "nacionalidad": "Argentina",
+            "posicion_principal": "DC",
+            "partidos": 280,
+            "goles": 101,
+            "altura": 1.78,
+            "activo": False,
+            "apodo": None,
+            "clubes_historia": [
+                {"nombre": "Rosario Central", "desde": 2005, "hasta": 2022},
+                {"nombre": "Villarreal", "desde": 2008, "hasta": 2011},
+            ],
+        },
+        {
+            "nombre": "Ángel Di María",
+            "nacionalidad": "Argentina",
+            "posicion_principal": "ED",
+            "partidos": 35,
+            "goles": 8,
+            "altura": 1.8,
+            "activo": True,
+            "apodo": "Fideo",
+            "clubes_historia": [],
+        },
+    ],
+}
+
+# Más de 8 claves para que el objeto use la tabla de slots
+TECNICOS = {f"tecnico_{i}": {"partidos": i * 10, "saldo": -i, "id": 2 ** 40 + i} for i in range(12)}
+
+
+def _a_python(valor):
+    """Convertir las vistas del bundle en dicts/listas comunes"""
+    if isinstance(valor, Mapping):
+        return {clave: _a_python(v) for clave, v in valor.items()}
+    if isinstance(valor, Sequence) and not isinstance(valor, str):
+        return [_a_python(v) for v in valor]
+    return valor
+
+
+class TestDataBundle(unittest.TestCase):
+    """Tests de ida y vuelta JSON -> bundle -> vistas mmap"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.sources = {
+            "jugadores": self.dir / "jugadores.json",
+            "tecnicos": self.dir / "tecnicos.json",
+        }
+        self.sources["jugadores"].write_text(json.dumps(JUGADORES, ensure_ascii=False), encoding="utf-8")
+        self.sources["tecnicos"].write_text(json.dumps(TECNICOS), encoding="utf-8")
+        self.bundle_path = self.dir / "data.bundle"
+        self.stats = build_bundle(self.sources, self.bundle_path, extra_datasets={"extra": [1, "dos", None]})
+        self.bundle = DataBundle(self.bundle_path)
+
+    def tearDown(self):
+        self.bundle.close()
+        self._tmp.cleanup()
+
+    def test_ida_y_vuelta_igual_al_json(self):
+        """Test de que cada dataset leído del bundle es igual al JSON original"""
+        for nombre, path in self.sources.items():
+            esperado = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual(_a_python(self.bundle.dataset(nombre)), esperado, nombre)
+        self.assertEqual(_a_python(self.bundle.dataset("extra")), [1, "dos", None])
+        self.assertEqual(self.stats["datasets"], ["extra", "jugadores", "tecnicos"])
+
+    def test_vistas_mapping_y_sequence(self):
+        """Test de acceso por clave e índice sobre las vistas"""
+        jugadores = self.bundle.dataset("jugadores")["jugadores"]
+        self.assertIsInstance(jugadores, Sequence)
+        self.assertEqual(len(jugadores), 2)
+        self.assertEqual(jugadores[-1]["nombre"], "Ángel Di María")
+        self.assertEqual(jugadores[0]["clubes_historia"][1]["nombre"], "Villarreal")
+        self.assertEqual([j["apodo"] for j in jugadores[0:2]], [None, "Fideo"])
+        self.assertAlmostEqual(jugadores[0]["altura"], 1.78)
+        with self.assertRaises(IndexError):
+            jugadores[2]
+
+        tecnicos = self.bundle.dataset("tecnicos")
+        self.assertIsInstance(tecnicos, Mapping)
+        self.assertIn("tecnico_11", tecnicos)
+        self.assertNotIn("tecnico_12", tecnicos)
+        self.assertEqual(tecnicos["tecnico_7"]["saldo"], -7)
+        self.assertEqual(tecnicos["tecnico_7"]["id"], 2 ** 40 + 7)
+        self.assertEqual(tecnicos.get("otro", "sin dato"), "sin dato")
+        with self.assertRaises(KeyError):
+            tecnicos["otro"]
+
+    def test_metadata_y_fuentes(self):
+        """Test de la metadata y la detección de fuentes modificadas"""
+        self.assertEqual(self.bundle.version, FORMAT_VERSION)
+        self.assertEqual(self.bundle.checksum, self.stats["checksum"])
+        self.assertEqual(set(self.bundle.metadata["sources"]), {"jugadores", "tecnicos"})
+        self.assertFalse(self.bundle.is_stale(self.sources))
+
+        path = self.sources["tecnicos"]
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertTrue(self.bundle.is_stale(self.sources))
+
+    def _reescribir_header(self, **cambios):
+        """Copia del bundle con campos del header cambiados"""
+        datos = bytearray(self.bundle_path.read_bytes())
+        magic, version, secciones, checksum, tag, payload = _HEADER.unpack_from(datos, 0)
+        _HEADER.pack_into(
+            datos, 0,
+            cambios.get("magic", magic), cambios.get("version", version),
+            secciones, checksum, tag, payload
+        )
+        path = self.dir / "modificado.bundle"
+        path.write_bytes(bytes(datos))
+        return path
+
+    def test_version_no_soportada(self):
+        """Test de que un bundle de otra versión del formato se rechaza"""
+        path = self._reescribir_header(version=FORMAT_VERSION + 1)
+        with self.assertRaisesRegex(BundleFormatError, "format v"):
+            DataBundle(path)
+
+    def test_archivo_corrupto(self):
+        """Test de que un archivo que no es un bundle se rechaza"""
+        with self.assertRaises(BundleFormatError):
+            DataBundle(self._reescribir_header(magic=b"X" * len(MAGIC)))
+
+        truncado = self.dir / "truncado.bundle"
+        truncado.write_bytes(self.bundle_path.read_bytes()[:10])
+        with self.assertRaises(BundleFormatError):
+            DataBundle(truncado)
+
+        vacio = self.dir / "vacio.bundle"
+        vacio.write_bytes(b"")
+        with self.assertRaises(BundleFormatError):
+            DataBundle(vacio)
+
+
+if __name__ == '__main__':
+    unittest.main()
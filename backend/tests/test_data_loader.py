@@ -0,0 +1,78 @@
+"""
+Tests de los filtros de jugadores del DataSnapshot
+"""
+
+import json
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from app.core.config import settings
+from app.services import data_loader
+from app.services.data_loader import DataSnapshot, data_loader_service
+
+
+class TestFiltrosJugadores(unittest.TestCase):
+    """Tests de get_jugadores_con_* sobre los registros compactos"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.datos = data_loader_service.snapshot
+        cls.datos.get_jugadores()
+        with open(settings.JUGADORES_FILE, 'r', encoding='utf-8') as f:
+            cls.crudos = json.load(f)['jugadores']
+
+    def _ids(self, jugadores):
+        return [j.id for j in jugadores]
+
+    def test_mismos_jugadores_que_el_json(self):
+        """Test de que los filtros dan los mismos jugadores que los registros crudos"""
+        def clubes(j, en_argentina):
+            return sum((c.get("pais") == "Argentina") == en_argentina for c in j.get("clubes_historia", []))
+
+        self.assertEqual(
+            self._ids(self.datos.get_jugadores_con_minimo_partidos(10)),
+            [i for i, j in enumerate(self.crudos) if j.get("partidos", 0) >= 10]
+        )
+        self.assertEqual(
+            self._ids(self.datos.get_jugadores_con_clubes_nacionales(2)),
+            [i for i, j in enumerate(self.crudos) if clubes(j, True) >= 2]
+        )
+        self.assertEqual(
+            self._ids(self.datos.get_jugadores_con_clubes_internacionales(1)),
+            [i for i, j in enumerate(self.crudos) if clubes(j, False) >= 1]
+        )
+
+    def test_no_vuelve_a_cargar_el_json(self):
+        """Test de que los filtros no recargan los registros crudos"""
+        self.datos.get_jugadores_con_minimo_partidos()
+        self.datos.get_jugadores_con_clubes_nacionales()
+        self.datos.get_jugadores_con_clubes_internacionales()
+        self.assertIsNone(self.datos._jugadores_data)
+
+
+class TestConstruccionConcurrente(unittest.TestCase):
+    """Tests de los índices perezosos pedidos desde varios threads"""
+
+    def test_un_solo_build_por_indice(self):
+        """Test de que threads que piden un índice a la vez lo construyen una sola vez"""
+        datos = DataSnapshot()
+        original = data_loader.build_jugadores_por_nombre
+        llamadas = []
+
+        def lento(jugadores):
+            llamadas.append(1)
+            time.sleep(0.05)
+            return original(jugadores)
+
+        with mock.patch.object(data_loader, 'build_jugadores_por_nombre', lento):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                indices = list(pool.map(lambda _: datos.get_jugadores_por_nombre(), range(8)))
+
+        self.assertEqual(len(llamadas), 1)
+        self.assertTrue(all(indice is indices[0] for indice in indices))
+
+
+if __name__ == '__main__':
+    unittest.main()
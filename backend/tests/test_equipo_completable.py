@@ -0,0 +1,144 @@
+"""
+Tests de la lista de clubes del Equipo del Día (siempre completable)
+"""
+
+import random
+import unittest
+from datetime import date, timedelta
+from itertools import permutations
+
+from app.schemas.game import PosicionVacia
+from app.services.data_loader import data_loader_service
+from app.services.game_generator import game_generator_service
+from app.services.indexes import JugadorElegible, emparejamiento_maximo
+
+
+def _emparejamiento_por_fuerza_bruta(adyacencia, n_derecha):
+    """Tamaño del emparejamiento máximo probando todas las asignaciones"""
+    mejor = 0
+    for orden in permutations(range(n_derecha), len(adyacencia)):
+        mejor = max(mejor, sum(1 for i, j in enumerate(orden) if j in adyacencia[i]))
+    return mejor
+
+
+class _RandomContado(random.Random):
+    """Random que cuenta los sorteos (shuffle) de la lista de clubes"""
+
+    sorteos = 0
+
+    def shuffle(self, x):
+        self.sorteos += 1
+        super().shuffle(x)
+
+
+class TestEmparejamientoMaximo(unittest.TestCase):
+    """Tests del emparejamiento bipartito (Hopcroft-Karp)"""
+
+    def _verificar(self, adyacencia, n_derecha):
+        pareja = emparejamiento_maximo(adyacencia, n_derecha)
+        self.assertEqual(len(pareja), len(adyacencia))
+        usados = [j for j in pareja if j != -1]
+        self.assertEqual(len(usados), len(set(usados)))
+        for i, j in enumerate(pareja):
+            if j != -1:
+                self.assertIn(j, adyacencia[i])
+        return len(usados)
+
+    def test_completo(self):
+        """Test de un caso que necesita un camino de aumento"""
+        # El primero toma 0 y hay que moverlo a 1 para que entre el segundo
+        adyacencia = [(0, 1), (0,), (1, 2)]
+        self.assertEqual(self._verificar(adyacencia, 3), 3)
+        self.assertEqual(emparejamiento_maximo(adyacencia, 3), [1, 0, 2])
+
+    def test_incompleto(self):
+        """Test de que los nodos sin pareja quedan en -1"""
+        adyacencia = [(0,), (0,), ()]
+        pareja = emparejamiento_maximo(adyacencia, 1)
+        self.assertEqual(self._verificar(adyacencia, 1), 1)
+        self.assertEqual(pareja.count(-1), 2)
+
+    def test_contra_fuerza_bruta(self):
+        """Test del tamaño contra la fuerza bruta en grafos aleatorios"""
+        rng = random.Random(7)
+        for _ in range(200):
+            n_izq, n_der = rng.randint(1, 6), rng.randint(1, 6)
+            adyacencia = [tuple(j for j in range(n_der) if rng.random() < 0.35) for _ in range(n_izq)]
+            if n_izq > n_der:
+                continue
+            self.assertEqual(self._verificar(adyacencia, n_der), _emparejamiento_por_fuerza_bruta(adyacencia, n_der))
+
+
+class TestListaClubes(unittest.TestCase):
+    """Tests de _generar_lista_clubes"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.datos = data_loader_service.snapshot
+
+    def _posiciones(self, codigos):
+        return [PosicionVacia(posicion=codigo, revelado=False, x=0, y=0) for codigo in codigos]
+
+    def test_lista_generada_completa_el_equipo(self):
+        """Test de que cada juego generado tiene una posición y un jugador distintos por club"""
+        fecha = date(2026, 3, 4)
+        for dias in range(5):
+            for game_type, categoria in game_generator_service.CATEGORIAS.items():
+                definicion = game_generator_service._crear_equipo_del_dia(
+                    game_type, categoria, fecha + timedelta(days=dias)
+                )
+                posiciones = definicion['posiciones']
+                asignacion = definicion['asignacion']
+                jugadores = definicion['jugadores_asignados']
+
+                self.assertEqual(len(definicion['clubes_list']), len(posiciones))
+                self.assertEqual(sorted(asignacion), list(range(len(posiciones))))
+                self.assertNotIn(-1, jugadores)
+                self.assertEqual(len(set(jugadores)), len(jugadores))
+
+                for club, i, jugador_id in zip(definicion['clubes_list'], asignacion, jugadores):
+                    codigo = posiciones[i]['posicion']
+                    ids = [j.id for j in self.datos.get_jugadores_rc_club(club).get(codigo, ())]
+                    self.assertIn(jugador_id, ids, f"{game_type}: {club} {codigo}")
+
+    def _pool_de_dos_arqueros(self):
+        """
+        Pool cuyos clubes tienen un solo arquero de Central cada uno, y entre
+        todos solo dos arqueros distintos
+        """
+        clubes_por_arquero = {}
+        for jugador in self.datos.get_jugadores():
+            for club in jugador.clubes:
+                arqueros = self.datos.get_jugadores_rc_club(club).get('PO', ())
+                if len(arqueros) == 1:
+                    clubes_por_arquero.setdefault(arqueros[0].id, set()).add(club)
+
+        arqueros = sorted(clubes_por_arquero, key=lambda i: (-len(clubes_por_arquero[i]), i))[:2]
+        return tuple(JugadorElegible(id=i, clubes_validos=tuple(sorted(clubes_por_arquero[i]))) for i in arqueros)
+
+    def test_sin_lista_posible_falla(self):
+        """Test de que agotar los sorteos levanta ValueError en vez de devolver un equipo incompleto"""
+        jugadores = self._pool_de_dos_arqueros()
+        posiciones = self._posiciones(['PO'] * 11)
+        # Todos los clubes tienen arquero, pero no hay 11 arqueros distintos
+        self.assertGreaterEqual(len({c for j in jugadores for c in j.clubes_validos}), len(posiciones))
+
+        rng = _RandomContado(0)
+        with self.assertRaises(ValueError) as contexto:
+            game_generator_service._generar_lista_clubes(self.datos, jugadores, posiciones, rng)
+        self.assertIn(str(game_generator_service.SORTEOS_LISTA_CLUBES), str(contexto.exception))
+        self.assertEqual(rng.sorteos, game_generator_service.SORTEOS_LISTA_CLUBES)
+
+    def test_pocos_clubes_falla(self):
+        """Test de que con menos clubes que posiciones no se sortea"""
+        jugadores = self._pool_de_dos_arqueros()[:1]
+        posiciones = self._posiciones(['PO'] * 11)
+        self.assertLess(len(jugadores[0].clubes_validos), len(posiciones))
+
+        rng = _RandomContado(0)
+        with self.assertRaisesRegex(ValueError, "suficientes clubes"):
+            game_generator_service._generar_lista_clubes(self.datos, jugadores, posiciones, rng)
+        self.assertEqual(rng.sorteos, 0)
+
+if __name__ == '__main__':
+    unittest.main()
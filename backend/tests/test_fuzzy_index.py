@@ -0,0 +1,125 @@
+"""
+Tests del índice de nombres aproximados (app/services/indexes.py)
+"""
+
+import unittest
+
+from app.services.data_loader import data_loader_service
+from app.services.indexes import (
+    LARGO_MINIMO_DOS_TYPOS,
+    LARGO_MINIMO_TYPO,
+    MAXIMO_TYPOS,
+    FuzzyIndex,
+    distancia_edicion,
+    typos_permitidos,
+)
+
+
+class TestTyposPermitidos(unittest.TestCase):
+    """Tests de los umbrales por largo de la respuesta"""
+
+    def test_umbrales(self):
+        """Test de los cortes de 4 y 9 letras"""
+        self.assertEqual(typos_permitidos(0), 0)
+        self.assertEqual(typos_permitidos(LARGO_MINIMO_TYPO - 1), 0)
+        self.assertEqual(typos_permitidos(LARGO_MINIMO_TYPO), 1)
+        self.assertEqual(typos_permitidos(LARGO_MINIMO_DOS_TYPOS - 1), 1)
+        self.assertEqual(typos_permitidos(LARGO_MINIMO_DOS_TYPOS), MAXIMO_TYPOS)
+        self.assertEqual(typos_permitidos(40), MAXIMO_TYPOS)
+
+
+class TestDistanciaEdicion(unittest.TestCase):
+    """Tests de la distancia de edición acotada"""
+
+    def test_ediciones_simples(self):
+        """Test de sustitución, inserción y borrado"""
+        self.assertEqual(distancia_edicion("ruben", "ruben", 2), 0)
+        self.assertEqual(distancia_edicion("ruben", "rubin", 2), 1)
+        self.assertEqual(distancia_edicion("ruben", "rubeen", 2), 1)
+        self.assertEqual(distancia_edicion("ruben", "rben", 2), 1)
+        self.assertEqual(distancia_edicion("", "abc", 3), 3)
+
+    def test_transposicion(self):
+        """Test de que dos letras invertidas cuentan como una edición"""
+        self.assertEqual(distancia_edicion("ruben", "rbuen", 2), 1)
+        self.assertEqual(distancia_edicion("fernandez", "fernadnez", 2), 1)
+        self.assertEqual(distancia_edicion("ab", "ba", 1), 1)
+
+    def test_cota(self):
+        """Test de que pasado el máximo devuelve maximo + 1"""
+        self.assertEqual(distancia_edicion("ruben", "ramos", 1), 2)
+        self.assertEqual(distancia_edicion("ruben", "rubenxxxx", 2), 3)
+        self.assertEqual(distancia_edicion("abcd", "dcba", 0), 1)
+
+    def test_simetrica(self):
+        """Test de que el orden de los argumentos no cambia la distancia"""
+        for a, b in [("loustau", "lostau"), ("fernandez", "hernandes"), ("broun", "bruon")]:
+            self.assertEqual(distancia_edicion(a, b, 2), distancia_edicion(b, a, 2))
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    """Tests de búsqueda y corrección sobre el índice"""
+
+    def setUp(self):
+        self.indice = FuzzyIndex([
+            'ruben', 'marco ruben', 'fernandez', 'hernandez', 'loustau', 'di maria', 'paz'
+        ])
+
+    def test_buscar_ordena_por_distancia(self):
+        """Test de que los nombres más cercanos van primero"""
+        self.assertEqual(self.indice.buscar('fernandes'), [(1, 'fernandez'), (2, 'hernandez')])
+        self.assertEqual(self.indice.buscar('hernandes'), [(1, 'hernandez'), (2, 'fernandez')])
+
+    def test_separadores_no_cuentan(self):
+        """Test de que espacios y puntuación no son ediciones"""
+        self.assertEqual(self.indice.corregir('dimaria'), 'di maria')
+        self.assertEqual(self.indice.corregir('marcoruben'), 'marco ruben')
+
+    def test_umbral_por_largo(self):
+        """Test de que una respuesta corta no tolera errores"""
+        self.assertEqual(self.indice.buscar('pas'), [])
+        self.assertEqual(self.indice.corregir('ruven'), 'ruben')
+        # 7 letras: un error sí, dos no
+        self.assertEqual(self.indice.corregir('lostau'), 'loustau')
+        self.assertIsNone(self.indice.corregir('lostao'))
+
+    def test_transposicion(self):
+        """Test de que una inversión de letras se corrige"""
+        self.assertEqual(self.indice.corregir('lousatu'), 'loustau')
+
+    def test_empate_no_corrige(self):
+        """Test de que dos nombres igual de cercanos no se corrigen"""
+        self.assertIsNone(self.indice.corregir('ternandez'))
+        self.assertEqual([d for d, _ in self.indice.buscar('ternandez')], [1, 1])
+
+    def test_exacto_gana(self):
+        """Test de que el nombre exacto queda a distancia 0"""
+        self.assertEqual(self.indice.corregir('hernandez'), 'hernandez')
+
+
+class TestNombreConocido(unittest.TestCase):
+    """Tests del resguardo de nombres exactos en la corrección"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.datos = data_loader_service.snapshot
+
+    def test_nombre_conocido(self):
+        """Test de nombres exactos de jugadores y técnicos"""
+        self.assertTrue(self.datos.es_nombre_conocido('ruben'))
+        self.assertTrue(self.datos.es_nombre_conocido('marco ruben'))
+        self.assertFalse(self.datos.es_nombre_conocido('rubne'))
+
+    def test_nombre_exacto_no_se_corrige(self):
+        """Test de que un nombre real de otro jugador no se corrige hacia el club"""
+        club_key = self.datos.resolve_club('Boca Juniors')
+        self.assertTrue(self.datos.es_nombre_conocido('hernandez'))
+        self.assertEqual(self.datos.corregir_respuesta('hernandez', club_key), (None, ()))
+
+        tecnico, jugadores = self.datos.corregir_respuesta('fernandes', club_key)
+        self.assertIsNone(tecnico)
+        self.assertTrue(jugadores)
+
+
+if __name__ == '__main__':
+    unittest.main()
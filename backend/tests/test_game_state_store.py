@@ -0,0 +1,117 @@
+"""
+Tests del store de progreso compartido entre procesos (SQLite)
+"""
+
+import multiprocessing
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.services.game_state_store import MemoryGameStateStore, SQLiteGameStateStore
+
+
+CLAVE = "clasico_20260304:sesion"
+PROCESOS = 4
+INCREMENTOS = 25
+
+
+def _incrementar(db_path: str) -> None:
+    """Worker: lee, suma uno y guarda, INCREMENTOS veces"""
+    store = SQLiteGameStateStore(Path(db_path), ttl_seconds=60, max_sessions=100)
+    for _ in range(INCREMENTOS):
+        with store.transaction(CLAVE):
+            estado = store.get(CLAVE)
+            store.set(CLAVE, {'contador': estado['contador'] + 1})
+    store.close()
+
+
+def _incrementar_con_replace(db_path: str) -> None:
+    """Worker: como _incrementar, pero con replace() y reintentando si otro guardó antes"""
+    store = SQLiteGameStateStore(Path(db_path), ttl_seconds=60, max_sessions=100)
+    for _ in range(INCREMENTOS):
+        while True:
+            estado = store.get(CLAVE)
+            if store.replace(CLAVE, estado, {'contador': estado['contador'] + 1}):
+                break
+    store.close()
+
+
+class TestSQLiteGameStateStore(unittest.TestCase):
+    """Tests de transaction() con varios procesos"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "game_state.db"
+        self.store = SQLiteGameStateStore(self.db_path, ttl_seconds=60, max_sessions=100)
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def _correr_procesos(self, worker):
+        self.store.set(CLAVE, {'contador': 0})
+
+        contexto = multiprocessing.get_context("fork")
+        procesos = [contexto.Process(target=worker, args=(str(self.db_path),)) for _ in range(PROCESOS)]
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join(60)
+            self.assertEqual(proceso.exitcode, 0)
+
+        self.assertEqual(self.store.get(CLAVE), {'contador': PROCESOS * INCREMENTOS})
+
+    def test_sin_actualizaciones_perdidas(self):
+        """Test de que procesos que actualizan la misma clave no se pisan"""
+        self._correr_procesos(_incrementar)
+
+    def test_replace_sin_actualizaciones_perdidas(self):
+        """Test de que replace() no deja guardar un estado calculado sobre uno viejo"""
+        self._correr_procesos(_incrementar_con_replace)
+
+    def test_replace_estado_cambiado(self):
+        """Test de que replace() no guarda si el estado cambió desde que se leyó"""
+        self.assertTrue(self.store.replace(CLAVE, None, {'contador': 1}))
+        self.assertFalse(self.store.replace(CLAVE, None, {'contador': 5}))
+        self.assertFalse(self.store.replace(CLAVE, {'contador': 0}, {'contador': 5}))
+        self.assertTrue(self.store.replace(CLAVE, {'contador': 1}, {'contador': 2}))
+        self.assertEqual(self.store.get(CLAVE), {'contador': 2})
+
+    def test_rollback_si_falla(self):
+        """Test de que un error dentro de la transacción no guarda nada"""
+        self.store.set(CLAVE, {'contador': 1})
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction(CLAVE):
+                self.store.set(CLAVE, {'contador': 2})
+                raise RuntimeError("falla")
+
+        self.assertEqual(self.store.get(CLAVE), {'contador': 1})
+
+    def test_transacciones_anidadas(self):
+        """Test de que una transacción dentro de otra usa la de afuera"""
+        with self.store.transaction(CLAVE):
+            with self.store.transaction(CLAVE):
+                self.store.set(CLAVE, {'contador': 3})
+        self.assertEqual(self.store.get(CLAVE), {'contador': 3})
+
+
+class TestMemoryGameStateStore(unittest.TestCase):
+    """Tests del store en memoria"""
+
+    def test_transaction_no_hace_nada(self):
+        """Test de que transaction() no cambia get/set en memoria"""
+        store = MemoryGameStateStore(ttl_seconds=60, max_sessions=10, max_bytes=1024)
+        with store.transaction(CLAVE):
+            store.set(CLAVE, {'contador': 1})
+        self.assertEqual(store.get(CLAVE), {'contador': 1})
+
+    def test_replace(self):
+        """Test de que replace() compara con el estado guardado"""
+        store = MemoryGameStateStore(ttl_seconds=60, max_sessions=10, max_bytes=1024)
+        self.assertTrue(store.replace(CLAVE, None, {'contador': 1}))
+        self.assertFalse(store.replace(CLAVE, {'contador': 0}, {'contador': 5}))
+        self.assertEqual(store.get(CLAVE), {'contador': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests de los tokens de progreso firmados (app/services/progress_token.py)
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app.services.progress_token import ProgressTokenCodec, create_progress_token_codec
+
+
+GAME_ID = "equipo_nacional_20260304"
+
+PROGRESO = {
+    'clubes_index': 3,
+    'revelados': [0, 2],
+    'jugadores': {'POR': 'Jorge Broun', 'DC': 'Marco Ruben'},
+    'pistas_usadas': 1,
+    'revelaciones_usadas': 0
+}
+
+
+class TestProgressToken(unittest.TestCase):
+    """Tests de encode/decode de los tokens de progreso"""
+
+    def setUp(self):
+        self.codec = ProgressTokenCodec("clave-de-prueba", ttl_seconds=60)
+
+    def test_ida_y_vuelta(self):
+        """Test de que el progreso firmado se recupera igual"""
+        token = self.codec.encode(GAME_ID, PROGRESO)
+        self.assertEqual(self.codec.decode(token, GAME_ID), PROGRESO)
+
+    def test_firma_adulterada(self):
+        """Test de que un token con la firma modificada se rechaza"""
+        token = self.codec.encode(GAME_ID, PROGRESO)
+        header, payload, firma = token.split('.')
+        otra_firma = ('A' if firma[0] != 'A' else 'B') + firma[1:]
+        self.assertIsNone(self.codec.decode(f"{header}.{payload}.{otra_firma}", GAME_ID))
+
+    def test_payload_adulterado(self):
+        """Test de que cambiar el progreso sin volver a firmar se rechaza"""
+        otro = ProgressTokenCodec("otra-clave").encode(GAME_ID, dict(PROGRESO, revelaciones_usadas=99))
+        token = self.codec.encode(GAME_ID, PROGRESO)
+        header, _, firma = token.split('.')
+        self.assertIsNone(self.codec.decode(f"{header}.{otro.split('.')[1]}.{firma}", GAME_ID))
+
+    def test_otra_clave(self):
+        """Test de que un token firmado con otra clave se rechaza"""
+        token = ProgressTokenCodec("otra-clave").encode(GAME_ID, PROGRESO)
+        self.assertIsNone(self.codec.decode(token, GAME_ID))
+
+    def test_token_vencido(self):
+        """Test de que un token vencido se rechaza"""
+        vencido = ProgressTokenCodec("clave-de-prueba", ttl_seconds=-10)
+        token = vencido.encode(GAME_ID, PROGRESO)
+        self.assertIsNone(self.codec.decode(token, GAME_ID))
+
+    def test_token_de_otro_juego(self):
+        """Test de que un token de otro game_id (otro día u otro juego) no se reutiliza"""
+        token = self.codec.encode("equipo_nacional_20260303", PROGRESO)
+        self.assertIsNone(self.codec.decode(token, GAME_ID))
+        self.assertIsNone(self.codec.decode(token, "equipo_argentina_20260303"))
+
+    def test_token_invalido(self):
+        """Test de que basura en el header no rompe el decode"""
+        self.assertIsNone(self.codec.decode("no-es-un-token", GAME_ID))
+        self.assertIsNone(self.codec.decode("", GAME_ID))
+
+
+class TestCreateProgressTokenCodec(unittest.TestCase):
+    """Tests de la configuración del codec"""
+
+    def _settings(self, **cambios):
+        valores = dict(
+            GAME_STATE_MODE="token",
+            GAME_TOKEN_SECRET="",
+            GAME_TOKEN_ALGORITHM="HS256",
+            GAME_STATE_TTL_SECONDS=60,
+            GAME_TOKEN_ALLOW_RANDOM_SECRET=False
+        )
+        valores.update(cambios)
+        return SimpleNamespace(**valores)
+
+    def test_modo_server_sin_codec(self):
+        """Test de que en modo server no hay codec"""
+        self.assertIsNone(create_progress_token_codec(self._settings(GAME_STATE_MODE="server")))
+
+    def test_secret_obligatorio(self):
+        """Test de que el modo token sin GAME_TOKEN_SECRET no arranca"""
+        with self.assertRaises(ValueError):
+            create_progress_token_codec(self._settings())
+
+    def test_clave_aleatoria_solo_con_flag(self):
+        """Test de la clave aleatoria de desarrollo"""
+        with mock.patch('builtins.print'):
+            codec = create_progress_token_codec(self._settings(GAME_TOKEN_ALLOW_RANDOM_SECRET=True))
+        token = codec.encode(GAME_ID, PROGRESO)
+        self.assertEqual(codec.decode(token, GAME_ID), PROGRESO)
+
+
+if __name__ == '__main__':
+    unittest.main()
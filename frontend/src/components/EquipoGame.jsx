@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
-import { gamesAPI, BACKEND_URL, CLOUDFRONT_URL, IS_PRODUCTION, getImageUrl } from '../services/api'
+import { gamesAPI, BACKEND_URL, CLOUDFRONT_URL, IS_PRODUCTION, getImageUrl, buscarRespuestaLocal } from '../services/api'
 import DifficultySelector from './DifficultySelector'
 
 const BASE_URL = IS_PRODUCTION ? CLOUDFRONT_URL : BACKEND_URL
@@ -101,7 +101,7 @@ function EquipoGame({ gameType, title }) {
       }
       
       console.log('Game data:', data.data)
-      setGameData(data.data)
+      setGameData({ ...data.data, verificacion: data.verificacion })
       setPosiciones(data.data.posiciones || [])
       setClubActual(data.data.club_actual)
       setLoading(false)
@@ -117,6 +117,19 @@ function EquipoGame({ gameType, title }) {
     if (!guess.trim() || gameOver) return
 
     try {
+      // Exact answers that can't fill an empty position are rejected locally;
+      // the rest (typos included) are checked by /verify
+      const refs = await buscarRespuestaLocal(gameData.verificacion, guess, clubActual?.nombre ?? null)
+      const puedeOcupar = (ref) => ref === 'DT' || (gameData.verificacion.posiciones[ref] || []).some(
+        pos => posiciones.some(p => p.posicion === pos && !p.revelado)
+      )
+      if (refs && !refs.some(puedeOcupar)) {
+        setMensaje('❌ Ningún jugador con ese apellido puede ocupar las posiciones vacías')
+        setGuess('')
+        setTimeout(() => setMensaje(''), 3000)
+        return
+      }
+
       const gameTypeMap = {
         'nacional': 'equipo_nacional',
         'europeo': 'equipo_europeo',
@@ -15,23 +15,81 @@ const api = axios.create({
   },
 });
 
+// Session id per browser tab: the backend keeps each player's progress separately
+const getSessionId = () => {
+  let sessionId = sessionStorage.getItem('futfactos_session_id');
+  if (!sessionId) {
+    sessionId = window.crypto?.randomUUID
+      ? window.crypto.randomUUID()
+      : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+    sessionStorage.setItem('futfactos_session_id', sessionId);
+  }
+  return sessionId;
+};
+
+// Signed progress per game type (backend with GAME_STATE_MODE=token).
+// game_id is "<game_type>_<YYYYMMDD>": the backend ignores tokens of another day.
+const PROGRESS_TOKENS_KEY = 'futfactos_progress_tokens';
+const GAME_ID_PATTERN = /(equipo_[a-z]+|clasico)_\d{8}/;
+
+const loadProgressTokens = () => JSON.parse(sessionStorage.getItem(PROGRESS_TOKENS_KEY) || '{}');
+
+const getGameType = (config) => {
+  const match = `${config.url} ${typeof config.data === 'string' ? config.data : JSON.stringify(config.data || {})}`
+    .match(GAME_ID_PATTERN);
+  if (match) return match[1];
+  return config.url.includes('clasico-del-dia') ? 'clasico' : null;
+};
+
+api.interceptors.request.use((config) => {
+  config.headers['X-Session-Id'] = getSessionId();
+  const gameType = getGameType(config);
+  const token = gameType && loadProgressTokens()[gameType];
+  if (token) {
+    config.headers['X-Progress-Token'] = token;
+  }
+  return config;
+});
+
+const saveProgressToken = (gameType, token) => {
+  const tokens = loadProgressTokens();
+  if (token) {
+    tokens[gameType] = token;
+  } else {
+    delete tokens[gameType];
+  }
+  sessionStorage.setItem(PROGRESS_TOKENS_KEY, JSON.stringify(tokens));
+};
+
+api.interceptors.response.use((response) => {
+  const token = response.data?.progress_token;
+  if (token) {
+    const gameType = getGameType(response.config);
+    if (gameType) saveProgressToken(gameType, token);
+  } else if (response.config.method === 'get' && response.config.url.startsWith('/games/equipo-')) {
+    // Loading an Equipo del Día starts it over
+    saveProgressToken(response.data.game_type, null);
+  }
+  return response;
+});
+
 // Games API
 export const gamesAPI = {
   // Get Equipo Nacional del Día
   getEquipoNacional: async () => {
-    const response = await api.get('/games/equipo-nacional');
+    const response = await api.get('/games/equipo-nacional', { params: { verificacion: true } });
     return response.data;
   },
 
   // Get Equipo Europeo del Día
   getEquipoEuropeo: async () => {
-    const response = await api.get('/games/equipo-europeo');
+    const response = await api.get('/games/equipo-europeo', { params: { verificacion: true } });
     return response.data;
   },
 
   // Get Equipo Latinoamericano del Día
   getEquipoLatinoamericano: async () => {
-    const response = await api.get('/games/equipo-latinoamericano');
+    const response = await api.get('/games/equipo-latinoamericano', { params: { verificacion: true } });
     return response.data;
   },
 
@@ -115,6 +173,30 @@ export const gamesAPI = {
   },
 };
 
+// Client-side answer verification (bundle returned with ?verificacion=true).
+// Same normalization as the backend's TextUtils.normalize_text.
+export const normalizeText = (text) =>
+  text.normalize('NFD').replace(/\p{Mn}/gu, '').toLowerCase().split(/\s+/).filter(Boolean).join(' ');
+
+const hashRespuesta = async (verificacion, texto) => {
+  const digest = await window.crypto.subtle.digest('SHA-256', new TextEncoder().encode(`${verificacion.sal}:${texto}`));
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0'))
+    .join('')
+    .slice(0, verificacion.longitud);
+};
+
+// Refs accepted for an exact answer, or null if it can't be decided locally: no
+// bundle, or no exact match (it may be a typo the server corrects, so send it to /verify).
+// Equipo games pass the current club; the Clásico has a single table.
+export const buscarRespuestaLocal = async (verificacion, respuesta, club = null) => {
+  if (!verificacion || !window.crypto?.subtle) return null;
+  const tabla = club === null
+    ? verificacion.respuestas
+    : verificacion.clubes?.[await hashRespuesta(verificacion, normalizeText(club))];
+  if (!tabla) return null;
+  return tabla[await hashRespuesta(verificacion, normalizeText(respuesta))] || null;
+};
+
 // Helper to get image URL
 export const getImageUrl = (path) => {
   if (!path) return null;
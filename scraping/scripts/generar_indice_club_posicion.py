@@ -7,20 +7,30 @@ Este índice permite búsquedas O(1) en lugar de O(n*m)
 Input: rosario_central_jugadores.json
 Output: club_posicion_index.json
 
-Estructura:
+Estructura (formato 2): cada jugador se guarda una sola vez en "jugadores"
+y los buckets club -> posición guardan solo su índice en esa tabla
 {
-  "Club Name": {
-    "Position": [
-      {
-        "nombre": "Full Name",
-        "apellido": "Surname",
-        "otros_clubes": ["Club1", "Club2"],
-        "posiciones": ["Pos1", "Pos2"],
-        "image_profile": "path/to/image.jpg"
-      }
-    ]
+  "formato": 2,
+  "jugadores": [
+    {
+      "nombre": "Full Name",
+      "apellido": "Surname",
+      "otros_clubes": ["Club1", "Club2"],
+      "posiciones": ["Pos1", "Pos2"],
+      "image_profile": "path/to/image.jpg"
+    }
+  ],
+  "clubes": {
+    "Club Name": {
+      "Position": [0, 17, 42]
+    }
   }
 }
+
+El formato 1 (el jugador completo copiado en cada bucket) ocupaba ~10x más.
+
+El backend no lee este índice: arma los jugadores por club y posición con
+los registros de rosario_central_jugadores.json (get_jugadores_rc_club).
 """
 
 import json
@@ -32,6 +42,9 @@ from collections import defaultdict
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Versión del formato del índice (ver docstring)
+FORMATO_INDICE = 2
+
 
 def normalizar_posicion(posicion: str) -> str:
     """
@@ -85,7 +98,8 @@ def generar_indice_club_posicion(
     jugadores = data.get('jugadores', [])
     print(f"   👥 Jugadores totales: {len(jugadores)}")
     
-    # Build index
+    # Build index: shared player table + club -> position -> player ids
+    tabla_jugadores: List[Dict[str, Any]] = []
     index = defaultdict(lambda: defaultdict(list))
     
     jugadores_procesados = 0
@@ -129,14 +143,15 @@ def generar_indice_club_posicion(
         otros_clubes = list(dict.fromkeys(otros_clubes))
         clubes_jugador = list(dict.fromkeys(clubes_jugador))
         
-        # Create player entry
-        jugador_entry = {
+        # Create player entry (stored once, referenced by id)
+        jugador_id = len(tabla_jugadores)
+        tabla_jugadores.append({
             'nombre': nombre,
             'apellido': apellido,
             'otros_clubes': otros_clubes,
             'posiciones': posiciones,
             'image_profile': image_profile
-        }
+        })
         
         # Add to index for each club and position
         for club_nombre in clubes_jugador:
@@ -145,29 +160,33 @@ def generar_indice_club_posicion(
                 pos_normalizada = normalizar_posicion(posicion)
                 
                 # Add to index
-                index[club_nombre][pos_normalizada].append(jugador_entry)
+                index[club_nombre][pos_normalizada].append(jugador_id)
                 entradas_totales += 1
     
     # Convert defaultdict to regular dict for JSON serialization
     index_json = {
-        club: {
-            pos: jugadores_list
-            for pos, jugadores_list in posiciones.items()
+        'formato': FORMATO_INDICE,
+        'jugadores': tabla_jugadores,
+        'clubes': {
+            club: {
+                pos: ids
+                for pos, ids in posiciones.items()
+            }
+            for club, posiciones in index.items()
         }
-        for club, posiciones in index.items()
     }
     
-    # Save to file
+    # Save to file (compact: with indent every id would take a line)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(index_json, f, ensure_ascii=False, indent=2)
+        json.dump(index_json, f, ensure_ascii=False, separators=(',', ':'))
     
     # Statistics
     stats = {
         'jugadores_procesados': jugadores_procesados,
         'jugadores_con_rc': jugadores_con_rc,
-        'clubes_en_indice': len(index_json),
+        'clubes_en_indice': len(index_json['clubes']),
         'entradas_totales': entradas_totales,
         'output_file': str(output_file)
     }
@@ -175,7 +194,7 @@ def generar_indice_club_posicion(
     print(f"\n✅ Índice generado exitosamente!")
     print(f"   👥 Jugadores procesados: {jugadores_procesados}")
     print(f"   ⚽ Jugadores con RC: {jugadores_con_rc}")
-    print(f"   🏟️  Clubes en índice: {len(index_json)}")
+    print(f"   🏟️  Clubes en índice: {len(index_json['clubes'])}")
     print(f"   📊 Entradas totales: {entradas_totales}")
     print(f"   💾 Tamaño archivo: {output_file.stat().st_size / 1024:.2f} KB")
     
@@ -5,7 +5,7 @@ Servicio para manejo de imágenes
 import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from ..config import Settings
 from ..utils import HTTPClient, TextUtils
 
@@ -15,6 +15,9 @@ class ImageService:
     Servicio para descarga y gestión de imágenes de jugadores
     """
     
+    # Si hay varias imágenes con el mismo nombre, gana la primera extensión
+    EXTENSIONES = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+    
     def __init__(self, settings: Optional[Settings] = None, http_client: Optional[HTTPClient] = None):
         """
         Inicializa el servicio de imágenes
@@ -25,6 +28,8 @@ class ImageService:
         """
         self.settings = settings or Settings()
         self.http_client = http_client or HTTPClient(self.settings)
+        # Índice nombre_archivo -> archivo, se lista el directorio una sola vez
+        self._imagenes: Optional[Dict[str, str]] = None
     
     def descargar_imagen(self, url_imagen: str, nombre_jugador: str) -> Optional[str]:
         """
@@ -63,6 +68,7 @@ class ImageService:
             with open(ruta_completa, 'wb') as f:
                 f.write(response.content)
             
+            self._get_imagenes()[nombre_archivo] = f"{nombre_archivo}{extension}"
             return ruta_relativa
         
         except Exception as e:
@@ -97,13 +103,36 @@ class ImageService:
             Ruta relativa de la imagen o None si no existe
         """
         nombre_archivo = TextUtils.limpiar_nombre_archivo(nombre_jugador)
-        # Buscar con cualquier extensión
-        for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-            ruta_completa = self.settings.JUGADORES_IMAGES_DIR / f"{nombre_archivo}{ext}"
-            if ruta_completa.exists():
-                return f"data/images/jugadores/{nombre_archivo}{ext}"
+        archivo = self._get_imagenes().get(nombre_archivo)
+        if archivo:
+            return f"data/images/jugadores/{archivo}"
         return None
     
+    def _get_imagenes(self) -> Dict[str, str]:
+        """
+        Lista las imágenes de jugadores ya descargadas (una sola vez por instancia)
+        
+        Returns:
+            Dict[nombre_archivo] -> archivo con extensión
+        """
+        if self._imagenes is None:
+            prioridad = {ext: i for i, ext in enumerate(self.EXTENSIONES)}
+            imagenes: Dict[str, str] = {}
+            directorio = self.settings.JUGADORES_IMAGES_DIR
+            
+            if directorio.exists():
+                for entrada in os.scandir(directorio):
+                    nombre, ext = os.path.splitext(entrada.name)
+                    if ext not in prioridad or not entrada.is_file():
+                        continue
+                    actual = imagenes.get(nombre)
+                    if actual is None or prioridad[ext] < prioridad[os.path.splitext(actual)[1]]:
+                        imagenes[nombre] = entrada.name
+            
+            self._imagenes = imagenes
+        
+        return self._imagenes
+    
     def imagen_existe(self, nombre_jugador: str) -> bool:
         """
         Verifica si ya existe una imagen para el jugador